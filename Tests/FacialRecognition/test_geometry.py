@@ -0,0 +1,93 @@
+import math
+import timeit
+
+import numpy as np
+import pytest
+from mediapipe.framework.formats import landmark_pb2
+
+from FacialRecognition.geometry import LandmarkGeometry, _landmark_records
+
+SHAPE = (480, 640, 3)
+
+
+def _landmarks(visibility=False, seed=0):
+    rng = np.random.default_rng(seed)
+    landmarks = landmark_pb2.NormalizedLandmarkList()
+    for x, y, z in rng.random((478, 3)):
+        lm = landmarks.landmark.add(x=x, y=y, z=z)
+        if visibility:
+            lm.visibility = 0.9
+    return landmarks
+
+
+def _fromiter_points(landmarks, shape=SHAPE):
+    h, w = shape[:2]
+    lms = landmarks.landmark
+    flat = np.fromiter(
+        (c for l in lms for c in (l.x, l.y)), dtype=np.float32, count=2 * len(lms)
+    )
+    return flat.reshape(-1, 2) * np.array([w, h], dtype=np.float32)
+
+
+def _baseline(landmarks, shape=SHAPE):
+    """The per-landmark math FrameAnalyzer used before the batched geometry."""
+    h, w = shape[:2]
+    c = [(l.x * w, l.y * h) for l in landmarks.landmark]
+
+    def dist(a, b):
+        return np.linalg.norm(np.array(c[a]) - np.array(c[b]))
+
+    left_ear = dist(159, 145) / (dist(33, 133) + 1e-6)
+    right_ear = dist(386, 374) / (dist(362, 263) + 1e-6)
+    return {
+        "ear": (left_ear + right_ear) / 2,
+        "left_ear": left_ear,
+        "right_ear": right_ear,
+        "mouth_openness": dist(13, 14),
+        "smile_ratio": dist(61, 291) / dist(13, 14),
+        "head_tilt_angle": math.degrees(
+            math.atan2(c[263][1] - c[33][1], c[263][0] - c[33][0])
+        ),
+        "left_gaze_ratio": dist(468, 33) / (dist(33, 133) + 1e-6),
+        "right_gaze_ratio": dist(473, 362) / (dist(362, 263) + 1e-6),
+    }
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_measure_matches_per_landmark_math(seed):
+    landmarks = _landmarks(seed=seed)
+    measured = LandmarkGeometry.measure(LandmarkGeometry().update(landmarks, SHAPE))
+
+    for name, expected in _baseline(landmarks).items():
+        assert getattr(measured, name) == pytest.approx(
+            expected, rel=1e-4, abs=1e-4
+        ), name
+
+
+def test_serialized_fast_path_matches_fromiter():
+    landmarks = _landmarks()
+    assert _landmark_records(landmarks, 478) is not None
+
+    np.testing.assert_array_equal(
+        LandmarkGeometry().update(landmarks, SHAPE), _fromiter_points(landmarks)
+    )
+
+
+def test_landmarks_with_extra_fields_fall_back_to_fromiter():
+    landmarks = _landmarks(visibility=True)
+    assert _landmark_records(landmarks, 478) is None
+
+    np.testing.assert_array_equal(
+        LandmarkGeometry().update(landmarks, SHAPE), _fromiter_points(landmarks)
+    )
+
+
+def test_fast_path_is_worth_its_complexity():
+    # ~60 us vs ~330 us per 478-landmark frame when measured; demand a 2x margin
+    landmarks = _landmarks()
+    geometry = LandmarkGeometry()
+    fast = min(
+        timeit.repeat(lambda: geometry.update(landmarks, SHAPE), number=200, repeat=5)
+    )
+    slow = min(timeit.repeat(lambda: _fromiter_points(landmarks), number=200, repeat=5))
+    assert fast * 2 < slow
@@ -0,0 +1,36 @@
+import numpy as np
+
+from FacialRecognition.geometry import NUM_FACE_LANDMARKS
+from FacialRecognition.inference import FrameAnalyzer
+
+
+def _points(seed):
+    return (
+        np.random.default_rng(seed).random((NUM_FACE_LANDMARKS, 2)).astype(np.float32)
+        * 400
+    )
+
+
+def test_results_are_built_once_per_analysed_frame():
+    analyzer = FrameAnalyzer()
+    analyzer.analyze_points(_points(0))
+    first = analyzer.results
+
+    assert analyzer.results is first
+    assert first["Total Frames"] == 1
+
+    analyzer.analyze_points(_points(1))
+    assert analyzer.results is not first
+    assert analyzer.results["Total Frames"] == 2
+
+
+def test_eye_gaze_is_the_mode_of_the_window():
+    analyzer = FrameAnalyzer(window=5)
+    for seed in range(12):
+        analyzer.analyze_points(_points(seed))
+
+    gazes = analyzer.history_data["gaze_history"]
+    assert len(gazes) == 5
+    assert analyzer.results["Eye Gaze"] == max(
+        gazes, key=lambda g: (gazes.count(g), -gazes.index(g))
+    )
@@ -0,0 +1,45 @@
+import cv2 as cv
+import numpy as np
+import pytest
+
+from FacialRecognition.input import FrameSource, get_video_capture
+
+FPS = 10
+
+
+@pytest.fixture
+def video(tmp_path):
+    """12 frames whose blue channel encodes the frame index."""
+    path = str(tmp_path / "clip.avi")
+    writer = cv.VideoWriter(path, cv.VideoWriter_fourcc(*"MJPG"), FPS, (64, 48))
+    for i in range(12):
+        writer.write(np.full((48, 64, 3), (i * 20, 0, 0), dtype=np.uint8))
+    writer.release()
+    return path
+
+
+def test_unopenable_source_is_named_in_the_error(tmp_path):
+    missing = str(tmp_path / "missing.mp4")
+    with pytest.raises(RuntimeError, match="missing.mp4"):
+        get_video_capture(missing)
+
+
+def test_files_get_media_time_and_read_only_rgb(video):
+    source = FrameSource(video)
+    frames = list(source)
+
+    assert source.is_file and source.fps == FPS
+    assert [f.index for f in frames] == list(range(12))
+    assert [f.timestamp for f in frames] == pytest.approx([i / FPS for i in range(12)])
+    frame = frames[3]
+    assert not frame.rgb.flags.writeable
+    np.testing.assert_array_equal(frame.rgb, frame.bgr[..., ::-1])
+
+
+def test_seek_restarts_indices_and_timestamps(video):
+    source = FrameSource(video)
+    source.seek(7)
+    frame = source.read()
+
+    assert (frame.index, frame.timestamp) == (7, pytest.approx(0.7))
+    assert abs(int(frame.bgr[..., 0].mean()) - 140) < 10
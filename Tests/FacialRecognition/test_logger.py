@@ -0,0 +1,83 @@
+import os
+import threading
+
+import numpy as np
+
+from FacialRecognition.Logger import HEADERS, CSVLogger, NpzLogger
+
+
+def _metrics(i):
+    return {
+        "Time": float(i),
+        "Blink Count": i,
+        "Head Tilt Count": 0,
+        "Eye Gaze": "Center",
+        "Smiling": i % 2 == 0,
+        "Confidence": 0.5,
+        "Engagement": 0.6,
+        "Nervousness": 0.1,
+        "Authenticity": 0.9,
+    }
+
+
+def test_npz_flush_reaches_disk_and_close_merges(tmp_path):
+    path = str(tmp_path / "log.npz")
+    logger = NpzLogger(path, interval=0, flush_seconds=3600)
+    for i in range(5):
+        logger.log_results(_metrics(i))
+    logger.flush()
+    assert os.listdir(logger.parts_dir) == ["part-000000.npz"]
+    for i in range(5, 8):
+        logger.log_results(_metrics(i))
+
+    logger.close()
+    with np.load(path) as log:
+        assert sorted(log.files) == sorted(HEADERS)
+        assert log["Blink Count"].tolist() == list(range(8))
+        assert log["Gaze"].tolist() == ["Center"] * 8
+    assert not os.path.exists(logger.parts_dir)
+
+
+def test_npz_appends_to_earlier_sessions(tmp_path):
+    path = str(tmp_path / "log.npz")
+    for session in range(3):
+        logger = NpzLogger(path, interval=0, flush_seconds=3600)
+        for i in range(2):
+            logger.log_results(_metrics(session * 2 + i))
+        logger.close()
+
+    with np.load(path) as log:
+        assert log["Blink Count"].tolist() == list(range(6))
+
+
+def test_npz_merges_parts_left_by_an_interrupted_run(tmp_path):
+    path = str(tmp_path / "log.npz")
+    crashed = NpzLogger(path, interval=0, flush_seconds=3600)
+    crashed.log_results(_metrics(0))
+    crashed.flush()  # never closed
+
+    logger = NpzLogger(path, interval=0, flush_seconds=3600)
+    logger.log_results(_metrics(1))
+    logger.close()
+    with np.load(path) as log:
+        assert log["Blink Count"].tolist() == [0, 1]
+
+
+def test_concurrent_csv_flushes_do_not_interleave(tmp_path):
+    path = tmp_path / "log.csv"
+    logger = CSVLogger(str(path), interval=0, flush_rows=10**6, flush_seconds=0.001)
+    threads = [
+        threading.Thread(target=lambda: [logger.flush() for _ in range(200)])
+        for _ in range(4)
+    ]
+    for t in threads:
+        t.start()
+    for i in range(2000):
+        logger.log_results(_metrics(i))
+    for t in threads:
+        t.join()
+    logger.close()
+
+    lines = path.read_text().splitlines()
+    assert lines[0] == ",".join(HEADERS)
+    assert [int(line.split(",")[1]) for line in lines[1:]] == list(range(2000))
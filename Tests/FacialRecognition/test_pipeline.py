@@ -0,0 +1,89 @@
+import threading
+import time
+
+import pytest
+
+from FacialRecognition.pipeline import BLOCK, DROP, StagedPipeline
+
+
+class ListSource:
+    """Frame source over a list, like FrameSource on a video file."""
+
+    is_file = True
+
+    def __init__(self, frames, delay=0.0):
+        self.frames = list(frames)
+        self.delay = delay
+
+    def is_opened(self):
+        return True
+
+    def read(self):
+        time.sleep(self.delay)
+        return self.frames.pop(0) if self.frames else None
+
+
+def test_run_returns_only_after_a_slow_inference_stage_exits():
+    workers = []
+
+    def infer(frame):
+        workers.append(threading.current_thread())
+        time.sleep(1.5)  # longer than the old 1 s join timeout
+        return frame
+
+    pipeline = StagedPipeline(ListSource(range(5)), infer, policy=BLOCK)
+    pipeline.run(lambda item: False)  # the renderer quits on the first frame
+
+    assert workers and not workers[0].is_alive()
+
+
+def _run(pipeline):
+    rendered = []
+    pipeline.run(lambda item: rendered.append(item.result))
+    return rendered
+
+
+def test_block_policy_renders_every_frame_in_order():
+    def infer(frame):
+        time.sleep(0.002)
+        return frame * 10
+
+    pipeline = StagedPipeline(ListSource(range(50)), infer, policy=BLOCK, queue_size=2)
+
+    assert _run(pipeline) == [i * 10 for i in range(50)]
+    assert pipeline.dropped == 0
+    assert pipeline.latency_stats()["dropped"] == 0 and len(pipeline.latencies) == 50
+
+
+def test_drop_policy_skips_stale_frames_but_accounts_for_them():
+    def infer(frame):
+        time.sleep(0.01)  # slower than the source
+        return frame
+
+    pipeline = StagedPipeline(ListSource(range(100), delay=0.001), infer, policy=DROP)
+    rendered = _run(pipeline)
+
+    assert pipeline.dropped > 0
+    assert len(rendered) + pipeline.dropped == 100
+    assert rendered == sorted(set(rendered))  # never out of order or repeated
+
+
+def test_live_source_stops_when_the_renderer_quits():
+    class Webcam(ListSource):
+        is_file = False
+
+        def read(self):
+            time.sleep(0.001)
+            return 0
+
+    rendered = []
+    pipeline = StagedPipeline(Webcam([]), lambda frame: frame)
+    pipeline.run(lambda item: rendered.append(item) or len(rendered) < 10)
+
+    assert len(rendered) == 10
+    assert not pipeline._threads
+
+
+def test_unknown_policy_is_rejected():
+    with pytest.raises(ValueError, match="latest"):
+        StagedPipeline(ListSource([]), lambda frame: frame, policy="latest")
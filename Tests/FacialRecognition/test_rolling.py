@@ -0,0 +1,57 @@
+from collections import Counter, deque
+
+import numpy as np
+import pytest
+
+from FacialRecognition.rolling import DownsampledHistory, RollingMode, RollingWindow
+
+
+def test_rolling_window_matches_a_deque_over_many_wraps():
+    rng = np.random.default_rng(0)
+    window, reference = RollingWindow(size=7), deque(maxlen=7)
+    assert window.mean() == window.abs_mean() == 0.0 and window.last is None
+
+    for value in rng.normal(size=100):
+        window.push(value)
+        reference.append(value)
+        assert len(window) == len(reference)
+        assert window.last == reference[-1]
+        np.testing.assert_allclose(window.values(), list(reference))
+        assert window.mean() == pytest.approx(np.mean(reference))
+        assert window.abs_mean() == pytest.approx(np.mean(np.abs(reference)))
+
+
+def test_rolling_window_clear_forgets_everything():
+    window = RollingWindow(size=3)
+    for value in (1, 2, 3, 4):
+        window.push(value)
+    window.clear()
+    assert len(window) == 0 and window.count == 0 and window.mean() == 0.0
+
+
+def test_downsampled_history_keeps_one_mean_per_block():
+    history = DownsampledHistory(every=3)
+    for value in range(200):
+        history.push(value)
+    expected = np.arange(198).reshape(-1, 3).mean(axis=1)
+    np.testing.assert_allclose(history.values(), expected)
+
+    bounded = DownsampledHistory(every=3, capacity=4)
+    for value in range(200):
+        bounded.push(value)
+    np.testing.assert_allclose(bounded.values(), expected[-4:])
+    assert len(bounded) == 4
+
+
+@pytest.mark.parametrize("size", [1, 5, 30])
+def test_rolling_mode_matches_counter_most_common(size):
+    rng = np.random.default_rng(size)
+    mode, reference = RollingMode(size=size), deque(maxlen=size)
+    assert mode.mode(default="none") == "none"
+
+    # Few labels so ties, and ties broken by first occurrence, come up often
+    for label in rng.choice(["Left", "Center", "Right"], size=300):
+        mode.push(label)
+        reference.append(label)
+        assert mode.mode() == Counter(reference).most_common(1)[0][0]
+        assert list(mode) == list(reference) and mode.last == label
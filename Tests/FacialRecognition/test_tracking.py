@@ -0,0 +1,27 @@
+from pathlib import Path
+
+import cv2 as cv
+
+from FacialRecognition.input import Frame
+from FacialRecognition.tracking import FaceTracker
+
+IMAGE = Path(__file__).resolve().parents[2] / "Assets" / "testImage.png"
+
+
+def _frames(n):
+    bgr = cv.imread(str(IMAGE))
+    rgb = cv.cvtColor(bgr, cv.COLOR_BGR2RGB)
+    return [Frame(i, i / 30, bgr, rgb) for i in range(n)]
+
+
+def test_redetect_interval_counts_interpolated_frames():
+    for stride in (1, 3):
+        tracker = FaceTracker(redetect_interval=30, stride=stride)
+        released = []
+        for frame in _frames(90):
+            released.extend(tracker.process(frame))
+        released.extend(tracker.flush())
+
+        assert [t.frame.index for t in released] == list(range(90))
+        assert tracker.mesh_runs == 90 // stride
+        assert tracker.detector_runs == 3  # frames 0, 30 and 60
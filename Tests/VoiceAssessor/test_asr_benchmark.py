@@ -0,0 +1,51 @@
+import math
+
+import numpy as np
+import pytest
+
+import asr_benchmark
+from asr_benchmark import benchmark_backend, word_edits, word_error_rate
+
+SR = 16000
+
+
+class EchoASR:
+    """Backend stand-in that 'hears' a fixed transcript."""
+
+    model_id = "echo"
+
+    def __init__(self, text):
+        self.text = text
+
+    def transcribe(self, audio, initial_prompt=None):
+        return {"text": self.text, "segments": []}
+
+
+@pytest.fixture
+def backend(monkeypatch):
+    monkeypatch.setattr(asr_benchmark, "get_backend", lambda name, model_name, **options: EchoASR("Hello, world"))
+
+
+def test_word_edits_ignore_case_and_punctuation():
+    assert word_edits("Hello, World!", "hello world") == (0, 2)
+    assert word_edits("the cat sat", "the bat sat down") == (2, 3)
+    assert word_error_rate("", "") == 0.0
+    assert word_error_rate("", "noise") == 1.0
+
+
+def test_benchmark_reports_rtf_and_corpus_wer(backend):
+    clips = [("a.wav", np.zeros(SR * 2, np.float32), "hello world"), ("b.wav", np.zeros(SR, np.float32), "hello there")]
+    result = benchmark_backend("echo", "base", clips)
+
+    assert result["model_id"] == "echo"
+    assert [c["wer"] for c in result["clips"]] == [0.0, 0.5]
+    assert result["wer"] == 0.25
+    assert result["rtf"] >= 0 and not math.isnan(result["rtf"])
+
+
+def test_empty_clips_give_nan_rtf_instead_of_raising(backend):
+    result = benchmark_backend("echo", "base", [("empty.wav", np.zeros(0, np.float32), "hello world")])
+
+    assert math.isnan(result["clips"][0]["rtf"])
+    assert math.isnan(result["rtf"])
+    assert result["wer"] == 0.0
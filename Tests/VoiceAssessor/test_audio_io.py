@@ -0,0 +1,42 @@
+import numpy as np
+import pytest
+import soundfile as sf
+
+from audio_io import SAMPLE_RATE, as_waveform, duration_sec, load_audio, to_mono_16k
+
+
+def _tone(sr, seconds=1.0, channels=None):
+    t = np.arange(int(sr * seconds)) / sr
+    tone = (0.5 * np.sin(2 * np.pi * 220 * t)).astype(np.float32)
+    return tone if channels is None else np.stack([tone] * channels, axis=1)
+
+
+def test_stereo_44k_file_becomes_mono_16k_float32(tmp_path):
+    path = tmp_path / "stereo.wav"
+    sf.write(path, _tone(44100, channels=2), 44100, subtype="FLOAT")
+
+    audio = load_audio(path)
+
+    assert audio.dtype == np.float32 and audio.ndim == 1 and audio.flags.c_contiguous
+    assert duration_sec(audio) == pytest.approx(1.0, abs=1e-3)
+    np.testing.assert_allclose(audio[1000:-1000], _tone(SAMPLE_RATE)[1000:-1000], atol=1e-2)
+
+
+def test_16k_mono_passes_through_unchanged(tmp_path):
+    path = tmp_path / "mono.wav"
+    tone = _tone(SAMPLE_RATE)
+    sf.write(path, tone, SAMPLE_RATE, subtype="FLOAT")
+
+    np.testing.assert_array_equal(load_audio(path), tone)
+    np.testing.assert_array_equal(as_waveform(str(path)), tone)
+
+
+def test_in_memory_arrays_are_resampled_like_files():
+    stereo = _tone(8000, channels=2)
+    np.testing.assert_array_equal(as_waveform(stereo, sr=8000), to_mono_16k(stereo, 8000))
+    assert len(as_waveform(stereo, sr=8000)) == SAMPLE_RATE
+
+
+def test_missing_file_raises(tmp_path):
+    with pytest.raises(FileNotFoundError):
+        load_audio(tmp_path / "missing.wav")
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+import torch
+
+import voice_assessor
+from voice_assessor import analyse_emotion, analyse_emotion_windowed, emotion_windows
+
+SR = 16000
+LABELS = np.array(["neu", "hap"])
+
+
+class FakeClassifier:
+    """SpeechBrain stand-in: 'happy' logit is the window's mean amplitude."""
+
+    class hparams:
+        class label_encoder:
+            @staticmethod
+            def decode_ndim(indices):
+                return LABELS[indices.numpy()]
+
+    def __init__(self):
+        self.batches = []
+
+    def classify_batch(self, wavs):
+        self.batches.append(tuple(wavs.shape))
+        happy = wavs.mean(dim=1) * 10
+        return (torch.stack([torch.zeros_like(happy), happy], dim=1),)
+
+
+@pytest.fixture
+def classifier(monkeypatch):
+    fake = FakeClassifier()
+    monkeypatch.setattr(voice_assessor, "get_emotion_classifier", lambda device: fake)
+    return fake
+
+
+def test_windows_overlap_and_the_last_one_is_end_aligned():
+    audio = np.zeros(23 * SR, np.float32)
+    assert emotion_windows(audio, 10, 5, SR).tolist() == [0, 5 * SR, 10 * SR, 13 * SR]
+    assert emotion_windows(audio[: 20 * SR], 10, 5, SR).tolist() == [0, 5 * SR, 10 * SR]
+    assert emotion_windows(audio[: 4 * SR], 10, 5, SR).tolist() == [0]
+
+
+def test_timeline_follows_the_audio_and_profile_is_the_window_mean(classifier):
+    audio = np.zeros(23 * SR, np.float32)
+    audio[15 * SR :] = 1.0  # the second half is 'happy'
+
+    result = analyse_emotion_windowed(audio, window_sec=10, hop_sec=5, batch_size=3)
+
+    timeline = result["timeline"]
+    assert [(w["start"], w["end"]) for w in timeline] == [(0, 10), (5, 15), (10, 20), (13, 23)]
+    assert [w["label"] for w in timeline] == ["neu", "neu", "hap", "hap"]
+    assert classifier.batches == [(3, 10 * SR), (1, 10 * SR)]  # bounded by window, not recording
+    for label in LABELS:
+        assert result["profile"][label] == pytest.approx(np.mean([w["probs"][label] for w in timeline]))
+
+
+def test_short_clips_are_classified_whole(classifier):
+    audio = np.full(3 * SR, 0.5, np.float32)
+    profile = analyse_emotion(audio)
+
+    assert classifier.batches == [(1, 3 * SR)]
+    assert profile["hap"] > profile["neu"]
+    assert sum(profile.values()) == pytest.approx(1.0)
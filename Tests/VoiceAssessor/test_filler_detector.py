@@ -0,0 +1,40 @@
+import random
+
+import pytest
+
+from filler_detector import FillerDetector, FillerStream, tokenize
+
+DETECTOR = FillerDetector({"um", "uh", "hmm", "so", "like", "you know", "i mean"})
+
+
+def _words(text):
+    return [{"word": " " + w, "start": float(i), "end": i + 0.5} for i, w in enumerate(text.split())]
+
+
+def test_tokens_keep_contractions_and_spelling():
+    assert tokenize("I'm sure it’s TOO good, umm") == ["i'm", "sure", "it's", "too", "good", "umm"]
+
+
+def test_ratio_is_per_whisper_word():
+    words = _words("I'm, um, you know, I don't know")
+    stats = DETECTOR.analyse_words(words)
+    assert stats["filler_counts"] == {"um": 1, "you know": 1}
+    assert stats["filler_ratio"] == pytest.approx(2 / len(words))
+    assert [o["start"] for o in stats["filler_occurrences"]] == [1.0, 2.0]
+
+
+def test_repeated_letters_collapse_only_for_matching():
+    stats = DETECTOR.analyse_text("Umm sooo, hmmmm, I mean, it was too good")
+    assert stats["filler_counts"] == {"um": 1, "so": 1, "hmm": 1, "i mean": 1}
+    assert DETECTOR.analyse_text("too good")["filler_count"] == 0
+
+
+def test_stream_matches_batch():
+    rng = random.Random(7)
+    vocab = ["um", "uh", "you", "know", "i", "mean", "so", "like", "it's", "fine"]
+    for _ in range(200):
+        words = _words(" ".join(rng.choice(vocab) for _ in range(rng.randint(0, 30))))
+        stream = FillerStream(DETECTOR)
+        for i in range(0, len(words), 3):
+            stream.feed(words[i : i + 3])
+        assert stream.summary() == DETECTOR.analyse_words(words)
@@ -0,0 +1,67 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import torch
+
+from model_registry import FALLBACK_MODEL_BYTES, ModelRegistry, estimate_model_bytes
+
+
+def _size(model):
+    return model["size"]
+
+
+def test_models_load_once_and_least_recently_used_are_evicted():
+    registry = ModelRegistry(max_bytes=100)
+    loads = []
+
+    def loader(name, size):
+        def load():
+            loads.append(name)
+            return {"name": name, "size": size}
+
+        return load
+
+    a = registry.get("a", loader("a", 40), _size)
+    assert registry.get("a", loader("a", 40), _size) is a
+    registry.get("b", loader("b", 40), _size)
+    registry.get("a", loader("a", 40), _size)  # "b" becomes least recently used
+    registry.get("c", loader("c", 40), _size)
+
+    assert loads == ["a", "b", "c"]
+    assert "a" in registry and "c" in registry and "b" not in registry
+    assert registry.total_bytes == 80
+
+
+def test_a_model_larger_than_the_budget_is_still_kept():
+    registry = ModelRegistry(max_bytes=10)
+    registry.get("small", lambda: {"size": 5}, _size)
+    registry.get("huge", lambda: {"size": 50}, _size)
+    assert "huge" in registry and "small" not in registry
+
+
+def test_concurrent_callers_share_one_load():
+    registry = ModelRegistry()
+    calls = []
+    lock = threading.Lock()
+
+    def load():
+        with lock:
+            calls.append(1)
+        time.sleep(0.05)
+        return object()
+
+    with ThreadPoolExecutor(8) as pool:
+        models = list(pool.map(lambda _: registry.get("whisper", load, lambda m: 1), range(8)))
+
+    assert len(calls) == 1
+    assert all(m is models[0] for m in models)
+
+
+def test_estimate_model_bytes_counts_torch_parameters_and_buffers():
+    module = torch.nn.BatchNorm1d(10)  # 20 parameters, 21 buffer values
+    expected = sum(p.numel() * p.element_size() for p in module.parameters())
+    expected += sum(b.numel() * b.element_size() for b in module.buffers())
+
+    assert estimate_model_bytes(module) == expected
+    assert estimate_model_bytes(object()) == FALLBACK_MODEL_BYTES
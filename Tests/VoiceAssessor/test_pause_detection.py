@@ -0,0 +1,103 @@
+import numpy as np
+import pytest
+import webrtcvad
+
+import pause_detection
+from pause_detection import StreamingVAD, pause_stats_from_mask, speech_spans, voiced_mask
+
+SR = 16000
+FRAME_MS = 30
+
+
+def _loop_pauses(voiced, frame_duration_ms=FRAME_MS):
+    """The per-frame loop pause detection used before the run-length encoding."""
+    pauses, current = [], 0
+    for v in voiced:
+        if not v:
+            current += 1
+        elif current > 0:
+            pauses.append(current)
+            current = 0
+    if current > 0:
+        pauses.append(current)
+    durations = [p * frame_duration_ms / 1000 for p in pauses]
+    if not durations:
+        return {"pause_count": 0, "total_pause": 0.0, "longest_pause": 0.0}
+    return {"pause_count": len(durations), "total_pause": float(sum(durations)), "longest_pause": float(max(durations))}
+
+
+def _speech(seconds=6.0, seed=0):
+    """Harmonic bursts separated by silences of varying length, peak 1.0."""
+    rng = np.random.default_rng(seed)
+    t = np.arange(int(0.4 * SR)) / SR
+    burst = sum(np.sin(2 * np.pi * 140 * k * t) / k for k in range(1, 8))
+    parts = []
+    while sum(map(len, parts)) < seconds * SR:
+        parts += [burst, np.zeros(int(rng.uniform(0.05, 0.8) * SR))]
+    audio = np.concatenate(parts).astype(np.float32)
+    return audio / np.abs(audio).max()
+
+
+@pytest.mark.parametrize("mask", [[], [True] * 5, [False] * 5, [False, True, True, False, False, True, False]])
+def test_pause_stats_edge_cases_match_the_loop(mask):
+    stats = pause_stats_from_mask(np.array(mask, dtype=bool), FRAME_MS)
+    expected = _loop_pauses(mask)
+    assert {k: stats[k] for k in expected} == pytest.approx(expected)
+
+
+def test_pause_stats_match_the_loop_on_random_masks():
+    rng = np.random.default_rng(0)
+    for _ in range(50):
+        mask = rng.random(rng.integers(1, 400)) < rng.uniform(0.1, 0.9)
+        stats = pause_stats_from_mask(mask, FRAME_MS)
+        expected = _loop_pauses(mask.tolist())
+        assert {k: stats[k] for k in expected} == pytest.approx(expected)
+        assert len(stats["pause_timeline"]) == stats["pause_count"]
+
+
+def test_voiced_mask_matches_per_frame_byte_slices():
+    audio = _speech()
+    pcm = np.int16(audio / np.max(np.abs(audio)) * 32767).tobytes()
+    frame_bytes = SR * FRAME_MS // 1000 * 2
+    vad = webrtcvad.Vad(2)
+    expected = [
+        vad.is_speech(pcm[i : i + frame_bytes], SR) for i in range(0, len(pcm) - frame_bytes + 1, frame_bytes)
+    ]
+
+    mask = voiced_mask(audio, SR, FRAME_MS, 2)
+    assert mask.tolist() == expected
+    assert mask.any() and not mask.all()
+
+
+def test_streaming_vad_matches_the_batch_mask_for_any_chunking():
+    audio = _speech(seed=1)
+    batch = voiced_mask(audio, SR, FRAME_MS, 2)
+    rng = np.random.default_rng(1)
+    cuts = np.sort(rng.integers(0, len(audio), 40))
+
+    vad = StreamingVAD(SR, FRAME_MS, 2)
+    mask = np.concatenate([vad.push(chunk) for chunk in np.split(audio, cuts)])
+
+    np.testing.assert_array_equal(mask, batch)
+    stats = vad.pause_stats()
+    np.testing.assert_allclose(stats["pause_timeline"], pause_stats_from_mask(batch, FRAME_MS)["pause_timeline"])
+    assert vad.voiced_frames == int(batch.sum())
+
+
+def test_invalid_frame_lengths_are_rejected():
+    with pytest.raises(ValueError):
+        voiced_mask(np.zeros(SR, np.float32), SR, frame_duration_ms=25)
+    with pytest.raises(ValueError):
+        StreamingVAD(sr=22050)
+
+
+def test_speech_spans_pad_and_merge():
+    frame = FRAME_MS / 1000
+    mask = np.zeros(200, dtype=bool)
+    mask[10:20] = True  # 0.30-0.60 s
+    mask[25:30] = True  # 0.75-0.90 s: merged, gap < 0.5 s
+    mask[100:110] = True  # 3.00-3.30 s: separate
+    spans = speech_spans(mask, FRAME_MS, SR, n_samples=int(200 * frame * SR), pad_sec=0.2, merge_gap_sec=0.5)
+
+    np.testing.assert_allclose(spans, [(0.1 * SR, 1.1 * SR), (2.8 * SR, 3.5 * SR)], atol=1)  # float frame times
+    np.testing.assert_allclose(pause_detection.voiced_regions(mask, FRAME_MS), [(0.3, 0.6), (0.75, 0.9), (3.0, 3.3)])
@@ -0,0 +1,58 @@
+import time
+
+import pytest
+
+import stage_runner
+from stage_runner import INLINE, PROCESS, Stage, run_stages
+
+
+def _slow(value, seconds, log, name):
+    time.sleep(seconds)
+    log.append(name)
+    return value
+
+
+def test_stages_run_after_their_dependencies_and_in_parallel():
+    log = []
+    stages = [
+        Stage("a", _slow, ("x",), kwargs={"seconds": 0.3, "log": log, "name": "a"}),
+        Stage("b", _slow, ("x",), kwargs={"seconds": 0.3, "log": log, "name": "b"}),
+        Stage("c", lambda a, b: a + b, ("a", "b"), kind=INLINE),
+    ]
+    start = time.perf_counter()
+    results, timings = run_stages(stages, {"x": 2})
+
+    assert results == {"a": 2, "b": 2, "c": 4}  # inputs are not returned
+    assert sorted(log) == ["a", "b"]
+    assert time.perf_counter() - start < 0.55  # a and b overlapped
+    assert set(timings) == {"a", "b", "c"}
+
+
+def test_stage_order_is_validated():
+    with pytest.raises(ValueError, match="later stages"):
+        run_stages([Stage("b", abs, ("a",)), Stage("a", abs, ("x",))], {"x": 1})
+    with pytest.raises(ValueError, match="Duplicate"):
+        run_stages([Stage("a", abs, ("x",)), Stage("a", abs, ("x",))], {"x": 1})
+
+
+def test_first_error_cancels_queued_stages_and_is_raised():
+    started = []
+
+    def fail(x):
+        raise RuntimeError("boom")
+
+    def after(a):
+        started.append("after")
+
+    stages = [Stage("a", fail, ("x",)), Stage("b", after, ("a",))]
+    with pytest.raises(RuntimeError, match="boom"):
+        run_stages(stages, {"x": 1})
+    assert started == []
+
+
+def test_process_pool_is_shut_down_and_recreated():
+    assert run_stages([Stage("a", abs, ("x",), kind=PROCESS)], {"x": -3})[0] == {"a": 3}
+    stage_runner.shutdown()
+    assert stage_runner._process_pool is None
+    assert run_stages([Stage("a", abs, ("x",), kind=PROCESS)], {"x": -4})[0] == {"a": 4}
+    stage_runner.shutdown()
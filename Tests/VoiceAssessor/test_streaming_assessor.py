@@ -0,0 +1,65 @@
+import numpy as np
+import soundfile as sf
+
+import streaming_assessor
+from streaming_assessor import StreamingVoiceAssessor, wav_chunks
+
+SR = 16000
+WORD_SEC = 0.4
+GAP_SEC = 0.1
+
+
+def _word(level):
+    """A voiced burst whose peak amplitude (level / 100) names the word."""
+    t = np.arange(int(WORD_SEC * SR)) / SR
+    wave = sum(np.sin(2 * np.pi * 150 * k * t) / k for k in range(1, 8))
+    return (level / 100 * wave / np.abs(wave).max()).astype(np.float32)
+
+
+def _speech(levels):
+    gap = np.zeros(int(GAP_SEC * SR), dtype=np.float32)
+    return np.concatenate([np.concatenate((_word(level), gap)) for level in levels])
+
+
+def _fake_transcribe(calls):
+    """Whisper stand-in: one word per voiced burst, named after its amplitude."""
+
+    def transcribe(audio, initial_prompt=None):
+        calls.append(len(audio) / SR)
+        block = SR // 100
+        peaks = np.abs(audio[: len(audio) // block * block]).reshape(-1, block).max(axis=1)
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], peaks > 1e-3, [0])).astype(np.int8)))
+        words = [
+            {"word": f" w{round(peaks[s:e].max() * 100)}", "start": s / 100, "end": e / 100}
+            for s, e in zip(edges[::2], edges[1::2])
+            if e - s >= 10
+        ]
+        return {"text": "".join(w["word"] for w in words), "segments": [{"words": words}]}
+
+    return transcribe
+
+
+def test_window_bounded_in_silence_and_words_not_duplicated(tmp_path, monkeypatch):
+    # Lexical counts are not under test; avoid needing nltk's punkt data
+    monkeypatch.setattr(streaming_assessor, "word_tokenize", str.split)
+
+    first, second = list(range(10, 26)), list(range(30, 46))
+    silence = np.zeros(60 * SR, dtype=np.float32)
+    path = tmp_path / "talk.wav"
+    sf.write(path, np.concatenate((_speech(first), silence, _speech(second), silence[: 2 * SR])), SR)
+
+    calls, held = [], []
+    engine = StreamingVoiceAssessor(
+        transcribe=_fake_transcribe(calls), prosody=None, max_window_sec=6.0, update_sec=1.0
+    )
+    engine.on_update = lambda _: held.append((engine._samples / SR, (engine._buffer.end - engine._buffer.start) / SR))
+    for chunk in wav_chunks(path):
+        engine.feed(chunk)
+    result = engine.finish()
+
+    assert max(calls) <= engine.max_window_sec
+    silent_updates = [kept for at, kept in held if 8 + 3 <= at <= 8 + 60]
+    assert silent_updates and max(silent_updates) <= 1.0
+    assert len(calls) < len(held) / 2  # the silence itself is not transcribed
+    assert [w["word"].strip() for w in engine.committed] == [f"w{level}" for level in first + second]
+    assert result["transcript"].split() == [f"w{level}" for level in first + second]
@@ -0,0 +1,64 @@
+import numpy as np
+import pytest
+
+import voice_assessor
+from voice_assessor import VAD_FRAME_MS, transcribe_audio, transcribe_voiced
+
+SR = 16000
+BURSTS = [(2.0, 3.0), (10.0, 11.0), (40.0, 41.5)]
+
+
+def _recording(seconds=60.0):
+    audio = np.zeros(int(seconds * SR), dtype=np.float32)
+    for start, end in BURSTS:
+        audio[int(start * SR) : int(end * SR)] = 0.5
+    return audio
+
+
+def _mask(audio):
+    frame = SR * VAD_FRAME_MS // 1000
+    return np.abs(audio[: len(audio) // frame * frame]).reshape(-1, frame).max(axis=1) > 0
+
+
+class FakeASR:
+    """Whisper stand-in: one word per non-silent run of the chunk it is given."""
+
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio, initial_prompt=None):
+        self.calls.append((len(audio) / SR, initial_prompt))
+        edges = np.flatnonzero(np.diff(np.concatenate(([0], audio != 0, [0])).astype(np.int8)))
+        words = [{"word": " w", "start": s / SR, "end": e / SR} for s, e in zip(edges[::2], edges[1::2])]
+        segment = {"start": 0.0, "end": len(audio) / SR, "text": " w" * len(words), "words": words}
+        return {"text": segment["text"], "segments": [segment], "language": "en"}
+
+
+@pytest.fixture
+def asr(monkeypatch):
+    fake = FakeASR()
+    monkeypatch.setattr(voice_assessor, "get_backend", lambda backend, model_name: fake)
+    return fake
+
+
+def test_word_times_are_mapped_back_to_the_recording(asr):
+    audio = _recording()
+    result = transcribe_voiced(audio, _mask(audio))
+
+    words = [w for seg in result["segments"] for w in seg["words"]]
+    assert [(w["start"], w["end"]) for w in words] == pytest.approx(BURSTS, abs=1e-3)
+    assert result["text"] == " w w w" and result["language"] == "en"
+    # Only the padded speech is decoded, in one chunk
+    assert len(asr.calls) == 1 and asr.calls[0][0] < 6.0
+
+
+def test_every_chunk_gets_the_initial_prompt(asr, monkeypatch):
+    monkeypatch.setattr(voice_assessor, "VAD_GATE_CHUNK_SEC", 2.0)
+    monkeypatch.setattr(voice_assessor.pause_detection, "voiced_mask", lambda audio, *args: _mask(audio))
+    audio = _recording()
+
+    result = transcribe_audio(audio, initial_prompt="PresenceAI pitch", vad_gate=True)
+
+    assert [prompt for _, prompt in asr.calls] == ["PresenceAI pitch"] * 3
+    starts = [seg["words"][0]["start"] for seg in result["segments"]]
+    assert starts == pytest.approx([start for start, _ in BURSTS], abs=1e-3)
@@ -0,0 +1,47 @@
+import subprocess
+
+import numpy as np
+import pytest
+import soundfile as sf
+
+import audio_io
+from voice_assessor_transcript import extract_audio, get_audio_duration
+
+SR = 16000
+
+
+def test_wav_is_decoded_in_memory_without_temp_files(tmp_path):
+    path = tmp_path / "talk.wav"
+    sf.write(path, np.zeros(SR * 2, np.float32), SR, subtype="FLOAT")
+
+    audio = extract_audio(path)
+
+    assert audio.dtype == np.float32 and get_audio_duration(audio) == 2.0
+    assert [p.name for p in tmp_path.iterdir()] == ["talk.wav"]
+
+
+def test_missing_input_is_reported_as_such(tmp_path, capsys):
+    with pytest.raises(SystemExit):
+        extract_audio(tmp_path / "missing.mp4")
+    assert "missing.mp4" in capsys.readouterr().err
+
+
+def test_missing_ffmpeg_and_ffmpeg_errors_are_reported(tmp_path, monkeypatch, capsys):
+    path = tmp_path / "talk.webm"
+    path.write_bytes(b"not audio libsndfile can read")
+
+    def no_ffmpeg(cmd, **kwargs):
+        raise FileNotFoundError(2, "No such file or directory", "ffmpeg")
+
+    monkeypatch.setattr(audio_io.subprocess, "run", no_ffmpeg)
+    with pytest.raises(SystemExit):
+        extract_audio(path)
+    assert "ffmpeg not found" in capsys.readouterr().err
+
+    def ffmpeg_fails(cmd, **kwargs):
+        raise subprocess.CalledProcessError(1, cmd, stderr=b"Invalid data found when processing input")
+
+    monkeypatch.setattr(audio_io.subprocess, "run", ffmpeg_fails)
+    with pytest.raises(SystemExit):
+        extract_audio(path)
+    assert "Invalid data found" in capsys.readouterr().err
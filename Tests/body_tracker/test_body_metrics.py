@@ -0,0 +1,96 @@
+import numpy as np
+import pytest
+
+from FullBodyTracker import (
+    L_ELBOW,
+    L_HIP,
+    L_SHOULDER,
+    POSE_IGNORE,
+    R_ELBOW,
+    R_HIP,
+    R_SHOULDER,
+    BodyMetrics,
+    draw_keypoints,
+)
+
+SHAPE = (480, 640, 3)
+
+
+def _recording(n=200, seed=0):
+    """(n, 33, 4) pose landmarks drifting slowly, with jumps and missing frames."""
+    rng = np.random.default_rng(seed)
+    steps = rng.normal(scale=0.0005, size=(n, 33, 4))
+    steps[rng.random(n) < 0.2] *= 40  # occasional real movement
+    landmarks = (0.5 + np.cumsum(steps, axis=0)).astype(np.float32)
+    landmarks[rng.random(n) < 0.15] = np.nan
+    return landmarks
+
+
+def _loop_summary(landmarks, shape=SHAPE):
+    """The per-frame loop FullBodyTracker ran before BodyMetrics."""
+    h, w = shape[:2]
+    total = static = cross = 0
+    bounce = sway = lean = arms = 0.0
+    prev = None
+    for lm in landmarks:
+        total += 1
+        if np.isnan(lm[0, 0]):
+            continue
+        keypoints = np.array([(int(p[0] * w), int(p[1] * h)) for p in lm[POSE_IGNORE:].tolist()])
+        if prev is not None and np.linalg.norm(keypoints - prev) < 5.0:
+            static += 1
+        prev = keypoints
+        x, y = lm[:, 0].tolist(), lm[:, 1].tolist()
+        bounce += abs((y[L_SHOULDER] + y[R_SHOULDER]) / 2 - 0.5)
+        sway += abs((x[L_SHOULDER] + x[R_SHOULDER]) / 2 - 0.5)
+        lean += abs((y[L_HIP] + y[R_HIP] + y[L_SHOULDER] + y[R_SHOULDER]) / 4 - 0.5)
+        arms += abs(y[L_ELBOW] - y[R_ELBOW])
+        cross += x[L_ELBOW] > x[L_SHOULDER] and x[R_ELBOW] < x[R_SHOULDER]
+    return {
+        "body_static_ratio": round(static / total, 3),
+        "bounce_score": round(bounce / total, 3),
+        "sway_score": round(sway / total, 3),
+        "lean_score": round(lean / total, 3),
+        "arm_expressiveness": round(arms / total, 3),
+        "arm_cross_ratio": round(cross / total, 3),
+    }
+
+
+def _per_frame(landmarks):
+    metrics = BodyMetrics(SHAPE)
+    for lm in landmarks:
+        metrics.update(None if np.isnan(lm[0, 0]) else lm)
+    return metrics
+
+
+@pytest.mark.parametrize("seed", range(3))
+def test_update_and_update_batch_agree_with_the_old_loop(seed):
+    landmarks = _recording(seed=seed)
+    single = _per_frame(landmarks)
+    batch = BodyMetrics(SHAPE)
+    batch.update_batch(landmarks)
+    chunked = BodyMetrics(SHAPE)
+    for part in np.array_split(landmarks, 7):
+        chunked.update_batch(part)
+
+    assert 0 < single.static_frames < single.total_frames
+    assert single.state() == pytest.approx(batch.state())
+    assert chunked.state() == pytest.approx(batch.state())
+    assert single.summary() == batch.summary() == _loop_summary(landmarks)
+
+
+def test_update_returns_keypoints_only_for_frames_with_a_pose():
+    metrics = BodyMetrics(SHAPE)
+    assert metrics.update(None) is None
+    keypoints = metrics.update(np.full((33, 4), 0.5, dtype=np.float32))
+
+    assert keypoints.shape == (33 - POSE_IGNORE, 2) and (keypoints == (320, 240)).all()
+    assert metrics.total_frames == 2 and metrics.static_frames == 0
+
+
+def test_draw_keypoints_clips_dots_at_the_border():
+    image = np.zeros((20, 20, 3), dtype=np.uint8)
+    draw_keypoints(image, np.array([[0, 0], [10, 10], [50, 50]]))
+
+    assert (image[10, 10] == (0, 255, 0)).all() and (image[0, 0] == (0, 255, 0)).all()
+    assert not image[19, 0].any()
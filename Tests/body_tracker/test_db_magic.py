@@ -0,0 +1,45 @@
+import pytest
+
+import db_magic
+
+
+@pytest.fixture(autouse=True)
+def database(tmp_path, monkeypatch):
+    monkeypatch.setattr(db_magic, "DB_PATH", str(tmp_path / "session_log.db"))
+    monkeypatch.setattr(db_magic, "LOG_PATH", str(tmp_path / "session_log.json"))
+
+
+def test_update_session_keeps_session_id_column_and_document_in_step():
+    db_magic.insert_session({"session_id": "s1", "score": 1})
+    db_magic.update_session("s1", {"session_id": "s1", "score": 2})
+    assert db_magic.get_session("s1") == {"session_id": "s1", "score": 2}
+
+    with pytest.raises(ValueError):
+        db_magic.update_session("s1", {"session_id": "s2", "score": 3})
+    assert db_magic.get_session("s1") == {"session_id": "s1", "score": 2}
+    assert db_magic.get_session("s2") is None
+
+
+def test_save_log_rolls_back_on_error():
+    db_magic.save_log([{"session_id": "s1"}])
+    with pytest.raises(TypeError):
+        db_magic.save_log([{"session_id": "s2"}, {"session_id": "s3", "bad": object()}])
+    assert db_magic.load_log() == [{"session_id": "s1"}]
+
+
+@pytest.mark.parametrize("key", ['a"b', "a\\b", "a.b", "", "with space"])
+def test_update_session_rejects_keys_that_are_not_plain_identifiers(key):
+    db_magic.insert_session({"session_id": "s1", "score": 1})
+    with pytest.raises(ValueError):
+        db_magic.update_session("s1", {key: 2, "score": 3})
+    assert db_magic.get_session("s1") == {"session_id": "s1", "score": 1}
+
+
+def test_update_session_sets_identifier_keys():
+    db_magic.insert_session({"session_id": "s1", "hand_tracking": {"old": True}})
+    db_magic.update_session("s1", {"hand_tracking": {"gestures": 4}, "Body_2": [1, 2]})
+    assert db_magic.get_session("s1") == {
+        "session_id": "s1",
+        "hand_tracking": {"gestures": 4},
+        "Body_2": [1, 2],
+    }
@@ -0,0 +1,74 @@
+import numpy as np
+import pytest
+
+from HandTracker import HandMetrics
+
+
+def _hand(x, y):
+    """(21, 3) landmarks whose centroid is (x, y)."""
+    offsets = np.linspace(-0.02, 0.02, 21, dtype=np.float32)
+    return np.stack([x + offsets, y - offsets, np.zeros(21, np.float32)], axis=1)
+
+
+def _frame(*centroids):
+    return np.stack([_hand(x, y) for x, y in centroids]) if centroids else np.empty((0, 21, 3), np.float32)
+
+
+def test_labels_keep_identity_when_mediapipe_reorders_hands():
+    metrics = HandMetrics()
+    metrics.update(_frame((0.2, 0.5), (0.8, 0.5)), ["Left", "Right"])
+    movement = metrics.update(_frame((0.805, 0.5), (0.205, 0.5)), ["Right", "Left"])
+
+    assert movement == pytest.approx(0.01, abs=1e-6)
+    series = metrics.series()
+    assert sorted(series) == ["Left", "Right"]
+    np.testing.assert_allclose(series["Left"]["x"], [0.2, 0.205], atol=1e-6)
+
+
+def test_unlabelled_and_duplicate_labelled_hands_match_by_nearest_centroid():
+    for labels in (None, ["Right", "Right"]):
+        metrics = HandMetrics()
+        first = metrics.match(np.array([[0.2, 0.5], [0.8, 0.5]]), labels)[0]
+        ids, movements = metrics.match(np.array([[0.79, 0.5], [0.21, 0.5]]), labels)
+
+        assert ids == first[::-1]
+        np.testing.assert_allclose(movements, [0.01, 0.01])
+
+
+def test_a_hand_reappearing_far_away_is_a_new_hand():
+    metrics = HandMetrics(max_match_distance=0.25)
+    metrics.update(_frame((0.2, 0.5)))
+    assert metrics.update(_frame()) is None  # hand dropped out
+    assert metrics.update(_frame((0.9, 0.1))) is None  # nothing matched: not static, not active
+
+    assert len(metrics.series()) == 2
+    assert metrics.static_frames == metrics.high_activity_frames == 0
+    assert metrics.total_frames == 3
+
+
+def test_update_and_update_batch_agree():
+    rng = np.random.default_rng(0)
+    frames, labels = [], []
+    for f in range(60):
+        centroids = [(0.3 + 0.05 * np.sin(f / 5), 0.5), (0.7, 0.5 + rng.normal(scale=0.05))]
+        keep = [i for i in range(2) if rng.random() > 0.2]
+        frames.append(_frame(*(centroids[i] for i in keep)))
+        labels.append([("Left", "Right")[i] for i in keep])
+
+    single = HandMetrics()
+    per_frame = [single.update(hands, names) for hands, names in zip(frames, labels)]
+
+    padded = np.full((60, 2, 21, 3), np.nan, dtype=np.float32)
+    padded_labels = []
+    for f, (hands, names) in enumerate(zip(frames, labels)):
+        padded[f, : len(hands)] = hands
+        padded_labels.append(names + [None] * (2 - len(names)))
+    batch = HandMetrics()
+    movement = batch.update_batch(padded, padded_labels)
+
+    np.testing.assert_allclose([np.nan if m is None else m for m in per_frame], movement)
+    assert single.state() == pytest.approx(batch.state())
+    assert 0 < single.static_frames and 0 < single.high_activity_frames
+    for hand_id, series in single.series().items():
+        for key, values in series.items():
+            np.testing.assert_allclose(values, batch.series()[hand_id][key])
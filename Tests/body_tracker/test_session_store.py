@@ -0,0 +1,100 @@
+import os
+
+import mongomock
+import pytest
+from pymongo import UpdateOne
+from pymongo.errors import AutoReconnect
+
+from session_store import SessionWriter
+
+
+class Recorder:
+    """Collection wrapper that records every bulk_write and can simulate an outage."""
+
+    def __init__(self, collection):
+        self.collection = collection
+        self.batches = []
+        self.down = False
+
+    def bulk_write(self, operations, ordered=True):
+        if self.down:
+            raise AutoReconnect("connection refused")
+        self.batches.append(operations)
+        return self.collection.bulk_write(operations, ordered=ordered)
+
+
+@pytest.fixture
+def sessions():
+    return mongomock.MongoClient()["presenceAI"]["sessions"]
+
+
+def _writer(collection, tmp_path, **kwargs):
+    # A long interval keeps the background flusher out of the way; tests flush explicitly
+    return SessionWriter(collection, name="test", wal_dir=str(tmp_path), flush_seconds=3600, **kwargs)
+
+
+def test_appends_merge_into_one_upsert_per_session(sessions, tmp_path):
+    recorder = Recorder(sessions)
+    writer = _writer(recorder, tmp_path)
+    writer.set("s1", {"user": "ana"})
+    for i in range(3):
+        writer.append("s1", "posture", {"t": i, "score": 0.5 + i})
+        writer.append("s2", "gestures", {"t": i})
+    writer.set("s1", {"status": "live"})
+
+    assert writer.flush()
+    assert recorder.batches == [
+        [
+            UpdateOne(
+                {"session_id": "s1"},
+                {
+                    "$set": {"user": "ana", "status": "live"},
+                    "$push": {"timeseries.posture": {"$each": [{"t": i, "score": 0.5 + i} for i in range(3)]}},
+                },
+                upsert=True,
+            ),
+            UpdateOne(
+                {"session_id": "s2"},
+                {"$push": {"timeseries.gestures": {"$each": [{"t": i} for i in range(3)]}}},
+                upsert=True,
+            ),
+        ]
+    ]
+
+    s1 = sessions.find_one({"session_id": "s1"})
+    assert s1["user"] == "ana" and s1["status"] == "live"
+    assert [sample["t"] for sample in s1["timeseries"]["posture"]] == [0, 1, 2]
+    assert len(sessions.find_one({"session_id": "s2"})["timeseries"]["gestures"]) == 3
+    writer.close()
+
+
+def test_wal_is_replayed_after_outage_and_restart(sessions, tmp_path):
+    recorder = Recorder(sessions)
+    recorder.down = True
+    writer = _writer(recorder, tmp_path)
+    writer.append("s1", "posture", {"t": 0})
+    writer.append("s1", "posture", {"t": 1})
+    assert not writer.flush()
+    writer.close(timeout=0)  # the process exits while Mongo is still down
+    assert os.path.exists(writer.wal_path)
+    assert sessions.count_documents({}) == 0
+
+    restarted = _writer(Recorder(sessions), tmp_path)
+    restarted.append("s1", "posture", {"t": 2})
+    assert restarted.flush()
+    assert [sample["t"] for sample in sessions.find_one({"session_id": "s1"})["timeseries"]["posture"]] == [0, 1, 2]
+    assert not os.path.exists(restarted.wal_path)
+    restarted.close()
+
+
+def test_close_flushes_remaining_rows(sessions, tmp_path):
+    writer = _writer(sessions, tmp_path, flush_rows=1000)
+    writer.set("s1", {"status": "done", "summary.score": 82})
+    writer.append("s1", "posture", {"t": 0})
+    assert sessions.count_documents({}) == 0
+
+    writer.close()
+    s1 = sessions.find_one({"session_id": "s1"})
+    assert s1["status"] == "done" and s1["summary"] == {"score": 82}
+    assert len(s1["timeseries"]["posture"]) == 1
+    assert not os.path.exists(writer.wal_path)
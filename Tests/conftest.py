@@ -0,0 +1,8 @@
+import sys
+from pathlib import Path
+
+# Modules under src/ import their siblings by plain name, as when run as scripts
+SRC = Path(__file__).resolve().parent.parent / "src"
+for path in (SRC, SRC / "VoiceAssessor", SRC / "body_tracker"):
+    if str(path) not in sys.path:
+        sys.path.insert(0, str(path))
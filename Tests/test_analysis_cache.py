@@ -0,0 +1,69 @@
+import itertools
+
+import numpy as np
+
+import analysis_cache
+from analysis_cache import AnalysisCache
+
+
+def test_cached_computes_once_per_stage_model_and_params(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    media = cache.media_hash(np.arange(16000, dtype=np.float32), sr=16000)
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return {"text": "hello", "len": len(calls)}
+
+    first = cache.cached(media, "transcription", compute, model="base")
+    again = cache.cached(media, "transcription", compute, model="base")
+    other_model = cache.cached(media, "transcription", compute, model="small")
+    other_params = cache.cached(
+        media, "transcription", compute, model="base", params={"beam": 5}
+    )
+
+    assert first == again == {"text": "hello", "len": 1}
+    assert other_model["len"] == 2 and other_params["len"] == 3
+    assert len(calls) == 3
+
+
+def test_media_hash_follows_content_not_path(tmp_path):
+    cache = AnalysisCache(tmp_path / "cache")
+    a, b, c = tmp_path / "a.bin", tmp_path / "b.bin", tmp_path / "c.bin"
+    a.write_bytes(b"same bytes")
+    b.write_bytes(b"same bytes")
+    c.write_bytes(b"other bytes")
+
+    assert cache.media_hash(a) == cache.media_hash(b) != cache.media_hash(c)
+    assert cache.media_hash(a) == cache.media_hash(a)  # served from the index
+
+
+def test_least_recently_used_entries_are_evicted(tmp_path, monkeypatch):
+    clock = itertools.count(1000)
+    monkeypatch.setattr(analysis_cache.time, "time", lambda: float(next(clock)))
+    blob = np.zeros(1000, dtype=np.uint8)
+    cache = AnalysisCache(tmp_path, max_bytes=3500)
+
+    for key in ("a", "b", "c"):
+        cache.put(key, blob)
+    assert cache.get("a") is not None  # "b" is now the least recently used
+    cache.put("d", blob)
+
+    assert cache.get("b") is None
+    assert all(cache.get(key) is not None for key in ("a", "c", "d"))
+    assert cache.size_bytes() <= 3500
+
+
+def test_directory_entries_count_only_once_committed(tmp_path):
+    cache = AnalysisCache(tmp_path)
+    path = cache.directory("trace")
+    path.mkdir(parents=True)
+    (path / "frames.npy").write_bytes(b"x" * 100)
+
+    assert not cache.has_directory("trace")
+    cache.commit_directory("trace")
+    assert cache.has_directory("trace")
+    assert cache.size_bytes() == 100
+
+    cache.clear()
+    assert not path.exists() and cache.size_bytes() == 0
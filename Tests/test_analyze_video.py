@@ -0,0 +1,68 @@
+from pathlib import Path
+
+import cv2 as cv
+import pytest
+
+import analyze_video
+from analyze_video import analyze_segment, merge_segments, plan_segments
+
+IMAGE = Path(__file__).resolve().parent.parent / "Assets" / "testImage.png"
+FPS = 10
+VIDEO_CAPTURE = cv.VideoCapture
+
+
+@pytest.fixture(scope="module")
+def video(tmp_path_factory):
+    """25 frames at 10 fps of the test image (one face)."""
+    path = str(tmp_path_factory.mktemp("video") / "clip.avi")
+    image = cv.resize(cv.imread(str(IMAGE)), (680, 244))
+    writer = cv.VideoWriter(path, cv.VideoWriter_fourcc(*"MJPG"), FPS, (680, 244))
+    for _ in range(25):
+        writer.write(image)
+    writer.release()
+    return path
+
+
+class NoFrameCount:
+    """A capture that reports no frame count, like a MediaRecorder .webm."""
+
+    def __init__(self, path):
+        self.cap = VIDEO_CAPTURE(path)
+
+    def __getattr__(self, name):
+        return getattr(self.cap, name)
+
+    def get(self, prop):
+        return -1.0 if prop == cv.CAP_PROP_FRAME_COUNT else self.cap.get(prop)
+
+
+def test_plan_segments_covers_every_frame(video):
+    assert plan_segments(video, segment_seconds=1.0) == (
+        FPS,
+        [(0, 10), (10, 20), (20, 25)],
+    )
+
+
+def test_plan_segments_without_frame_count_reads_to_the_end(video, monkeypatch):
+    monkeypatch.setattr(analyze_video.cv, "VideoCapture", NoFrameCount)
+    fps, segments = plan_segments(video, segment_seconds=1.0)
+    monkeypatch.undo()
+
+    assert segments == [(0, None)]
+    assert analyze_segment(video, *segments[0])["body"]["frames"] == 25
+
+
+def test_merged_segments_match_one_pass(video):
+    whole = merge_segments([analyze_segment(video, 0, 25)], FPS)
+    split = merge_segments(
+        [analyze_segment(video, s, e) for s, e in [(0, 10), (10, 20), (20, 25)]], FPS
+    )
+
+    assert split["segments"] == 3
+    assert split["total_frames"] == whole["total_frames"] == 25
+    assert (
+        split["facial_tracking"]["face_frames"]
+        == whole["facial_tracking"]["face_frames"]
+        == 25
+    )
+    assert split["hand_tracking"] == whole["hand_tracking"]
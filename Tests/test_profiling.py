@@ -0,0 +1,49 @@
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+from profiling import Profiler
+
+SRC = Path(__file__).resolve().parent.parent / "src"
+
+
+def test_disabled_profiler_records_nothing():
+    profiler = Profiler()
+    with profiler.timer("stage"):
+        pass
+    profiler.record("stage", 1.0)
+    assert profiler.timer("a") is profiler.timer("b")
+    assert profiler.summary() == {}
+
+
+def test_enabled_profiler_counts_timer_timed_and_record():
+    profiler = Profiler(enabled=True, capacity=4)
+
+    @profiler.timed("work")
+    def work(x):
+        return x * 2
+
+    for i in range(6):
+        with profiler.timer("block"):
+            pass
+        assert work(i) == 2 * i
+    profiler.record("external", 0.5)
+
+    summary = profiler.summary()
+    assert summary["block"]["count"] == summary["work"]["count"] == 6
+    assert summary["external"]["total_sec"] == 0.5
+    assert summary["external"]["max_ms"] == 500.0
+    assert 'stage="external",quantile="0.95"' in profiler.to_prometheus()
+
+
+def test_scripts_run_from_their_own_directory_share_the_profiler():
+    env = {k: v for k, v in os.environ.items() if k != "PYTHONPATH"}
+    for folder, module in (
+        ("body_tracker", "HandTracker"),
+        ("body_tracker", "FullBodyTracker"),
+    ):
+        check = f"import {module}, profiling; assert {module}.timer is profiling.timer"
+        subprocess.run(
+            [sys.executable, "-c", check], cwd=SRC / folder, env=env, check=True
+        )
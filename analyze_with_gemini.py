@@ -3,6 +3,8 @@ import os
 import sys
 from datetime import datetime
 
+from src.body_tracker import db_magic
+
 # === Gemini API Setup ===
 import google.generativeai as genai
 
@@ -14,17 +16,13 @@ GEMINI_API_KEY = os.getenv("GEMINI_API_KEY")
 genai.configure(api_key=GEMINI_API_KEY)
 
 # === Helper: Load session data ===
-LOG_PATH = "session_log.json"
-
 def get_session_data(session_id):
-    if not os.path.exists(LOG_PATH):
-        raise FileNotFoundError("session_log.json not found")
-    with open(LOG_PATH, "r") as f:
-        sessions = json.load(f)
-    for session in sessions:
-        if session.get("session_id") == session_id:
-            return session
-    raise ValueError(f"Session ID '{session_id}' not found")
+    if not os.path.exists(db_magic.DB_PATH) and not os.path.exists(db_magic.LOG_PATH):
+        raise FileNotFoundError(f"{db_magic.DB_PATH} not found")
+    session = db_magic.get_session(session_id)
+    if session is None:
+        raise ValueError(f"Session ID '{session_id}' not found")
+    return session
 
 # === Prompt builder ===
 def build_prompt(data):
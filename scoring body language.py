@@ -1,5 +1,6 @@
 import cv2                      # we need this library when working with videos
 import mediapipe as mp          # we need this to track pose, hands and facial expressions in each frame of the video
+import argparse
 import math
 import os
 
@@ -7,6 +8,8 @@ import os
 from google.ai.generativelanguage_v1 import TextServiceClient
 from google.ai.generativelanguage_v1.types import GenerateContentRequest, TextCompletionPrompt
 
+from src.analysis_cache import get_cache
+
 
 def calculate_angle(a, b, c):
     """
@@ -44,15 +47,22 @@ def generate_ai_suggestions(text_prompt: str) -> str:
     return response.candidates[0].content
 
 
-def main():
+def collect_frame_measures(video_path):
+    """Run Pose + Hands over the video and return the raw per-frame measures.
+
+    Returns (posture_angles, hands_raised, completed): one entry per frame
+    with a pose, so scoring thresholds can change without running MediaPipe
+    again. ``completed`` is False when the run was stopped with 'q'.
+    """
     mp_drawing = mp.solutions.drawing_utils  # Utility to draw landmarks on images/frames
     mp_pose = mp.solutions.pose              # Pose tracking model
     mp_hands = mp.solutions.hands            # Hand tracking model
 
-    cap = cv2.VideoCapture('./ps-mini.mp4')
+    cap = cv2.VideoCapture(video_path)
 
-    posture_scores = []
-    gesture_scores = []
+    posture_angles = []
+    hands_raised = []
+    completed = True
 
     with mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5) as pose, \
          mp_hands.Hands(min_detection_confidence=0.5, min_tracking_confidence=0.5) as hands:
@@ -88,9 +98,10 @@ def main():
 
             cv2.imshow('Body Language Tracker', image)
             if cv2.waitKey(10) & 0xFF == ord('q'):
+                completed = False
                 break
 
-            # Analyze posture and gestures, collect scores
+            # Collect posture and gesture measures
             if pose_results.pose_landmarks:
                 landmarks = pose_results.pose_landmarks.landmark
 
@@ -105,17 +116,8 @@ def main():
                            (left_hip.y + right_hip.y) / 2)
                 point_above_shoulders = (shoulder_mid[0], shoulder_mid[1] - 0.1)
 
-                posture_angle = calculate_angle(hip_mid, shoulder_mid, point_above_shoulders)
+                posture_angles.append(calculate_angle(hip_mid, shoulder_mid, point_above_shoulders))
 
-                # Convert posture angle to numeric score (0-100)
-                if posture_angle > 160:
-                    posture_scores.append(100)
-                elif posture_angle > 140:
-                    posture_scores.append(70)
-                else:
-                    posture_scores.append(30)
-
-                # Hand gesture score
                 hand_raised = False
                 if hand_results.multi_hand_landmarks:
                     for hand_landmarks in hand_results.multi_hand_landmarks:
@@ -123,10 +125,36 @@ def main():
                         if wrist.y < shoulder_mid[1]:
                             hand_raised = True
                             break
-                gesture_scores.append(100 if hand_raised else 30)
+                hands_raised.append(hand_raised)
 
     cap.release()
     cv2.destroyAllWindows()
+    return posture_angles, hands_raised, completed
+
+
+def posture_score(angle):
+    # Convert posture angle to numeric score (0-100)
+    if angle > 160:
+        return 100
+    elif angle > 140:
+        return 70
+    return 30
+
+
+def main(video_path='./ps-mini.mp4', use_cache=True):
+    # Re-running on the same video reuses the MediaPipe measures from the analysis cache
+    cache = get_cache() if use_cache else None
+    key = cache.key(cache.media_hash(video_path), "body_language_measures", "mediapipe") if cache else None
+    measures = cache.get(key) if cache else None
+    if measures is None:
+        posture_angles, hands_raised, completed = collect_frame_measures(video_path)
+        measures = (posture_angles, hands_raised)
+        if cache and completed:
+            cache.put(key, measures)
+    posture_angles, hands_raised = measures
+
+    posture_scores = [posture_score(angle) for angle in posture_angles]
+    gesture_scores = [100 if raised else 30 for raised in hands_raised]
 
     # Calculate average scores
     avg_posture_score = sum(posture_scores) / len(posture_scores) if posture_scores else 0
@@ -151,4 +179,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    parser = argparse.ArgumentParser(description="Score posture and gestures in a speaking video")
+    parser.add_argument("video", nargs="?", default="./ps-mini.mp4", help="Path to the video file")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the analysis cache")
+    args = parser.parse_args()
+    main(args.video, use_cache=not args.no_cache)
@@ -11,48 +11,190 @@ __updated__ = Sat Jun 21 2025
 
 import csv
 import os
+import shutil
+import threading
 import time
 
+import numpy as np
 
-class CSVLogger:
-    def __init__(self, filename="emotions_log.csv"):
-        self.filename = filename
+# (column header, FrameAnalyzer.results key)
+COLUMNS = [
+    ("Time (s)", "Time"),
+    ("Blink Count", "Blink Count"),
+    ("Head Tilt Count", "Head Tilt Count"),
+    ("Gaze", "Eye Gaze"),
+    ("Smiling", "Smiling"),
+    ("Confidence", "Confidence"),
+    ("Engagement", "Engagement"),
+    ("Nervousness", "Nervousness"),
+    ("Authenticity", "Authenticity"),
+]
+HEADERS = [header for header, _ in COLUMNS]
+
+
+class BufferedLogger:
+    """Collects rows on the caller's thread and writes them from a background thread.
+
+    ``log_results`` only appends to an in-memory buffer, so it is cheap enough
+    to call every frame. Rows are handed to ``_write_rows`` once
+    ``flush_rows`` are buffered or ``flush_seconds`` have passed, whichever
+    comes first. ``interval`` keeps the old one-row-per-second behaviour;
+    pass ``interval=0`` to log every frame. ``flush`` may run on the writer
+    thread and the caller at once; batches are written one at a time, in order.
+    """
+
+    def __init__(self, interval=1.0, flush_rows=256, flush_seconds=2.0):
+        self.interval = interval
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
         self.last_logged_time = 0
 
-        # Write headers if file doesn't exist
-        if not os.path.exists(self.filename):
-            with open(self.filename, mode="w", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(
-                    [
-                        "Time (s)",
-                        "Blink Count",
-                        "Head Tilt Count",
-                        "Gaze",
-                        "Smiling",
-                        "Confidence",
-                        "Engagement",
-                        "Nervousness",
-                        "Authenticity",
-                    ]
-                )
+        self._rows = []
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._writer = threading.Thread(target=self._flush_loop, daemon=True)
+        self._writer.start()
 
     def log_results(self, metrics):
         current_time = time.time()
-        if current_time - self.last_logged_time >= 1.0:
-            with open(self.filename, mode="a", newline="") as file:
-                writer = csv.writer(file)
-                writer.writerow(
-                    [
-                        metrics["Time"],
-                        metrics["Blink Count"],
-                        metrics["Head Tilt Count"],
-                        metrics["Eye Gaze"],
-                        metrics["Smiling"],
-                        metrics["Confidence"],
-                        metrics["Engagement"],
-                        metrics["Nervousness"],
-                        metrics["Authenticity"],
-                    ]
-                )
-            self.last_logged_time = current_time
+        if current_time - self.last_logged_time < self.interval:
+            return
+
+        row = [metrics[key] for _, key in COLUMNS]
+        with self._lock:
+            self._rows.append(row)
+            full = len(self._rows) >= self.flush_rows
+        if full:
+            self._wake.set()
+        self.last_logged_time = current_time
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        with self._write_lock:
+            with self._lock:
+                rows, self._rows = self._rows, []
+            if rows:
+                self._write_rows(rows)
+
+    def _write_rows(self, rows):
+        raise NotImplementedError
+
+    def close(self):
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._writer.join()
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class CSVLogger(BufferedLogger):
+    def __init__(self, filename="emotions_log.csv", **kwargs):
+        self.filename = filename
+
+        # Write headers if file doesn't exist; the handle stays open for the session
+        write_header = not os.path.exists(self.filename)
+        self._file = open(self.filename, mode="a", newline="")
+        self._csv = csv.writer(self._file)
+        if write_header:
+            self._csv.writerow(HEADERS)
+            self._file.flush()
+
+        super().__init__(**kwargs)
+
+    def _write_rows(self, rows):
+        self._csv.writerows(rows)
+        self._file.flush()
+
+    def close(self):
+        super().close()
+        self._file.close()
+
+
+class NpzLogger(BufferedLogger):
+    """Columnar log that ``plot.py`` loads with ``np.load``, no CSV parsing.
+
+    Every flush writes its rows as a numbered chunk (``part-N.npz``, one array
+    per column, keyed by the CSV header) in ``<filename>.parts/``, so rows
+    reach disk while the session runs. ``close`` appends the chunks to the
+    ``.npz`` archive (earlier sessions stay ahead of them, as with the CSV
+    log) and removes them; chunks left by an interrupted run are merged into
+    the next one.
+    """
+
+    def __init__(self, filename="emotions_log.npz", **kwargs):
+        self.filename = filename
+        self.parts_dir = filename + ".parts"
+        os.makedirs(self.parts_dir, exist_ok=True)
+        self._parts = sorted(
+            name for name in os.listdir(self.parts_dir) if name.startswith("part-")
+        )
+        super().__init__(**kwargs)
+
+    def _write_rows(self, rows):
+        name = f"part-{len(self._parts):06d}.npz"
+        tmp = os.path.join(self.parts_dir, "tmp-" + name)
+        np.savez(tmp, **{h: np.asarray(v) for h, v in zip(HEADERS, zip(*rows))})
+        os.replace(tmp, os.path.join(self.parts_dir, name))
+        self._parts.append(name)
+
+    def close(self):
+        super().close()
+        columns = {header: [] for header in HEADERS}
+        if os.path.exists(self.filename):
+            with np.load(self.filename) as previous:
+                for header in HEADERS:
+                    if header in previous.files:
+                        columns[header].append(previous[header])
+        for name in self._parts:
+            with np.load(os.path.join(self.parts_dir, name)) as part:
+                for header in HEADERS:
+                    columns[header].append(part[header])
+        tmp = self.filename + ".tmp.npz"
+        np.savez(
+            tmp,
+            **{
+                h: np.concatenate([a for a in v if len(a)] or [np.asarray([])])
+                for h, v in columns.items()
+            },
+        )
+        os.replace(tmp, self.filename)
+        shutil.rmtree(self.parts_dir, ignore_errors=True)
+
+
+class SessionLogger(BufferedLogger):
+    """Streams rows into a session document as the ``timeseries.<series>`` array.
+
+    ``writer`` is a ``body_tracker.session_store.SessionWriter`` (or anything
+    with the same ``append``), which does its own batching to Mongo.
+    """
+
+    def __init__(self, writer, session_id, series="facial", **kwargs):
+        self.writer = writer
+        self.session_id = session_id
+        self.series = series
+        super().__init__(**kwargs)
+
+    def _write_rows(self, rows):
+        for row in rows:
+            self.writer.append(self.session_id, self.series, dict(zip(HEADERS, row)))
+
+
+def make_logger(filename="emotions_log.csv", **kwargs):
+    """Pick the logger backend from the file extension (.csv or .npz)."""
+    if filename.endswith(".npz"):
+        return NpzLogger(filename, **kwargs)
+    return CSVLogger(filename, **kwargs)
@@ -16,6 +16,8 @@ import math
 import time
 from collections import deque, Counter
 
+from profiling import timer
+
 
 class Detector:
     def __init__(self, detection_confidence=0.5):
@@ -35,13 +37,19 @@ class Detector:
         self.blink_state = False
         self.blink_threshold = 4.5
 
-    def detect_face(self, frame):
-        results = self.face_detection.process(cv.cvtColor(frame, cv.COLOR_BGR2RGB))
+    def close(self):
+        self.face_detection.close()
+        self.face_mesh.close()
+
+    def locate_face(self, rgb):
+        """Return (rows, cols) slices of the padded face box, or None."""
+        with timer("face.detection"):
+            results = self.face_detection.process(rgb)
 
         if not results.detections:
             return None
 
-        h, w = frame.shape[:2]
+        h, w = rgb.shape[:2]
         margin = int(h * 0.1)
         face = results.detections[0].location_data.relative_bounding_box
 
@@ -50,11 +58,24 @@ class Detector:
         width = min(int(face.width * w) + 2 * margin, w - x)
         height = min(int(face.height * h) + 2 * margin, h - y)
 
-        return frame[y : y + height, x : x + width]
+        return slice(y, y + height), slice(x, x + width)
+
+    def detect_face(self, frame, rgb=None):
+        if rgb is None:
+            rgb = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
+
+        box = self.locate_face(rgb)
+        if box is None:
+            return None
+
+        return frame[box]
 
-    def process_face(self, frame):
-        rgb_frame = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
-        return self.face_mesh.process(rgb_frame)
+    def process_face(self, frame, rgb=None):
+        if rgb is None:
+            rgb = cv.cvtColor(frame, cv.COLOR_BGR2RGB)
+        # MediaPipe only borrows contiguous buffers; face crops are views
+        with timer("face.mesh"):
+            return self.face_mesh.process(np.ascontiguousarray(rgb))
 
 
 def euclidean_distance(p1, p2):
@@ -0,0 +1,123 @@
+"""-------------------------------------------------------
+PresenceAI: Batched landmark geometry for the face mesh
+-------------------------------------------------------
+Uses:    NumPy
+-------------------------------------------------------
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+NUM_FACE_LANDMARKS = 478
+
+# Landmark index pairs whose distances feed every ratio FrameAnalyzer needs.
+#   0: left eye top/bottom       4: mouth top/bottom
+#   1: left eye outer/inner      5: left/right lip corner
+#   2: right eye top/bottom      6: left iris/left eye outer
+#   3: right eye outer/inner     7: right iris/right eye outer
+_PAIR_A = np.array([159, 33, 386, 362, 13, 61, 468, 473])
+_PAIR_B = np.array([145, 133, 374, 263, 14, 291, 33, 362])
+
+# Ratios are numerator distance / denominator distance:
+#   left EAR, right EAR, smile, left gaze, right gaze
+_RATIO_NUM = np.array([0, 2, 5, 6, 7])
+_RATIO_DEN = np.array([1, 3, 4, 1, 3])
+
+_TILT_FROM = 33
+_TILT_TO = 263
+
+# Wire layout of a serialized NormalizedLandmarkList when every landmark
+# carries exactly x, y and z (what FaceMesh emits): a length-delimited entry
+# of three fixed32 fields. Parsing this with NumPy avoids ~1k protobuf
+# attribute lookups per frame: ~60 us instead of ~330 us for the fromiter
+# path on 478 landmarks (Tests/FacialRecognition/test_geometry.py checks
+# both give identical points).
+_LANDMARK_RECORD = np.dtype(
+    [
+        ("tag", "u1"),
+        ("size", "u1"),
+        ("x_tag", "u1"),
+        ("x", "<f4"),
+        ("y_tag", "u1"),
+        ("y", "<f4"),
+        ("z_tag", "u1"),
+        ("z", "<f4"),
+    ]
+)
+_EXPECTED_TAGS = (0x0A, 15, 0x0D, 0x15, 0x1D)
+
+
+def _landmark_records(landmarks, n):
+    """Return the landmarks as a structured array, or None if not packed."""
+    raw = landmarks.SerializeToString()
+    if len(raw) != n * _LANDMARK_RECORD.itemsize:
+        return None
+    records = np.frombuffer(raw, dtype=_LANDMARK_RECORD)
+    fields = ("tag", "size", "x_tag", "y_tag", "z_tag")
+    for field, expected in zip(fields, _EXPECTED_TAGS):
+        if not (records[field] == expected).all():
+            return None
+    return records
+
+
+class FaceMeasurements(NamedTuple):
+    ear: float
+    left_ear: float
+    right_ear: float
+    mouth_openness: float
+    smile_ratio: float
+    head_tilt_angle: float
+    left_gaze_ratio: float
+    right_gaze_ratio: float
+
+
+class LandmarkGeometry:
+    def __init__(self, num_landmarks=NUM_FACE_LANDMARKS):
+        # Reused every frame so the hot path does not allocate per landmark
+        self.points = np.zeros((num_landmarks, 2), dtype=np.float32)
+        self._scale = np.ones(2, dtype=np.float32)
+
+    def update(self, landmarks, image_shape):
+        """Copy MediaPipe landmarks into the (N, 2) pixel-space buffer."""
+        h, w = image_shape[:2]
+        lms = landmarks.landmark
+        n = len(lms)
+        if n != len(self.points):
+            self.points = np.zeros((n, 2), dtype=np.float32)
+
+        records = _landmark_records(landmarks, n)
+        if records is not None:
+            np.multiply(records["x"], w, out=self.points[:, 0])
+            np.multiply(records["y"], h, out=self.points[:, 1])
+            return self.points
+
+        # Slow path for landmarks carrying visibility/presence fields
+        flat = np.fromiter(
+            (c for l in lms for c in (l.x, l.y)), dtype=np.float32, count=2 * n
+        )
+        self._scale[0] = w
+        self._scale[1] = h
+        np.multiply(flat.reshape(n, 2), self._scale, out=self.points)
+        return self.points
+
+    @staticmethod
+    def measure(points):
+        """Compute every per-frame ratio from an (N, 2) array in one pass."""
+        dist = np.linalg.norm(points[_PAIR_A] - points[_PAIR_B], axis=1)
+        ratios = dist[_RATIO_NUM] / (dist[_RATIO_DEN] + 1e-6)
+
+        dx, dy = points[_TILT_TO] - points[_TILT_FROM]
+        tilt = np.degrees(np.arctan2(dy, dx))
+
+        left_ear, right_ear, smile, left_gaze, right_gaze = ratios.tolist()
+        return FaceMeasurements(
+            ear=(left_ear + right_ear) / 2,
+            left_ear=left_ear,
+            right_ear=right_ear,
+            mouth_openness=float(dist[4]),
+            smile_ratio=smile,
+            head_tilt_angle=float(tilt),
+            left_gaze_ratio=left_gaze,
+            right_gaze_ratio=right_gaze,
+        )
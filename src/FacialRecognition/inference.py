@@ -9,19 +9,31 @@ __updated__ = Sat Jun 21 2025
 -------------------------------------------------------
 """
 
-import numpy as np
 import time
-import math
-from collections import deque, Counter
+from collections import Counter
+
+from FacialRecognition.geometry import LandmarkGeometry
+from FacialRecognition.rolling import RollingWindow, DownsampledHistory, RollingMode
 
 
 class FrameAnalyzer:
     def __init__(
-        self, ear_threshold=0.2, min_frames_between_blinks=3, head_tilt_threshold_deg=15
+        self,
+        ear_threshold=0.2,
+        min_frames_between_blinks=3,
+        head_tilt_threshold_deg=15,
+        window=30,
+        history_every=30,
     ):
         self.start_time = time.time()
         self.frame_counter = 0
 
+        # Bumped by every analysed frame; `results` is recomputed at most once per version
+        self.version = 0
+        self.frame_time = self.start_time
+        self._snapshot = None
+        self._snapshot_version = -1
+
         # Blink
         self.blink_counter = 0
         self.last_blink_frame = -min_frames_between_blinks
@@ -33,37 +45,34 @@ class FrameAnalyzer:
         self.last_tilt_direction = None
         self.head_tilt_threshold = head_tilt_threshold_deg
 
-        # Facial openness
-        self.mouth_openness_list = []
-        self.eye_openness_list = []
-        self.head_angle_list = []
+        # Facial openness: fixed-size windows for the state estimates, plus an
+        # optional downsampled long-term history (history_every=None disables it)
+        self.window = window
+        self.history_every = history_every
+        self.mouth_openness = RollingWindow(window)
+        self.eye_openness = RollingWindow(window)
+        self.head_angle = RollingWindow(window)
+        self.history = (
+            {
+                "eye_openness": DownsampledHistory(history_every),
+                "mouth_openness": DownsampledHistory(history_every),
+                "head_angle": DownsampledHistory(history_every),
+            }
+            if history_every
+            else None
+        )
 
         # Gaze tracking
-        self.gaze_history = deque(maxlen=30)
+        self.gaze_history = RollingMode(window)
 
         self.is_smiling = False
 
-    @staticmethod
-    def compute_distance(p1, p2):
-        return np.linalg.norm(np.array(p1) - np.array(p2))
+        # Per-frame landmark buffer shared by all detectors
+        self.geometry = LandmarkGeometry()
 
-    @staticmethod
-    def compute_ear(top, bottom, left, right):
-        vertical = FrameAnalyzer.compute_distance(top, bottom)
-        horizontal = FrameAnalyzer.compute_distance(left, right)
-        return vertical / (horizontal + 1e-6)
-
-    @staticmethod
-    def compute_head_tilt_angle(left_eye_outer, right_eye_outer):
-        dx = right_eye_outer[0] - left_eye_outer[0]
-        dy = right_eye_outer[1] - left_eye_outer[1]
-        return math.degrees(math.atan2(dy, dx))
-
-    def detect_blink(self, coords):
-        left_ear = self.compute_ear(coords[159], coords[145], coords[33], coords[133])
-        right_ear = self.compute_ear(coords[386], coords[374], coords[362], coords[263])
-        avg_ear = (left_ear + right_ear) / 2
-        self.eye_openness_list.append(avg_ear)
+    def detect_blink(self, measurements):
+        avg_ear = measurements.ear
+        self.eye_openness.push(avg_ear)
 
         if avg_ear < self.ear_threshold:
             if (
@@ -72,9 +81,9 @@ class FrameAnalyzer:
                 self.blink_counter += 1
                 self.last_blink_frame = self.frame_counter
 
-    def detect_head_tilt(self, coords):
-        angle = self.compute_head_tilt_angle(coords[33], coords[263])
-        self.head_angle_list.append(angle)
+    def detect_head_tilt(self, measurements):
+        angle = measurements.head_tilt_angle
+        self.head_angle.push(angle)
 
         if abs(angle) > self.head_tilt_threshold:
             current_dir = "right" if angle > 0 else "left"
@@ -84,35 +93,15 @@ class FrameAnalyzer:
         else:
             self.last_tilt_direction = None
 
-    def measure_mouth_openness(self, coords):
-        openness = self.compute_distance(coords[13], coords[14])
-        self.mouth_openness_list.append(openness)
-
-    def euclidean_distance(self, p1, p2):
-        return np.linalg.norm(np.array(p1) - np.array(p2))
+    def measure_mouth_openness(self, measurements):
+        self.mouth_openness.push(measurements.mouth_openness)
 
-    def detect_smile(self, coords):
-        left_lip = coords[61]
-        right_lip = coords[291]
-        top_lip = coords[13]
-        bottom_lip = coords[14]
-
-        horizontal_dist = self.euclidean_distance(left_lip, right_lip)
-        vertical_dist = self.euclidean_distance(top_lip, bottom_lip)
-
-        smile_ratio = horizontal_dist / vertical_dist
-
-        if smile_ratio > 3 and smile_ratio < 20:
-            self.is_smiling = True
-        else:
-            self.is_smiling = False
-
-    def detect_gaze_direction(self, coords):
-        def classify_eye_gaze(outer, inner, iris):
-            eye_width = self.compute_distance(outer, inner)
-            iris_to_outer = self.compute_distance(iris, outer)
-            ratio = iris_to_outer / (eye_width + 1e-6)
+    def detect_smile(self, measurements):
+        smile_ratio = measurements.smile_ratio
+        self.is_smiling = 3 < smile_ratio < 20
 
+    def detect_gaze_direction(self, measurements):
+        def classify_eye_gaze(ratio):
             if ratio < 0.35:
                 return "Left"
             elif ratio > 0.65:
@@ -120,8 +109,8 @@ class FrameAnalyzer:
             else:
                 return "Center"
 
-        left_gaze = classify_eye_gaze(coords[33], coords[133], coords[468])
-        right_gaze = classify_eye_gaze(coords[362], coords[263], coords[473])
+        left_gaze = classify_eye_gaze(measurements.left_gaze_ratio)
+        right_gaze = classify_eye_gaze(measurements.right_gaze_ratio)
 
         # If both eyes agree, it's reliable
         if left_gaze == right_gaze:
@@ -129,36 +118,46 @@ class FrameAnalyzer:
         else:
             gaze = "Uncertain"
 
-        self.gaze_history.append(gaze)
+        self.gaze_history.push(gaze)
 
     def analyze_frame(self, landmarks, image_shape):
-        h, w, _ = image_shape
-        coords = [(int(l.x * w), int(l.y * h)) for l in landmarks.landmark]
+        points = self.geometry.update(landmarks, image_shape)
+        self.analyze_points(points)
+
+    def analyze_points(self, points):
+        """Analyze one frame given an (N, 2) array of pixel-space landmarks."""
+        measurements = self.geometry.measure(points)
 
-        self.detect_blink(coords)
-        self.detect_head_tilt(coords)
-        self.measure_mouth_openness(coords)
-        self.detect_gaze_direction(coords)
-        self.detect_smile(coords)
+        self.detect_blink(measurements)
+        self.detect_head_tilt(measurements)
+        self.measure_mouth_openness(measurements)
+        self.detect_gaze_direction(measurements)
+        self.detect_smile(measurements)
+
+        if self.history is not None:
+            self.history["eye_openness"].push(measurements.ear)
+            self.history["mouth_openness"].push(measurements.mouth_openness)
+            self.history["head_angle"].push(measurements.head_tilt_angle)
 
         self.frame_counter += 1
+        self.frame_time = time.time()
+        self.version += 1
 
     @property
     def elapsed_minutes(self):
         return (time.time() - self.start_time) / 60.0
 
-    def estimate_states(self):
-        avg_ear = np.mean(self.eye_openness_list[-30:]) if self.eye_openness_list else 0
-        avg_mouth = (
-            np.mean(self.mouth_openness_list[-30:]) if self.mouth_openness_list else 0
-        )
-        avg_tilt = (
-            np.mean(np.abs(self.head_angle_list[-30:])) if self.head_angle_list else 0
-        )
-        blink_rate = self.blink_counter / (self.elapsed_minutes + 1e-6)
+    @property
+    def frame_minutes(self):
+        """Minutes from start to the last analysed frame."""
+        return (self.frame_time - self.start_time) / 60.0
 
-        gaze_mode = Counter(self.gaze_history).most_common(1)
-        gaze = gaze_mode[0][0] if gaze_mode else "Unknown"
+    def estimate_states(self):
+        avg_ear = self.eye_openness.mean()
+        avg_mouth = self.mouth_openness.mean()
+        avg_tilt = self.head_angle.abs_mean()
+        blink_rate = self.blink_counter / (self.frame_minutes + 1e-6)
+        gaze = self.gaze_history.mode("Unknown")
 
         confidence = (
             "High" if avg_tilt < 8 and avg_ear > 0.25 and blink_rate < 15 else "Low"
@@ -179,33 +178,84 @@ class FrameAnalyzer:
 
     @property
     def results(self):
+        """Metrics as of the last analysed frame.
+
+        Built once per frame and shared by every reader (overlay, logger,
+        exporters), so treat the returned dict as read-only.
+        """
+        if self._snapshot_version != self.version:
+            self._snapshot = self._build_results()
+            self._snapshot_version = self.version
+        return self._snapshot
+
+    def _build_results(self):
         state_estimates = self.estimate_states()
+        minutes = self.frame_minutes or 1e-6
         return {
-            "Time": round(time.time() - self.start_time, 2),
+            "Time": round(self.frame_time - self.start_time, 2),
             "Total Frames": self.frame_counter,
             "Blink Count": self.blink_counter,
             "Head Tilt Count": self.head_tilt_counter,
             "Smiling": self.is_smiling,
-            "Blink Frequency (per min)": round(
-                self.blink_counter / self.elapsed_minutes, 2
-            ),
-            "Head Tilt Frequency (per min)": round(
-                self.head_tilt_counter / self.elapsed_minutes, 2
-            ),
-            "Elapsed Time (min)": round(self.elapsed_minutes, 2),
+            "Blink Frequency (per min)": round(self.blink_counter / minutes, 2),
+            "Head Tilt Frequency (per min)": round(self.head_tilt_counter / minutes, 2),
+            "Elapsed Time (min)": round(self.frame_minutes, 2),
             **state_estimates,
         }
 
     def reset(self):
         self.__init__(
-            self.ear_threshold, self.min_frames_between_blinks, self.head_tilt_threshold
+            self.ear_threshold,
+            self.min_frames_between_blinks,
+            self.head_tilt_threshold,
+            self.window,
+            self.history_every,
         )
 
     @property
     def history_data(self):
-        return {
-            "eye_openness": self.eye_openness_list,
-            "mouth_openness": self.mouth_openness_list,
-            "head_angle": self.head_angle_list,
-            "gaze_history": list(self.gaze_history),
-        }
+        # Long-term series are one mean per `history_every` frames; without
+        # history only the current window is available
+        if self.history is not None:
+            series = {name: h.values() for name, h in self.history.items()}
+        else:
+            series = {
+                "eye_openness": self.eye_openness.values(),
+                "mouth_openness": self.mouth_openness.values(),
+                "head_angle": self.head_angle.values(),
+            }
+        return {**series, "gaze_history": list(self.gaze_history)}
+
+
+def empty_face_state():
+    """Per-session face counters, filled frame by frame by ``update_face_state``."""
+    return {
+        "frames": 0,
+        "blink_count": 0,
+        "head_tilt_count": 0,
+        "smile_frames": 0,
+        "ear_sum": 0.0,
+        "mouth_sum": 0.0,
+        "abs_tilt_sum": 0.0,
+        "gaze": Counter(),
+    }
+
+
+def update_face_state(state, analyzer, points):
+    """Analyse one frame's face ``points`` and add them to ``state``."""
+    analyzer.analyze_points(points)
+    state["frames"] += 1
+    state["ear_sum"] += analyzer.eye_openness.last
+    state["mouth_sum"] += analyzer.mouth_openness.last
+    state["abs_tilt_sum"] += abs(analyzer.head_angle.last)
+    state["smile_frames"] += analyzer.is_smiling
+    state["gaze"][analyzer.gaze_history.last] += 1
+
+
+def face_state(state, analyzer):
+    """Face counters plus the blink and tilt events counted by ``analyzer``."""
+    return {
+        **state,
+        "blink_count": analyzer.blink_counter,
+        "head_tilt_count": analyzer.head_tilt_counter,
+    }
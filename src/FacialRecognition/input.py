@@ -9,11 +9,82 @@ __updated__ = Sat Jun 21 2025
 -------------------------------------------------------
 """
 
+import time
+from typing import NamedTuple
+
 import cv2 as cv
+import numpy as np
+
+from profiling import timer
 
 
-def get_video_capture(index=0):
-    cap = cv.VideoCapture(index)
+def get_video_capture(source=0):
+    cap = cv.VideoCapture(source)
     if not cap.isOpened():
-        raise RuntimeError("Cannot open webcam")
+        raise RuntimeError(f"Cannot open video source {source!r}")
     return cap
+
+
+class Frame(NamedTuple):
+    index: int
+    timestamp: float
+    bgr: np.ndarray
+    rgb: np.ndarray  # read-only, shared by every model
+
+
+class FrameSource:
+    """Decode each frame once, convert it to RGB once and hand both out.
+
+    ``source`` is anything ``cv.VideoCapture`` accepts: a webcam index or a
+    video path. Timestamps are wall-clock for webcams and media time for
+    files, so offline runs are independent of processing speed.
+    """
+
+    def __init__(self, source=0, cap=None):
+        self.cap = cap if cap is not None else get_video_capture(source)
+        # Webcams report no frame count; files do
+        self.is_file = self.cap.get(cv.CAP_PROP_FRAME_COUNT) > 0
+        self.fps = self.cap.get(cv.CAP_PROP_FPS) or 30.0
+        self.index = 0
+
+    def read(self):
+        with timer("decode"):
+            success, bgr = self.cap.read()
+        if not success:
+            return None
+
+        if self.is_file:
+            timestamp = self.index / self.fps
+        else:
+            timestamp = time.time()
+
+        with timer("color_convert"):
+            rgb = cv.cvtColor(bgr, cv.COLOR_BGR2RGB)
+        rgb.flags.writeable = False  # lets MediaPipe borrow instead of copy
+
+        frame = Frame(self.index, timestamp, bgr, rgb)
+        self.index += 1
+        return frame
+
+    def seek(self, frame_index):
+        self.cap.set(cv.CAP_PROP_POS_FRAMES, frame_index)
+        self.index = frame_index
+
+    def is_opened(self):
+        return self.cap.isOpened()
+
+    def __iter__(self):
+        while self.cap.isOpened():
+            frame = self.read()
+            if frame is None:
+                return
+            yield frame
+
+    def release(self):
+        self.cap.release()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
@@ -0,0 +1,147 @@
+"""-------------------------------------------------------
+PresenceAI: Threaded capture / inference / render pipeline
+-------------------------------------------------------
+Uses:    OpenCV
+-------------------------------------------------------
+"""
+
+import queue
+import threading
+import time
+from collections import deque
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+DROP = "drop"  # live: keep only the freshest frames, discard stale ones
+BLOCK = "block"  # offline: never lose a frame, back-pressure the producer
+
+_STOP = object()
+
+
+@dataclass
+class PipelineItem:
+    frame: Any
+    captured_at: float
+    result: Any = None
+    inferred_at: float = 0.0
+    latency: float = 0.0  # capture -> render finished, seconds
+
+
+class StagedPipeline:
+    """Capture and inference run on worker threads; render runs on the caller.
+
+    OpenCV windows must be driven from the thread that created them, so the
+    render/log stage is the thread that calls ``run``. Stages are linked by
+    bounded queues; with the ``drop`` policy a full queue discards its oldest
+    item so a slow stage always works on the newest frame, with ``block`` the
+    upstream stage waits instead.
+    """
+
+    def __init__(self, source, infer, policy=DROP, queue_size=None, history=300):
+        if policy not in (DROP, BLOCK):
+            raise ValueError(f"Unknown queue policy: {policy}")
+        if queue_size is None:
+            # A single slot keeps live latency to at most one frame of queueing
+            queue_size = 1 if policy == DROP else 8
+
+        self.source = source
+        self.infer = infer
+        self.policy = policy
+        self.captured = queue.Queue(maxsize=queue_size)
+        self.inferred = queue.Queue(maxsize=queue_size)
+
+        self.dropped = 0
+        self.latencies = deque(maxlen=history)
+        self._stop = threading.Event()
+        self._threads = []
+
+    def _put(self, q, item):
+        while self.policy == BLOCK and not self._stop.is_set():
+            try:
+                q.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+        # Drop policy, or shutting down: make room by evicting the oldest item
+        while True:
+            try:
+                q.put_nowait(item)
+                return
+            except queue.Full:
+                self._discard_oldest(q)
+
+    def _discard_oldest(self, q):
+        try:
+            q.get_nowait()
+            self.dropped += 1
+        except queue.Empty:
+            pass
+
+    def _capture_loop(self):
+        while not self._stop.is_set() and self.source.is_opened():
+            frame = self.source.read()
+            if frame is None:
+                if self.source.is_file:
+                    break
+                continue
+            self._put(self.captured, PipelineItem(frame, time.perf_counter()))
+        self._put(self.captured, _STOP)
+
+    def _inference_loop(self):
+        while True:
+            item = self.captured.get()
+            if item is _STOP or self._stop.is_set():
+                break  # stopping: frames still queued are not inferred
+            item.result = self.infer(item.frame)
+            item.inferred_at = time.perf_counter()
+            self._put(self.inferred, item)
+        self._put(self.inferred, _STOP)
+
+    def start(self):
+        for target in (self._capture_loop, self._inference_loop):
+            thread = threading.Thread(target=target, daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self):
+        """Stop and wait for both stages; ``infer`` is not running once this returns."""
+        self._stop.set()
+        for thread in self._threads:
+            # No timeout: callers flush and release what ``infer`` uses next
+            thread.join()
+        self._threads.clear()
+
+    def run(self, render):
+        """Call ``render(item)`` for every inferred frame until it returns False."""
+        self.start()
+        try:
+            while True:
+                item = self.inferred.get()
+                if item is _STOP:
+                    break
+                keep_going = render(item)
+                item.latency = time.perf_counter() - item.captured_at
+                self.latencies.append(item.latency)
+                if keep_going is False:
+                    break
+        finally:
+            self.stop()
+
+    @property
+    def last_latency(self):
+        return self.latencies[-1] if self.latencies else 0.0
+
+    def latency_stats(self):
+        """p50/p95/max end-to-end latency in milliseconds over recent frames."""
+        if not self.latencies:
+            return {"p50_ms": 0.0, "p95_ms": 0.0, "max_ms": 0.0, "dropped": 0}
+        ms = np.fromiter(self.latencies, dtype=np.float64) * 1000
+        return {
+            "p50_ms": round(float(np.percentile(ms, 50)), 1),
+            "p95_ms": round(float(np.percentile(ms, 95)), 1),
+            "max_ms": round(float(ms.max()), 1),
+            "dropped": self.dropped,
+        }
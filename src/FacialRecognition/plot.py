@@ -1,8 +1,23 @@
+import os
+import sys
+
+import numpy as np
 import pandas as pd
 import matplotlib.pyplot as plt
 
-# Read the CSV
-df = pd.read_csv("emotions_log.csv")
+# Read the log: the columnar .npz from NpzLogger if present, else the CSV
+if len(sys.argv) > 1:
+    log_path = sys.argv[1]
+elif os.path.exists("emotions_log.npz"):
+    log_path = "emotions_log.npz"
+else:
+    log_path = "emotions_log.csv"
+
+if log_path.endswith(".npz"):
+    with np.load(log_path) as columns:
+        df = pd.DataFrame({name: columns[name] for name in columns.files})
+else:
+    df = pd.read_csv(log_path)
 
 # Map categorical emotional states to numbers for plotting
 state_map = {"Low": 0, "Uncertain": 0.5, "High": 1}
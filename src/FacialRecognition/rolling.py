@@ -0,0 +1,150 @@
+"""-------------------------------------------------------
+PresenceAI: Fixed-memory rolling statistics
+-------------------------------------------------------
+Uses:    NumPy
+-------------------------------------------------------
+"""
+
+from collections import deque
+
+import numpy as np
+
+
+class RollingWindow:
+    """Ring buffer over the last ``size`` values with O(1) windowed means.
+
+    Running sums of the values and of their absolute values are updated on
+    every push and recomputed exactly once per wrap-around, so float error
+    cannot accumulate over long sessions.
+    """
+
+    def __init__(self, size=30):
+        self.size = size
+        self._buffer = np.zeros(size, dtype=np.float64)
+        self._index = 0
+        self.count = 0
+        self._sum = 0.0
+        self._abs_sum = 0.0
+
+    def push(self, value):
+        value = float(value)
+        old = self._buffer[self._index]
+        self._buffer[self._index] = value
+        self._sum += value - old
+        self._abs_sum += abs(value) - abs(old)
+
+        self._index += 1
+        if self._index == self.size:
+            self._index = 0
+            self._sum = float(self._buffer.sum())
+            self._abs_sum = float(np.abs(self._buffer).sum())
+        self.count += 1
+
+    def __len__(self):
+        return min(self.count, self.size)
+
+    def mean(self):
+        n = len(self)
+        return self._sum / n if n else 0.0
+
+    def abs_mean(self):
+        n = len(self)
+        return self._abs_sum / n if n else 0.0
+
+    @property
+    def last(self):
+        return float(self._buffer[self._index - 1]) if self.count else None
+
+    def values(self):
+        """Window contents, oldest first (a copy)."""
+        if self.count < self.size:
+            return self._buffer[: self.count].copy()
+        return np.roll(self._buffer, -self._index)
+
+    def clear(self):
+        self.__init__(self.size)
+
+
+class DownsampledHistory:
+    """Long-term history that keeps one mean per ``every`` pushed values.
+
+    At ``every=30`` an hour at 30 FPS is 3600 floats instead of 108k. Storage
+    grows by doubling; pass ``capacity`` to keep only the newest blocks.
+    """
+
+    def __init__(self, every=30, capacity=None):
+        self.every = every
+        self.capacity = capacity
+        self._blocks = RollingWindow(capacity) if capacity else None
+        self._data = np.zeros(64, dtype=np.float64)
+        self._length = 0
+        self._block_sum = 0.0
+        self._block_count = 0
+
+    def push(self, value):
+        self._block_sum += value
+        self._block_count += 1
+        if self._block_count == self.every:
+            self._append(self._block_sum / self.every)
+            self._block_sum = 0.0
+            self._block_count = 0
+
+    def _append(self, value):
+        if self._blocks is not None:
+            self._blocks.push(value)
+            return
+        if self._length == len(self._data):
+            self._data = np.resize(self._data, 2 * len(self._data))
+        self._data[self._length] = value
+        self._length += 1
+
+    def values(self):
+        if self._blocks is not None:
+            return self._blocks.values()
+        return self._data[: self._length].copy()
+
+    def __len__(self):
+        return len(self._blocks) if self._blocks is not None else self._length
+
+
+class RollingMode:
+    """Most common label over the last ``size`` labels, updated in O(1).
+
+    Ties go to the label that appears earliest in the window, exactly like
+    ``Counter(window).most_common(1)``.
+    """
+
+    def __init__(self, size=30):
+        self.size = size
+        self._labels = deque(maxlen=size)
+        self._positions = {}  # label -> frame indices of its occurrences, oldest first
+        self._pushed = 0
+
+    def push(self, label):
+        if len(self._labels) == self.size:
+            oldest = self._labels[0]
+            positions = self._positions[oldest]
+            positions.popleft()
+            if not positions:
+                del self._positions[oldest]
+        self._labels.append(label)
+        self._positions.setdefault(label, deque()).append(self._pushed)
+        self._pushed += 1
+
+    def mode(self, default=None):
+        if not self._positions:
+            return default
+        return max(
+            self._positions,
+            key=lambda l: (len(self._positions[l]), -self._positions[l][0]),
+        )
+
+    @property
+    def last(self):
+        return self._labels[-1] if self._labels else None
+
+    def __len__(self):
+        return len(self._labels)
+
+    def __iter__(self):
+        return iter(self._labels)
@@ -0,0 +1,136 @@
+"""-------------------------------------------------------
+PresenceAI: Face ROI tracking and strided mesh inference
+-------------------------------------------------------
+Uses:    OpenCV, MediaPipe
+-------------------------------------------------------
+"""
+
+from typing import Any, NamedTuple, Optional
+
+import numpy as np
+
+from FacialRecognition.feature_extraction import Detector
+from FacialRecognition.geometry import LandmarkGeometry
+
+
+class TrackedFace(NamedTuple):
+    frame: Any
+    box: Optional[tuple]  # (rows, cols) slices; None for interpolated frames
+    landmarks: Optional[Any]  # MediaPipe landmarks; None for interpolated frames
+    points: Optional[np.ndarray]  # (N, 2) full-frame pixel coordinates
+
+
+class FaceTracker:
+    """Run FaceMesh on the previous face ROI instead of re-detecting every frame.
+
+    The full-frame FaceDetection model only runs on the first frame, every
+    ``redetect_interval`` frames, and whenever FaceMesh loses the face in the
+    tracked ROI (it returns no landmarks once its tracking confidence falls
+    under ``min_tracking_confidence``). ``redetect_interval=0`` detects every
+    frame like ``Detector.detect_face``. Interpolated frames count towards
+    the interval, so with ``stride > 1`` detection runs on the first keyframe
+    at least ``redetect_interval`` frames after the last one.
+
+    With ``stride > 1`` FaceMesh only runs on every ``stride``-th frame and
+    the frames in between get landmarks linearly interpolated from the two
+    surrounding keyframes. Those frames are held back until the next keyframe
+    arrives, so ``process`` returns them in order, up to ``stride`` at a time,
+    and ``flush`` must be called at the end of a stream.
+    """
+
+    def __init__(self, detector=None, redetect_interval=30, stride=1):
+        self.detector = detector or Detector()
+        self.redetect_interval = redetect_interval
+        self.stride = max(1, stride)
+        self.geometry = LandmarkGeometry()
+
+        self.detector_runs = 0
+        self.mesh_runs = 0
+
+        self._roi = None
+        self._since_detect = 0
+        self._pending = []
+        self._keyframe = None  # (frame index, points) of the last keyframe
+
+    def track(self, frame):
+        """Return (box, landmarks, points) for one frame, or (None, None, None)."""
+        rgb = frame.rgb
+        use_roi = self._roi is not None and self._since_detect < self.redetect_interval
+        if use_roi:
+            box = self._roi
+        else:
+            box = self.detector.locate_face(rgb)
+            self.detector_runs += 1
+            self._since_detect = 0
+
+        if box is None:
+            self._roi = None
+            return None, None, None
+
+        face_rgb = rgb[box]
+        results = self.detector.process_face(frame.bgr[box], face_rgb)
+        self.mesh_runs += 1
+        self._since_detect += 1
+
+        if not results.multi_face_landmarks:
+            self._roi = None
+            if use_roi:
+                # Lost the face inside the tracked ROI: re-detect on this frame
+                return self.track(frame)
+            return None, None, None
+
+        landmarks = results.multi_face_landmarks[0]
+        points = self.geometry.update(landmarks, face_rgb.shape).copy()
+        points[:, 0] += box[1].start
+        points[:, 1] += box[0].start
+        self._roi = self._roi_from_points(points, rgb.shape)
+        return box, landmarks, points
+
+    @staticmethod
+    def _roi_from_points(points, frame_shape):
+        # Same padding rule as Detector.locate_face so crops stay comparable
+        h, w = frame_shape[:2]
+        margin = int(h * 0.1)
+        x0, y0 = np.floor(points.min(axis=0)).astype(int) - margin
+        x1, y1 = np.ceil(points.max(axis=0)).astype(int) + margin
+        x0, y0 = max(x0, 0), max(y0, 0)
+        x1, y1 = min(x1, w), min(y1, h)
+        if x1 <= x0 or y1 <= y0:
+            return None
+        return slice(y0, y1), slice(x0, x1)
+
+    def process(self, frame):
+        """Feed one Frame; return the TrackedFace results that are now final."""
+        keyframe = self._keyframe
+        if keyframe is None or frame.index - keyframe[0] >= self.stride:
+            box, landmarks, points = self.track(frame)
+            ready = self._interpolate_pending(frame.index, points)
+            ready.append(TrackedFace(frame, box, landmarks, points))
+            self._keyframe = (frame.index, points)
+            return ready
+
+        self._pending.append(frame)
+        self._since_detect += 1
+        return []
+
+    def flush(self):
+        """Release frames still waiting for a keyframe, holding the last landmarks."""
+        points = self._keyframe[1] if self._keyframe else None
+        ready = [TrackedFace(f, None, None, points) for f in self._pending]
+        self._pending.clear()
+        return ready
+
+    def _interpolate_pending(self, index, points):
+        pending, self._pending = self._pending, []
+        if not pending:
+            return []
+
+        start = self._keyframe
+        if start is None or start[1] is None or points is None:
+            return [TrackedFace(f, None, None, None) for f in pending]
+
+        start_index, start_points = start
+        t = np.array([f.index for f in pending], dtype=np.float32)
+        t = (t - start_index) / (index - start_index)
+        between = start_points + t[:, None, None] * (points - start_points)
+        return [TrackedFace(f, None, None, p) for f, p in zip(pending, between)]
@@ -0,0 +1,179 @@
+# asr_backends.py
+"""
+Pluggable speech‑recognition engines behind `transcribe_audio`.
+
+Every backend takes the shared 16 kHz float32 waveform and returns Whisper's result layout,
+so everything downstream (fillers, pace, lexical metrics, streaming) is engine‑agnostic:
+
+```python
+{"text": str, "language": str | None,
+ "segments": [{"start": s, "end": s, "text": str,
+               "words": [{"word": " hello", "start": s, "end": s, "probability": p}, …]}, …]}
+```
+
+| name             | engine                                  | CPU precision   |
+|------------------|-----------------------------------------|-----------------|
+| `openai-whisper` | reference PyTorch implementation        | fp32            |
+| `faster-whisper` | CTranslate2 (`pip install faster-whisper`) | int8 (default) |
+| `whisper.cpp`    | ggml via `pip install pywhispercpp`     | quantised ggml  |
+
+The default comes from `PRESENCEAI_ASR_BACKEND` (falling back to `openai-whisper`). Backends
+are cheap to construct; the model itself is loaded through `model_registry` on first use (or
+by `load()`, which worker processes call to preload it).
+Each backend has a `model_id`, which is part of the analysis‑cache keys, so switching engines
+never reuses another engine's transcript. `asr_benchmark.py` compares them on a clip set.
+"""
+
+from __future__ import annotations
+
+import os
+import re
+from typing import Dict, List, Optional
+
+import numpy as np
+
+from model_registry import get_faster_whisper_model, get_whisper_cpp_model, get_whisper_model
+
+DEFAULT_BACKEND = os.getenv("PRESENCEAI_ASR_BACKEND", "openai-whisper")
+
+_SENTENCE_END = re.compile(r"[.!?]$")
+
+
+class ASRBackend:
+    name = ""
+
+    def __init__(self, model_name: str = "base", device: str = "cpu", download_root: Optional[str] = None):
+        self.model_name = model_name
+        self.device = device
+        self.download_root = download_root
+
+    @property
+    def model_id(self) -> str:
+        return f"{self.name}/{self.model_name}"
+
+    def load(self):
+        """The engine's model, loaded once per process through `model_registry`."""
+        raise NotImplementedError
+
+    def transcribe(
+        self,
+        audio: np.ndarray,
+        initial_prompt: Optional[str] = None,
+        language: Optional[str] = None,
+        word_timestamps: bool = True,
+    ) -> Dict:
+        """Transcribe a 16 kHz waveform; `words` lists are empty without `word_timestamps`."""
+        raise NotImplementedError
+
+
+class OpenAIWhisperBackend(ASRBackend):
+    name = "openai-whisper"
+
+    @property
+    def model_id(self) -> str:
+        return f"whisper/{self.model_name}"  # the id cached transcripts were stored under
+
+    def load(self):
+        return get_whisper_model(self.model_name, download_root=self.download_root)
+
+    def transcribe(self, audio, initial_prompt=None, language=None, word_timestamps=True) -> Dict:
+        return self.load().transcribe(
+            audio,
+            word_timestamps=word_timestamps,
+            verbose=False,
+            initial_prompt=initial_prompt,
+            language=language,
+        )
+
+
+class FasterWhisperBackend(ASRBackend):
+    name = "faster-whisper"
+
+    def __init__(self, model_name="base", device="cpu", download_root=None, compute_type="int8", cpu_threads=0):
+        super().__init__(model_name, device, download_root)
+        self.compute_type = compute_type
+        self.cpu_threads = cpu_threads
+
+    @property
+    def model_id(self) -> str:
+        return f"{self.name}/{self.model_name}/{self.compute_type}"
+
+    def load(self):
+        return get_faster_whisper_model(
+            self.model_name, self.device, self.compute_type, self.cpu_threads, self.download_root
+        )
+
+    def transcribe(self, audio, initial_prompt=None, language=None, word_timestamps=True) -> Dict:
+        segments, info = self.load().transcribe(
+            audio, word_timestamps=word_timestamps, initial_prompt=initial_prompt, language=language
+        )
+        out = [
+            {
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end, "probability": w.probability}
+                    for w in seg.words or ()
+                ],
+            }
+            for seg in segments  # a generator: decoding happens while iterating
+        ]
+        return {"text": "".join(seg["text"] for seg in out), "segments": out, "language": info.language}
+
+
+class WhisperCppBackend(ASRBackend):
+    name = "whisper.cpp"
+
+    def __init__(self, model_name="base", device="cpu", download_root=None, n_threads=0):
+        super().__init__(model_name, device, download_root)
+        self.n_threads = n_threads
+
+    def load(self):
+        return get_whisper_cpp_model(self.model_name, self.n_threads, self.download_root)
+
+    def transcribe(self, audio, initial_prompt=None, language=None, word_timestamps=True) -> Dict:
+        model = self.load()
+        params = {"token_timestamps": True, "max_len": 1, "split_on_word": True} if word_timestamps else {}
+        if initial_prompt:
+            params["initial_prompt"] = initial_prompt
+        if language:
+            params["language"] = language
+        # With max_len=1 every whisper.cpp segment is one word; t0/t1 are in centiseconds
+        pieces = [
+            {"word": seg.text, "start": seg.t0 / 100, "end": seg.t1 / 100}
+            for seg in model.transcribe(np.asarray(audio, dtype=np.float32), **params)
+            if seg.text.strip()
+        ]
+        if word_timestamps:
+            segments = _group_words(pieces)
+        else:
+            segments = [{"start": p["start"], "end": p["end"], "text": p["word"], "words": []} for p in pieces]
+        return {"text": "".join(seg["text"] for seg in segments), "segments": segments, "language": language}
+
+
+def _group_words(words: List[Dict]) -> List[Dict]:
+    """Split a flat word list into sentence segments."""
+    segments, current = [], []
+    for w in words:
+        current.append(w)
+        if _SENTENCE_END.search(w["word"].strip()):
+            segments.append(current)
+            current = []
+    if current:
+        segments.append(current)
+    return [
+        {"start": ws[0]["start"], "end": ws[-1]["end"], "text": "".join(w["word"] for w in ws), "words": ws}
+        for ws in segments
+    ]
+
+
+BACKENDS = {cls.name: cls for cls in (OpenAIWhisperBackend, FasterWhisperBackend, WhisperCppBackend)}
+
+
+def get_backend(name: Optional[str] = None, model_name: str = "base", **options) -> ASRBackend:
+    """Backend `name` (default `PRESENCEAI_ASR_BACKEND`) for `model_name`; loads nothing yet."""
+    name = name or DEFAULT_BACKEND
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ASR backend {name!r}; choose one of {sorted(BACKENDS)}")
+    return BACKENDS[name](model_name, **options)
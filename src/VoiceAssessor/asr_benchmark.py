@@ -0,0 +1,133 @@
+# asr_benchmark.py
+"""
+Compare ASR backends on a fixed clip set: real‑time factor (RTF) and word error rate (WER).
+
+The clip set is a directory of audio files, each with a reference transcript next to it
+(`interview01.wav` + `interview01.txt`). Every backend transcribes every clip with word
+timestamps on, exactly as `assess_voice` calls it; model loading and one warm‑up clip are
+excluded from the timings.
+
+```bash
+python asr_benchmark.py clips/ --backends openai-whisper faster-whisper whisper.cpp --model base
+```
+
+RTF is transcription time / audio duration (below 1.0 is faster than real time; NaN for
+empty audio). WER is the word‑level edit distance to the reference over the number of
+reference words, after lower‑casing and stripping punctuation.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Tuple
+
+import numpy as np
+
+from asr_backends import BACKENDS, get_backend
+from audio_io import duration_sec, load_audio
+
+AUDIO_SUFFIXES = {".wav", ".flac", ".mp3", ".ogg", ".m4a", ".mp4", ".webm"}
+
+
+def normalise_words(text: str) -> List[str]:
+    return re.findall(r"[a-z0-9']+", text.lower())
+
+
+def word_edits(reference: str, hypothesis: str) -> Tuple[int, int]:
+    """(word-level edit distance, number of reference words)."""
+    ref, hyp = normalise_words(reference), normalise_words(hypothesis)
+    # Levenshtein distance over words, one DP row at a time
+    row = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, start=1):
+        prev, row = row, [i]
+        for j, h in enumerate(hyp, start=1):
+            row.append(min(prev[j] + 1, row[j - 1] + 1, prev[j - 1] + (r != h)))
+    return row[-1], len(ref)
+
+
+def word_error_rate(reference: str, hypothesis: str) -> float:
+    edits, ref_words = word_edits(reference, hypothesis)
+    if not ref_words:
+        return float(edits > 0)
+    return edits / ref_words
+
+
+def load_clips(directory: Path) -> List[Tuple[str, np.ndarray, str]]:
+    clips = []
+    for path in sorted(directory.iterdir()):
+        reference = path.with_suffix(".txt")
+        if path.suffix.lower() in AUDIO_SUFFIXES and reference.exists():
+            clips.append((path.name, load_audio(path), reference.read_text(encoding="utf-8")))
+    if not clips:
+        raise FileNotFoundError(f"No audio files with a matching .txt reference in {directory}")
+    return clips
+
+
+def benchmark_backend(name: str, model_name: str, clips: List[Tuple[str, np.ndarray, str]], **options) -> Dict:
+    backend = get_backend(name, model_name, **options)
+    backend.transcribe(clips[0][1][: 16000 * 5])  # load + warm up
+
+    per_clip = []
+    # Corpus totals stay unrounded; only the reported values are rounded
+    total_audio = total_asr = 0.0
+    total_edits = total_ref_words = 0
+    for clip, audio, reference in clips:
+        start = time.perf_counter()
+        result = backend.transcribe(audio)
+        elapsed = time.perf_counter() - start
+        audio_sec = duration_sec(audio)
+        edits, ref_words = word_edits(reference, result["text"])
+        total_audio += audio_sec
+        total_asr += elapsed
+        total_edits += edits
+        total_ref_words += ref_words
+        per_clip.append(
+            {
+                "clip": clip,
+                "audio_sec": round(audio_sec, 2),
+                "asr_sec": round(elapsed, 3),
+                "rtf": round(elapsed / audio_sec if audio_sec else float("nan"), 4),
+                "wer": round(edits / ref_words if ref_words else float(edits > 0), 4),
+            }
+        )
+
+    return {
+        "backend": name,
+        "model_id": backend.model_id,
+        "rtf": round(total_asr / total_audio if total_audio else float("nan"), 4),
+        # Corpus WER: errors summed over clips / reference words summed over clips
+        "wer": round(total_edits / max(total_ref_words, 1), 4),
+        "clips": per_clip,
+    }
+
+
+def _cli():
+    parser = argparse.ArgumentParser(description="Benchmark ASR backends: real-time factor and WER")
+    parser.add_argument("clips", type=Path, help="Directory of audio clips with same-name .txt references")
+    parser.add_argument("--backends", nargs="+", choices=sorted(BACKENDS), default=sorted(BACKENDS))
+    parser.add_argument("--model", default="base", help="Model size for every backend")
+    parser.add_argument("--json-out", type=Path, default=None, help="Optional path to write the full results")
+    args = parser.parse_args()
+
+    clips = load_clips(args.clips)
+    results = []
+    for name in args.backends:
+        try:
+            results.append(benchmark_backend(name, args.model, clips))
+        except ImportError as e:
+            print(f"Skipping {name}: not installed ({e})")
+
+    print(f"{'backend':<16} {'model':<28} {'RTF':>8} {'WER':>8}")
+    for r in results:
+        print(f"{r['backend']:<16} {r['model_id']:<28} {r['rtf']:>8.3f} {r['wer']:>8.3f}")
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(results, f, indent=2)
+
+
+if __name__ == "__main__":
+    _cli()
@@ -0,0 +1,65 @@
+# audio_io.py
+"""
+Audio loading for the Voice Assessor.
+
+Every analysis stage works on the same in‑memory waveform: mono, float32, 16 kHz (the rate
+Whisper, webrtcvad and the SpeechBrain emotion model all expect). `load_audio` decodes
+a file exactly once; formats libsndfile cannot read (mp3, mp4, webm …) are decoded by
+ffmpeg straight to raw PCM on stdout, so no temporary files are written.
+"""
+
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+from typing import Optional
+
+import librosa
+import numpy as np
+import soundfile as sf
+
+SAMPLE_RATE = 16000
+
+
+def to_mono_16k(audio: np.ndarray, sr: int, target_sr: int = SAMPLE_RATE) -> np.ndarray:
+    """Down‑mix `audio` (samples[, channels]) to mono float32 at `target_sr`."""
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1, dtype=np.float32)
+    if sr != target_sr:
+        audio = librosa.resample(audio, orig_sr=sr, target_sr=target_sr)
+    return np.ascontiguousarray(audio, dtype=np.float32)
+
+
+def _ffmpeg_decode(path: Path, sr: int) -> np.ndarray:
+    cmd = [
+        "ffmpeg", "-nostdin", "-v", "error",
+        "-i", str(path),
+        "-f", "f32le", "-ac", "1", "-ar", str(sr),
+        "pipe:1",
+    ]
+    proc = subprocess.run(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, check=True)
+    return np.frombuffer(proc.stdout, dtype=np.float32)
+
+
+def load_audio(path: str | Path, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """Decode an audio/video file once into a mono float32 waveform at `sr`."""
+    path = Path(path)
+    if not path.exists():
+        raise FileNotFoundError(path)
+    try:
+        audio, file_sr = sf.read(str(path), dtype="float32", always_2d=False)
+    except RuntimeError:  # libsndfile cannot read this container, let ffmpeg do it
+        return _ffmpeg_decode(path, sr)
+    return to_mono_16k(audio, file_sr, sr)
+
+
+def as_waveform(audio: str | Path | np.ndarray, sr: Optional[int] = None) -> np.ndarray:
+    """Accept a path or an in‑memory array and return the shared 16 kHz waveform."""
+    if isinstance(audio, np.ndarray):
+        return to_mono_16k(audio, sr or SAMPLE_RATE)
+    return load_audio(audio)
+
+
+def duration_sec(audio: np.ndarray, sr: int = SAMPLE_RATE) -> float:
+    return len(audio) / sr
@@ -0,0 +1,187 @@
+# filler_detector.py
+"""
+Filler‑word detection with a token‑level Aho–Corasick automaton.
+
+Filler phrases ("um", "you know", …) are compiled once into a trie over **tokens** with
+failure links, and a transcript is scanned in one linear pass, so multi‑word fillers are
+found even though Whisper returns one word at a time. Overlapping hits are resolved
+leftmost‑longest, so "you know" is one filler, not two.
+
+Tokens are lower‑cased words with contractions kept whole ("I'm" is one token). Repeated
+letters are collapsed only when matching, so "umm", "uhhh" and "hmmmm" match "um", "uh"
+and "hmm" while the tokens themselves stay as spoken. `filler_ratio` is fillers per word:
+per Whisper word for `analyse_words`, per token for text.
+
+```python
+detector = FillerDetector({"um", "uh", "you know"})
+detector.analyse_text("So um, you know, it works")["filler_count"]  # 2
+detector.analyse_words(whisper_words)  # adds per‑occurrence start/end seconds
+```
+
+`FillerStream` applies the same matching to words that arrive over time (live ASR): a hit
+is final once enough following tokens are known that no longer phrase could replace it.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import deque
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+_TOKEN = re.compile(r"\w+(?:'\w+)*")
+_REPEATS = re.compile(r"(\w)\1+")
+
+
+@lru_cache(maxsize=65536)
+def normalise_token(token: str) -> str:
+    """Matching key of a token: lower‑cased, repeated letters collapsed ("umm" -> "um")."""
+    return _REPEATS.sub(r"\1", token.lower())
+
+
+def tokenize(text: str) -> List[str]:
+    return _TOKEN.findall(text.lower().replace("\u2019", "'"))
+
+
+class FillerDetector:
+    def __init__(self, fillers: Iterable[str]):
+        # Trie over tokens: per node a child map, failure link and the phrase ending here
+        self._children: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._phrase: List[Optional[Tuple[str, int]]] = [None]  # (filler, n_tokens)
+        self._dict_link: List[int] = [-1]  # nearest proper suffix node that ends a phrase
+        self.max_tokens = 1  # longest phrase, in tokens
+
+        for filler in fillers:
+            tokens = [normalise_token(t) for t in tokenize(filler)]
+            if not tokens:
+                continue
+            node = 0
+            for token in tokens:
+                node = self._child(node, token)
+            self._phrase[node] = (filler, len(tokens))
+            self.max_tokens = max(self.max_tokens, len(tokens))
+        self._link()
+
+    def _child(self, node: int, token: str) -> int:
+        nxt = self._children[node].get(token)
+        if nxt is None:
+            nxt = len(self._children)
+            self._children[node][token] = nxt
+            self._children.append({})
+            self._fail.append(0)
+            self._phrase.append(None)
+            self._dict_link.append(-1)
+        return nxt
+
+    def _link(self) -> None:
+        queue = deque(self._children[0].values())
+        while queue:
+            node = queue.popleft()
+            for token, child in self._children[node].items():
+                f = self._fail[node]
+                while f and token not in self._children[f]:
+                    f = self._fail[f]
+                target = self._children[f].get(token, 0)
+                self._fail[child] = target if target != child else 0
+                fail = self._fail[child]
+                self._dict_link[child] = fail if self._phrase[fail] else self._dict_link[fail]
+                queue.append(child)
+
+    # ------------------------------------------------------------------
+    # Scanning
+    # ------------------------------------------------------------------
+
+    def find(self, tokens: Sequence[str]) -> List[Tuple[int, int, str]]:
+        """Non‑overlapping (start, end, filler) token spans, leftmost‑longest first."""
+        hits = []
+        node = 0
+        children, fail, phrase, dict_link = self._children, self._fail, self._phrase, self._dict_link
+        for i, token in enumerate(map(normalise_token, tokens)):
+            while node and token not in children[node]:
+                node = fail[node]
+            node = children[node].get(token, 0)
+            out = node if phrase[node] else dict_link[node]
+            while out > 0:
+                filler, length = phrase[out]
+                hits.append((i + 1 - length, i + 1, filler))
+                out = dict_link[out]
+
+        hits.sort(key=lambda h: (h[0], h[0] - h[1]))
+        chosen = []
+        last_end = 0
+        for start, end, filler in hits:
+            if start >= last_end:
+                chosen.append((start, end, filler))
+                last_end = end
+        return chosen
+
+    def _summary(self, n_words: int, spans: List[Tuple[int, int, str]]) -> Dict:
+        counts: Dict[str, int] = {}
+        for _, _, filler in spans:
+            counts[filler] = counts.get(filler, 0) + 1
+        return {
+            "filler_count": len(spans),
+            "filler_ratio": len(spans) / (n_words + 1e-9),
+            "filler_counts": counts,
+            "most_common_filler": max(counts, key=counts.get) if counts else None,
+        }
+
+    def analyse_tokens(self, tokens: Sequence[str]) -> Dict:
+        return self._summary(len(tokens), self.find(tokens))
+
+    def analyse_text(self, text: str) -> Dict:
+        tokens = tokenize(text)
+        return self._summary(len(tokens), self.find(tokens))
+
+    def analyse_words(self, words: Sequence[Dict]) -> Dict:
+        """Like `analyse_text` for Whisper word dicts (`word`, `start`, `end`), plus timings.
+
+        `filler_ratio` is over `len(words)`; `filler_occurrences` lists `{"filler", "start", "end"}` in seconds for every hit.
+        """
+        stream = FillerStream(self)
+        stream.feed(words)
+        return stream.summary()
+
+
+class FillerStream:
+    """Leftmost‑longest filler matching over Whisper words fed in order, in pieces."""
+
+    def __init__(self, detector: FillerDetector):
+        self.detector = detector
+        self.tokens: List[str] = []
+        self.word_count = 0  # Whisper words fed, the `filler_ratio` denominator
+        self._starts: List[Optional[float]] = []
+        self._ends: List[Optional[float]] = []
+        self._spans: List[Tuple[int, int, str]] = []  # final hits
+        self._pos = 0  # every hit starting before this token is final
+
+    def feed(self, words: Iterable[Dict]) -> None:
+        for w in words:
+            self.word_count += 1
+            for token in tokenize(w.get("word", "")):
+                self.tokens.append(token)
+                self._starts.append(w.get("start"))
+                self._ends.append(w.get("end"))
+
+        # A hit starting `max_tokens` before the end cannot be replaced by a longer one
+        settled = len(self.tokens) - self.detector.max_tokens + 1
+        for start, end, filler in self._tail():
+            if start >= settled:
+                break
+            self._spans.append((start, end, filler))
+            self._pos = end
+        self._pos = max(self._pos, settled)
+
+    def _tail(self) -> List[Tuple[int, int, str]]:
+        pos = self._pos
+        return [(s + pos, e + pos, f) for s, e, f in self.detector.find(self.tokens[pos:])]
+
+    def summary(self) -> Dict:
+        """Stats over everything fed so far, including hits not yet final."""
+        spans = self._spans + self._tail()
+        result = self.detector._summary(self.word_count, spans)
+        result["filler_occurrences"] = [
+            {"filler": filler, "start": self._starts[s], "end": self._ends[e - 1]} for s, e, filler in spans
+        ]
+        return result
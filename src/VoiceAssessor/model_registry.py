@@ -0,0 +1,189 @@
+# model_registry.py
+"""
+Process‑wide cache for the heavy models used by the Voice Assessor.
+
+Loading Whisper, the SpeechBrain emotion classifier or an openSMILE extractor takes
+seconds, which dominates the wall time for short clips. Every loader below goes through
+one `ModelRegistry`, so a model is loaded lazily on first use and then shared by every
+later call in the same process. When the estimated in‑memory size of all cached models
+exceeds the budget, the least recently used ones are dropped.
+
+```python
+from model_registry import get_whisper_model
+model = get_whisper_model("base")   # loads once
+model = get_whisper_model("base")   # cache hit
+```
+
+The budget defaults to 4 GB and can be changed with the `PRESENCEAI_MODEL_CACHE_MB`
+environment variable or `registry.max_bytes`.
+"""
+
+from __future__ import annotations
+
+import os
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Hashable, Optional
+
+DEFAULT_MAX_BYTES = int(os.getenv("PRESENCEAI_MODEL_CACHE_MB", "4096")) * 1024 * 1024
+FALLBACK_MODEL_BYTES = 64 * 1024 * 1024  # for models we cannot introspect
+
+# Also part of the analysis cache keys, so switching models never reuses stale results
+EMOTION_MODEL = "speechbrain/emotion-recognition-wav2vec2-IEMOCAP"
+SMILE_FEATURES = ("ComParE_2016", "Functionals")
+
+
+def estimate_model_bytes(model: Any) -> int:
+    """Best‑effort size of a model: parameter + buffer bytes for torch modules."""
+    modules = getattr(model, "mods", None)  # SpeechBrain wraps its torch modules
+    target = modules if modules is not None else model
+    if hasattr(target, "parameters"):
+        total = sum(p.numel() * p.element_size() for p in target.parameters())
+        if hasattr(target, "buffers"):
+            total += sum(b.numel() * b.element_size() for b in target.buffers())
+        return int(total) or FALLBACK_MODEL_BYTES
+    return FALLBACK_MODEL_BYTES
+
+
+class ModelRegistry:
+    """Thread‑safe lazy model cache with LRU eviction by estimated size."""
+
+    def __init__(self, max_bytes: int = DEFAULT_MAX_BYTES):
+        self.max_bytes = max_bytes
+        self._models: OrderedDict[Hashable, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._key_locks: dict[Hashable, threading.Lock] = {}
+
+    def get(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        size_fn: Callable[[Any], int] = estimate_model_bytes,
+    ) -> Any:
+        with self._lock:
+            if key in self._models:
+                self._models.move_to_end(key)
+                return self._models[key][0]
+            key_lock = self._key_locks.setdefault(key, threading.Lock())
+
+        # Load outside the registry lock so different models load in parallel,
+        # but never load the same model twice.
+        with key_lock:
+            with self._lock:
+                if key in self._models:
+                    self._models.move_to_end(key)
+                    return self._models[key][0]
+            model = loader()
+            size = size_fn(model)
+            with self._lock:
+                self._models[key] = (model, size)
+                self._evict(keep=key)
+        return model
+
+    def _evict(self, keep: Hashable) -> None:
+        while self.total_bytes > self.max_bytes and len(self._models) > 1:
+            oldest = next(iter(self._models))
+            if oldest == keep:
+                break
+            del self._models[oldest]
+
+    @property
+    def total_bytes(self) -> int:
+        return sum(size for _, size in self._models.values())
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._models
+
+    def clear(self) -> None:
+        with self._lock:
+            self._models.clear()
+
+
+registry = ModelRegistry()
+
+
+# ---------------------------------------------------------------------------
+# Loaders
+# ---------------------------------------------------------------------------
+
+def get_whisper_model(
+    model_name: str = "base", device: Optional[str] = None, download_root: Optional[str] = None
+):
+    """Return a cached `whisper` model."""
+
+    def load():
+        import whisper
+
+        return whisper.load_model(model_name, device=device, download_root=download_root)
+
+    return registry.get(("whisper", model_name, device), load)
+
+
+def get_faster_whisper_model(
+    model_name: str = "base",
+    device: str = "cpu",
+    compute_type: str = "int8",
+    cpu_threads: int = 0,
+    download_root: Optional[str] = None,
+):
+    """Return a cached CTranslate2 `faster_whisper.WhisperModel` (int8 on CPU by default)."""
+
+    def load():
+        from faster_whisper import WhisperModel
+
+        return WhisperModel(
+            model_name,
+            device=device,
+            compute_type=compute_type,
+            cpu_threads=cpu_threads,
+            download_root=download_root,
+        )
+
+    return registry.get(("faster_whisper", model_name, device, compute_type, cpu_threads), load)
+
+
+def get_whisper_cpp_model(model_name: str = "base", n_threads: int = 0, models_dir: Optional[str] = None):
+    """Return a cached whisper.cpp model (`pywhispercpp`), ggml weights are quantised."""
+
+    def load():
+        from pywhispercpp.model import Model
+
+        return Model(
+            model_name,
+            models_dir=models_dir,
+            n_threads=n_threads or os.cpu_count() or 4,
+            print_progress=False,
+            print_realtime=False,
+        )
+
+    return registry.get(("whisper_cpp", model_name, n_threads), load)
+
+
+def get_emotion_classifier(device: str = "cpu"):
+    """Return the cached SpeechBrain wav2vec2 IEMOCAP emotion classifier."""
+
+    def load():
+        from speechbrain.pretrained import EncoderClassifier
+
+        return EncoderClassifier.from_hparams(
+            source=EMOTION_MODEL,
+            savedir="pretrained_models/sb_emotion",
+            run_opts={"device": device},
+        )
+
+    return registry.get(("speechbrain_emotion", device), load)
+
+
+def get_smile():
+    """Return the cached openSMILE ComParE_2016 functionals extractor."""
+
+    def load():
+        import opensmile
+
+        feature_set, feature_level = SMILE_FEATURES
+        return opensmile.Smile(
+            feature_set=opensmile.FeatureSet[feature_set],
+            feature_level=opensmile.FeatureLevel[feature_level],
+        )
+
+    return registry.get(("opensmile", *SMILE_FEATURES), load)
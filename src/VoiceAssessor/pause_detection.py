@@ -0,0 +1,201 @@
+# pause_detection.py
+"""
+Voice‑activity and pause detection built on webrtcvad.
+
+The waveform is converted to 16‑bit PCM once, framed with a zero‑copy reshape (every row
+of the `(n_frames, frame_bytes)` view is handed straight to webrtcvad), and pause runs are
+found with vectorised run‑length encoding of the voiced mask. Work is linear in the
+recording length with a small constant factor, so hour‑long sessions are fine.
+`StreamingVAD` does the same frame by frame for live audio and keeps the pause statistics
+up to date as chunks arrive.
+
+webrtcvad only accepts 8, 16, 32 or 48 kHz audio and 10, 20 or 30 ms frames; other rates
+are resampled to the nearest supported one.
+"""
+
+from __future__ import annotations
+
+from typing import Dict, List, Optional, Tuple
+
+import librosa
+import numpy as np
+import webrtcvad
+
+VAD_SAMPLE_RATES = (8000, 16000, 32000, 48000)
+VAD_FRAME_MS = (10, 20, 30)
+
+
+def to_vad_rate(audio: np.ndarray, sr: int) -> Tuple[np.ndarray, int]:
+    """Return `audio` at a sample rate webrtcvad accepts."""
+    if sr in VAD_SAMPLE_RATES:
+        return audio, sr
+    target = min(VAD_SAMPLE_RATES, key=lambda rate: abs(rate - sr))
+    return librosa.resample(np.asarray(audio, dtype=np.float32), orig_sr=sr, target_sr=target), target
+
+
+def to_pcm16(audio: np.ndarray) -> np.ndarray:
+    """Peak‑normalise a float waveform into int16 PCM (what webrtcvad consumes)."""
+    audio = np.asarray(audio, dtype=np.float32)
+    if audio.ndim == 2:
+        audio = audio.mean(axis=1)
+    peak = float(np.max(np.abs(audio))) if audio.size else 0.0
+    if peak == 0.0:
+        return np.zeros(len(audio), dtype=np.int16)
+    return (audio * (32767 / peak)).astype(np.int16)
+
+
+def frame_pcm(pcm16: np.ndarray, frame_len: int) -> np.ndarray:
+    """Zero‑copy `(n_frames, 2 * frame_len)` byte view of contiguous int16 PCM."""
+    n_frames = len(pcm16) // frame_len
+    pcm16 = np.ascontiguousarray(pcm16[: n_frames * frame_len])
+    return pcm16.reshape(n_frames, frame_len).view(np.uint8)
+
+
+def voiced_mask(
+    audio: np.ndarray, sr: int, frame_duration_ms: int = 30, vad_aggressiveness: int = 2
+) -> np.ndarray:
+    """Boolean array with one entry per `frame_duration_ms` frame: True where speech."""
+    if frame_duration_ms not in VAD_FRAME_MS:
+        raise ValueError(f"webrtcvad frames must be one of {VAD_FRAME_MS} ms, got {frame_duration_ms}")
+    audio, sr = to_vad_rate(audio, sr)
+    frames = frame_pcm(to_pcm16(audio), int(sr * frame_duration_ms / 1000))
+
+    is_speech = webrtcvad.Vad(vad_aggressiveness).is_speech
+    return np.fromiter((is_speech(frame, sr) for frame in frames), dtype=bool, count=len(frames))
+
+
+def silent_runs(mask: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """Run‑length encode the False runs of `mask`: return (start_frames, lengths)."""
+    edges = np.diff(np.concatenate(([1], mask.astype(np.int8), [1])))
+    starts = np.flatnonzero(edges == -1)
+    ends = np.flatnonzero(edges == 1)
+    return starts, ends - starts
+
+
+def voiced_regions(mask: np.ndarray, frame_duration_ms: int = 30) -> List[Tuple[float, float]]:
+    """(start_sec, end_sec) of every run of speech frames."""
+    starts, lengths = silent_runs(~mask)
+    frame_sec = frame_duration_ms / 1000
+    return [(float(s * frame_sec), float((s + n) * frame_sec)) for s, n in zip(starts, lengths)]
+
+
+def speech_spans(
+    mask: np.ndarray,
+    frame_duration_ms: int = 30,
+    sr: int = 16000,
+    n_samples: Optional[int] = None,
+    pad_sec: float = 0.2,
+    merge_gap_sec: float = 0.5,
+) -> List[Tuple[int, int]]:
+    """Sample ranges `[start, end)` of speech at `sr`: voiced regions padded by `pad_sec` on
+    both sides, merged when less than `merge_gap_sec` of silence separates them."""
+    spans: List[Tuple[int, int]] = []
+    for start, end in voiced_regions(mask, frame_duration_ms):
+        s = max(0, int((start - pad_sec) * sr))
+        e = int((end + pad_sec) * sr)
+        if n_samples is not None:
+            e = min(e, n_samples)
+        if spans and s - spans[-1][1] < merge_gap_sec * sr:
+            spans[-1] = (spans[-1][0], max(e, spans[-1][1]))
+        else:
+            spans.append((s, e))
+    return spans
+
+
+def pause_stats_from_mask(mask: np.ndarray, frame_duration_ms: int = 30) -> Dict:
+    starts, lengths = silent_runs(mask)
+    frame_sec = frame_duration_ms / 1000
+    durations = lengths * frame_sec
+    timeline = [[float(s * frame_sec), float((s + n) * frame_sec)] for s, n in zip(starts, lengths)]
+
+    if not len(durations):
+        return {"pause_count": 0, "total_pause": 0.0, "longest_pause": 0.0, "pause_timeline": []}
+
+    return {
+        "pause_count": int(len(durations)),
+        "total_pause": float(durations.sum()),
+        "longest_pause": float(durations.max()),
+        "pause_timeline": timeline,
+    }
+
+
+def detect_pauses(
+    audio: np.ndarray, sr: int, frame_duration_ms: int = 30, vad_aggressiveness: int = 2
+) -> Dict:
+    """Pause count / total / longest (seconds) plus the `[start, end]` pause timeline."""
+    mask = voiced_mask(audio, sr, frame_duration_ms, vad_aggressiveness)
+    return pause_stats_from_mask(mask, frame_duration_ms)
+
+
+class StreamingVAD:
+    """Online voiced mask and pause statistics for audio that arrives in chunks.
+
+    Chunks may have any length; samples are carried over until a whole frame is
+    available. Live audio cannot be peak‑normalised up front, so samples are scaled by a
+    fixed `gain` (1.0 maps ±1.0 floats to full‑scale PCM) instead. `pause_stats()` has the
+    same shape as `pause_stats_from_mask`; a trailing silence counts as a pause so far.
+    """
+
+    def __init__(
+        self, sr: int = 16000, frame_duration_ms: int = 30, vad_aggressiveness: int = 2, gain: float = 1.0
+    ):
+        if sr not in VAD_SAMPLE_RATES:
+            raise ValueError(f"webrtcvad needs one of {VAD_SAMPLE_RATES} Hz, got {sr}")
+        if frame_duration_ms not in VAD_FRAME_MS:
+            raise ValueError(f"webrtcvad frames must be one of {VAD_FRAME_MS} ms, got {frame_duration_ms}")
+        self.sr = sr
+        self.frame_sec = frame_duration_ms / 1000
+        self.frame_len = int(sr * frame_duration_ms / 1000)
+        self.gain = gain
+        self._is_speech = webrtcvad.Vad(vad_aggressiveness).is_speech
+        self._carry = np.zeros(0, dtype=np.int16)
+
+        self.frames = 0
+        self.voiced_frames = 0
+        self.pause_timeline: List[List[float]] = []
+        self._silence_start: Optional[int] = None  # frame index of the open silent run
+
+    def push(self, chunk: np.ndarray) -> np.ndarray:
+        """Add float samples; return the voiced mask of the frames completed by them."""
+        pcm = np.clip(np.asarray(chunk, dtype=np.float32) * (32767 * self.gain), -32768, 32767).astype(np.int16)
+        pcm = np.concatenate((self._carry, pcm)) if len(self._carry) else pcm
+        frames = frame_pcm(pcm, self.frame_len)
+        self._carry = pcm[len(frames) * self.frame_len :].copy()
+
+        mask = np.fromiter((self._is_speech(f, self.sr) for f in frames), dtype=bool, count=len(frames))
+        for i, voiced in enumerate(mask, start=self.frames):
+            if voiced and self._silence_start is not None:
+                self.pause_timeline.append([self._silence_start * self.frame_sec, i * self.frame_sec])
+                self._silence_start = None
+            elif not voiced and self._silence_start is None:
+                self._silence_start = i
+        self.frames += len(mask)
+        self.voiced_frames += int(mask.sum())
+        return mask
+
+    @property
+    def duration_sec(self) -> float:
+        return self.frames * self.frame_sec
+
+    @property
+    def in_pause(self) -> bool:
+        return self._silence_start is not None
+
+    @property
+    def silence_start_sec(self) -> Optional[float]:
+        """Where the silence the audio currently ends in began, or None after a voiced frame."""
+        return None if self._silence_start is None else self._silence_start * self.frame_sec
+
+    def pause_stats(self) -> Dict:
+        timeline = list(self.pause_timeline)
+        if self._silence_start is not None:
+            timeline.append([self._silence_start * self.frame_sec, self.duration_sec])
+        if not timeline:
+            return {"pause_count": 0, "total_pause": 0.0, "longest_pause": 0.0, "pause_timeline": []}
+        durations = [end - start for start, end in timeline]
+        return {
+            "pause_count": len(timeline),
+            "total_pause": float(sum(durations)),
+            "longest_pause": float(max(durations)),
+            "pause_timeline": timeline,
+        }
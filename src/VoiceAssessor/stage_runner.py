@@ -0,0 +1,129 @@
+# stage_runner.py
+"""
+Tiny DAG executor for the Voice Assessor analysers.
+
+A pipeline is a list of `Stage`s. Each stage names the earlier results (or initial inputs)
+it depends on; stages whose dependencies are ready run concurrently. Native‑code stages
+(Whisper/PyTorch, openSMILE, webrtcvad) release the GIL and run on threads; a stage can
+ask for `kind="process"` when pure‑Python work would otherwise hold the GIL, or
+`kind="inline"` for cheap glue that is not worth a hand‑off.
+
+```python
+stages = [
+    Stage("asr", transcribe_audio, deps=("audio",)),
+    Stage("prosody", extract_prosody, deps=("audio",)),
+    Stage("lexical", lexical_from_transcription, deps=("asr",), kind="inline"),
+]
+results, timings = run_stages(stages, {"audio": waveform})
+```
+
+`timings` maps every stage name to its wall‑clock run time in seconds. The process pool is
+created on first use, kept warm between calls and shut down at exit (or by `shutdown()`).
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+THREAD = "thread"
+PROCESS = "process"
+INLINE = "inline"
+
+_process_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+@dataclass
+class Stage:
+    name: str
+    fn: Callable[..., Any]
+    deps: Tuple[str, ...] = ()
+    kind: str = THREAD
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+
+
+def _timed(fn: Callable[..., Any], args: tuple, kwargs: dict) -> Tuple[Any, float]:
+    start = time.perf_counter()
+    result = fn(*args, **kwargs)
+    return result, time.perf_counter() - start
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    # Long‑lived so models loaded inside process stages stay warm between calls
+    global _process_pool
+    with _pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(max_workers=max(1, (os.cpu_count() or 2) // 2))
+        return _process_pool
+
+
+@atexit.register
+def shutdown() -> None:
+    """Stop the process‑stage workers; the next process stage starts a fresh pool."""
+    global _process_pool
+    with _pool_lock:
+        pool, _process_pool = _process_pool, None
+    if pool is not None:
+        pool.shutdown(wait=True, cancel_futures=True)
+
+
+def _validate(stages: List[Stage], inputs: Dict[str, Any]) -> None:
+    known = set(inputs)
+    for stage in stages:
+        if stage.kind not in (THREAD, PROCESS, INLINE):
+            raise ValueError(f"Stage {stage.name!r}: unknown kind {stage.kind!r}")
+        missing = [d for d in stage.deps if d not in known]
+        if missing:
+            raise ValueError(f"Stage {stage.name!r} depends on unknown or later stages: {missing}")
+        if stage.name in known:
+            raise ValueError(f"Duplicate stage name {stage.name!r}")
+        known.add(stage.name)
+
+
+def run_stages(
+    stages: List[Stage], inputs: Dict[str, Any], max_threads: Optional[int] = None
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Run `stages` as early as their dependencies allow; return (results, timings).
+
+    Stages must be listed after the stages they depend on. The first stage that raises
+    cancels everything still queued and re‑raises.
+    """
+    _validate(stages, inputs)
+    results: Dict[str, Any] = dict(inputs)
+    timings: Dict[str, float] = {}
+    pending = list(stages)
+    running: Dict[Future, Stage] = {}
+
+    with ThreadPoolExecutor(max_workers=max_threads or len(stages) or 1) as threads:
+        while pending or running:
+            for stage in [s for s in pending if all(d in results for d in s.deps)]:
+                pending.remove(stage)
+                args = tuple(results[d] for d in stage.deps)
+                if stage.kind == INLINE:
+                    results[stage.name], timings[stage.name] = _timed(stage.fn, args, stage.kwargs)
+                    continue
+                pool = _get_process_pool() if stage.kind == PROCESS else threads
+                running[pool.submit(_timed, stage.fn, args, stage.kwargs)] = stage
+
+            if not running:
+                continue  # inline stages may have unlocked more work
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                stage = running.pop(future)
+                try:
+                    results[stage.name], timings[stage.name] = future.result()
+                except BaseException:
+                    for other in running:
+                        other.cancel()
+                    raise
+
+    for name in inputs:
+        results.pop(name)
+    return results, timings
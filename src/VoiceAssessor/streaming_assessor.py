@@ -0,0 +1,438 @@
+# streaming_assessor.py
+"""
+Live voice assessment over audio that arrives in chunks (microphone, websocket, file).
+
+`StreamingVoiceAssessor` keeps the pace, pause and filler metrics up to date while audio is
+fed and emits a partial `compute_scores` result every `update_sec` seconds of audio:
+
+- **Pauses** – `pause_detection.StreamingVAD`, frame by frame as samples arrive.
+- **ASR** – Whisper re‑runs on the window of not yet committed audio at every update. A
+  word is *committed* once two consecutive passes agree on it (local agreement); committed
+  words never change, and the window is cut after the last committed word and never grows
+  beyond `max_window_sec`. Once the VAD has heard `SILENCE_SKIP_SEC` of trailing silence the
+  utterance is over: its words are committed and the window (and buffered audio) moves past
+  the silence, so a long pause is never sent to Whisper.
+- **Fillers, lexical richness, pace** – updated incrementally from committed words only.
+- **Prosody** – openSMILE over the audio since the previous update, averaged over updates.
+
+Emotion is not analysed live; run `assess_voice` on the finished recording for that.
+
+```python
+engine = StreamingVoiceAssessor(on_update=print)
+for chunk in wav_chunks("talk.wav"):          # or microphone_chunks()
+    engine.feed(chunk)
+final = engine.finish()
+```
+
+Websocket servers can pass binary frames of 16‑bit PCM straight to `feed_pcm16`. With
+`background=True`, ASR and prosody run on a worker thread so `feed` never waits for Whisper;
+an update that comes due while the worker is busy is merged into the next one, which bounds
+the backlog to one pass. Feeding a WAV file with `background=False` gives deterministic
+updates for tests. The microphone source needs `pip install sounddevice`.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import queue
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from asr_backends import BACKENDS
+from audio_io import SAMPLE_RATE, load_audio, to_mono_16k
+from filler_detector import FillerStream, tokenize
+import pause_detection
+from voice_assessor import (
+    FILLER_DETECTOR,
+    VAD_AGGRESSIVENESS,
+    VAD_FRAME_MS,
+    compute_scores,
+    extract_prosody,
+    transcribe_audio,
+)
+
+# src/ is on sys.path once voice_assessor is imported
+from profiling import timer
+
+from nltk.tokenize import word_tokenize
+from textstat import lexicon_count
+
+UPDATE_SEC = 2.0
+MAX_WINDOW_SEC = 20.0  # stays inside Whisper's 30 s context
+MIN_ASR_SEC = 0.5
+PROMPT_WORDS = 30  # committed words passed to Whisper as context for the next window
+DEDUP_WORDS = 5
+SILENCE_SKIP_SEC = 1.0  # trailing silence that ends an utterance
+SILENCE_KEEP_SEC = 0.3  # audio kept before the live edge when skipping a silence
+
+# Mid‑scale melody and anxiety until the first prosody window is measured
+NEUTRAL_PROSODY = {"pitch_mean": float("nan"), "pitch_std": 5.0, "jitter_abs": 0.01,
+                   "shimmer_abs": float("nan"), "loudness_mean": float("nan")}
+
+
+def _norm(word: Dict) -> str:
+    return " ".join(tokenize(word["word"]))
+
+
+def _text(words: List[Dict]) -> str:
+    return "".join(w["word"] for w in words).strip()
+
+
+class _AudioBuffer:
+    """Growable float32 buffer addressed by absolute sample index; old audio can be dropped."""
+
+    def __init__(self, capacity: int):
+        self._data = np.zeros(max(capacity, 1), dtype=np.float32)
+        self._len = 0
+        self.start = 0  # absolute index of the first kept sample
+
+    @property
+    def end(self) -> int:
+        return self.start + self._len
+
+    def append(self, chunk: np.ndarray) -> None:
+        need = self._len + len(chunk)
+        if need > len(self._data):
+            grown = np.zeros(max(need, 2 * len(self._data)), dtype=np.float32)
+            grown[: self._len] = self._data[: self._len]
+            self._data = grown
+        self._data[self._len : need] = chunk
+        self._len = need
+
+    def since(self, index: int) -> np.ndarray:
+        return self._data[max(index - self.start, 0) : self._len].copy()
+
+    def drop_before(self, index: int) -> None:
+        k = min(max(index - self.start, 0), self._len)
+        self._data[: self._len - k] = self._data[k : self._len]
+        self._len -= k
+        self.start += k
+
+
+class StreamingVoiceAssessor:
+    def __init__(
+        self,
+        whisper_model: str = "base",
+        asr_backend: Optional[str] = None,
+        transcribe: Optional[Callable[..., Dict]] = None,
+        prosody: Optional[Callable[[np.ndarray], Dict]] = extract_prosody,
+        on_update: Optional[Callable[[Dict], None]] = None,
+        update_sec: float = UPDATE_SEC,
+        max_window_sec: float = MAX_WINDOW_SEC,
+        background: bool = False,
+        sr: int = SAMPLE_RATE,
+    ):
+        """`transcribe(audio, initial_prompt=...)` must return Whisper's result dict; `prosody=None`
+        skips openSMILE. `sr` is the rate of the chunks passed to `feed`."""
+        self.transcribe = transcribe or partial(transcribe_audio, model_name=whisper_model, backend=asr_backend)
+        self.prosody = prosody
+        self.on_update = on_update
+        self.update_sec = update_sec
+        self.max_window_sec = max_window_sec
+        self.sr = sr
+
+        self.vad = pause_detection.StreamingVAD(SAMPLE_RATE, VAD_FRAME_MS, VAD_AGGRESSIVENESS)
+        self.fillers = FillerStream(FILLER_DETECTOR)
+        self.committed: List[Dict] = []
+        self.hypothesis: List[Dict] = []  # words of the last pass after the committed prefix
+        self.latest: Optional[Dict] = None
+
+        self._buffer = _AudioBuffer(int(2 * max_window_sec * SAMPLE_RATE))
+        self._samples = 0
+        self._next_update = int(update_sec * SAMPLE_RATE)
+        self._window_start = 0  # absolute sample where the uncommitted ASR window begins
+        self._prosody_start = 0
+        self._prosody_sums: Dict[str, float] = {}
+        self._prosody_weights: Dict[str, float] = {}
+        self._vocab: set = set()
+        self._total_words = 0
+        self._lexicon_count = 0
+
+        self._lock = threading.Lock()
+        self._worker = ThreadPoolExecutor(max_workers=1) if background else None
+        self._pending: Optional[Future] = None
+
+    # ------------------------------------------------------------------
+    # Input
+    # ------------------------------------------------------------------
+
+    def feed(self, chunk: np.ndarray) -> None:
+        chunk = to_mono_16k(chunk, self.sr)
+        with self._lock:
+            self._buffer.append(chunk)
+            self._samples += len(chunk)
+            self.vad.push(chunk)
+        if self._samples >= self._next_update:
+            self._next_update = self._samples + int(self.update_sec * SAMPLE_RATE)
+            self._schedule()
+
+    def feed_pcm16(self, data: bytes) -> None:
+        """Feed little‑endian 16‑bit PCM at the engine's `sr` (e.g. websocket binary frames)."""
+        self.feed(np.frombuffer(data, dtype="<i2").astype(np.float32) / 32768)
+
+    def _schedule(self) -> None:
+        if self._worker is None:
+            self._update()
+            return
+        if self._pending is not None:
+            if not self._pending.done():
+                return  # still busy: this update merges into the next one
+            self._pending.result()  # surface worker errors
+        self._pending = self._worker.submit(self._update)
+
+    def finish(self) -> Dict:
+        """Commit everything still pending and return the final result."""
+        if self._pending is not None:
+            self._pending.result()
+        if self._worker is not None:
+            self._worker.shutdown()
+        return self._update(final=True)
+
+    # ------------------------------------------------------------------
+    # Updates
+    # ------------------------------------------------------------------
+
+    def _update(self, final: bool = False) -> Dict:
+        with self._lock:
+            end = self._buffer.end
+            self._window_start = max(self._window_start, end - int(self.max_window_sec * SAMPLE_RATE))
+            window = self._buffer.since(self._window_start)
+            window_start = self._window_start
+            silence_start = self.vad.silence_start_sec
+            recent = self._buffer.since(self._prosody_start)
+            self._prosody_start = end
+
+        with timer("voice.stream.asr"):
+            self._asr_pass(window, window_start, end, silence_start, final)
+        with timer("voice.stream.prosody"):
+            self._add_prosody(recent)
+
+        with self._lock:
+            self._buffer.drop_before(min(self._window_start, self._prosody_start))
+        snapshot = self.snapshot(final, covered=end)
+        self.latest = snapshot
+        if self.on_update:
+            self.on_update(snapshot)
+        return snapshot
+
+    def _asr_pass(
+        self, window: np.ndarray, window_start: int, end: int, silence_start: Optional[float], final: bool
+    ) -> None:
+        """`silence_start` is where the trailing silence began (seconds), or None if voiced."""
+        silent = silence_start is not None and end / SAMPLE_RATE - silence_start >= SILENCE_SKIP_SEC
+        if silent:
+            # Only the speech before the silence is transcribed, and all of it is committed
+            window = window[: max(int((silence_start + SILENCE_KEEP_SEC) * SAMPLE_RATE) - window_start, 0)]
+
+        if len(window) < MIN_ASR_SEC * SAMPLE_RATE:
+            words = self.hypothesis
+        else:
+            offset = window_start / SAMPLE_RATE
+            prompt = _text(self.committed[-PROMPT_WORDS:]) or None
+            result = self.transcribe(window, initial_prompt=prompt)
+            words = [
+                {**w, "start": w["start"] + offset, "end": w["end"] + offset}
+                for seg in result["segments"]
+                for w in seg.get("words", ())
+            ]
+            words = self._new_words(words)
+
+        if final or silent:
+            self._commit(words)
+            self.hypothesis = []
+            if silent:
+                self._window_start = max(self._window_start, end - int(SILENCE_KEEP_SEC * SAMPLE_RATE))
+            return
+        if len(window) < MIN_ASR_SEC * SAMPLE_RATE:
+            return
+
+        agreed = 0
+        for old, new in zip(self.hypothesis, words):
+            if _norm(old) != _norm(new):
+                break
+            agreed += 1
+        self._commit(words[:agreed])
+        self.hypothesis = words[agreed:]
+
+        # Nothing stable for a whole window: force out what is well behind the live edge, since
+        # the next update cuts the window to `max_window_sec` again
+        if (end - window_start) / SAMPLE_RATE >= self.max_window_sec - self.update_sec:
+            cutoff = end / SAMPLE_RATE - self.update_sec
+            forced = [w for w in self.hypothesis if w["end"] <= cutoff]
+            self._commit(forced)
+            self.hypothesis = self.hypothesis[len(forced) :]
+
+        # Slide the window past committed words once it is half full
+        if self.committed and (end - window_start) / SAMPLE_RATE > self.max_window_sec / 2:
+            self._window_start = max(self._window_start, int(self.committed[-1]["end"] * SAMPLE_RATE))
+
+    def _new_words(self, words: List[Dict]) -> List[Dict]:
+        """Drop words of a pass that repeat the committed transcript."""
+        if not self.committed:
+            return words
+        last_end = self.committed[-1]["end"]
+        words = [w for w in words if w["end"] > last_end]
+        # Whisper often re‑emits the last committed words at the start of the window
+        if words and words[0]["start"] - last_end < 1.0:
+            tail = [_norm(w) for w in self.committed[-DEDUP_WORDS:]]
+            head = [_norm(w) for w in words[:DEDUP_WORDS]]
+            for n in range(min(len(tail), len(head)), 0, -1):
+                if tail[-n:] == head[:n]:
+                    return words[n:]
+        return words
+
+    def _commit(self, words: List[Dict]) -> None:
+        if not words:
+            return
+        self.committed.extend(words)
+        self.fillers.feed(words)
+        text = _text(words)
+        tokens = word_tokenize(text.lower())
+        self._vocab.update(tokens)
+        self._total_words += len(tokens)
+        self._lexicon_count += lexicon_count(text, removepunct=True)
+
+    def _add_prosody(self, audio: np.ndarray) -> None:
+        if self.prosody is None or len(audio) < MIN_ASR_SEC * SAMPLE_RATE:
+            return
+        for key, value in self.prosody(audio).items():
+            if not np.isnan(value):
+                self._prosody_sums[key] = self._prosody_sums.get(key, 0.0) + value * len(audio)
+                self._prosody_weights[key] = self._prosody_weights.get(key, 0.0) + len(audio)
+
+    # ------------------------------------------------------------------
+    # Results
+    # ------------------------------------------------------------------
+
+    def snapshot(self, final: bool = False, covered: Optional[int] = None) -> Dict:
+        """Current metrics and scores in `assess_voice`'s format (without emotion).
+
+        Before `finish`, pace is measured up to the last committed word, since the words of
+        the most recent seconds are not committed yet.
+        """
+        with self._lock:
+            duration = self._samples / SAMPLE_RATE
+            pause_stats = self.vad.pause_stats()
+        fillers = self.fillers.summary()
+        spoken = duration if final else (self.committed[-1]["end"] if self.committed else 0.0)
+        prosody = dict(NEUTRAL_PROSODY)
+        prosody.update({k: self._prosody_sums[k] / self._prosody_weights[k] for k in self._prosody_sums})
+
+        raw_metrics = {
+            "audio_duration_sec": duration,
+            "speech_pace_wpm": len(self.committed) / (spoken / 60 + 1e-9) if spoken else 0.0,
+            "prosody": prosody,
+            "pause_stats": pause_stats,
+            "filler_ratio": fillers["filler_ratio"],
+            "filler_count": fillers["filler_count"],
+            "filler_counts": fillers["filler_counts"],
+            "filler_occurrences": fillers["filler_occurrences"],
+            "lexical": {
+                "vocab_size": len(self._vocab),
+                "total_words": self._total_words,
+                "type_token_ratio": len(self._vocab) / (self._total_words + 1e-9),
+                "lexicon_count": self._lexicon_count,
+            },
+        }
+        scores = compute_scores(raw_metrics) if duration > 0 else {}
+        covered = self._samples if covered is None else covered
+        return {
+            **raw_metrics,
+            **scores,
+            "transcript": _text(self.committed),
+            "partial_transcript": _text(self.hypothesis),
+            "final": final,
+            "lag_sec": round((self._samples - covered) / SAMPLE_RATE, 3),
+        }
+
+
+# ---------------------------------------------------------------------------
+# Chunk sources
+# ---------------------------------------------------------------------------
+
+def wav_chunks(path: str | Path, chunk_sec: float = 0.1, realtime: bool = False) -> Iterator[np.ndarray]:
+    """Yield a recording as 16 kHz chunks, optionally paced like a live microphone."""
+    audio = load_audio(path)
+    step = max(1, int(chunk_sec * SAMPLE_RATE))
+    start = time.perf_counter()
+    for i in range(0, len(audio), step):
+        if realtime:
+            time.sleep(max(0.0, start + i / SAMPLE_RATE - time.perf_counter()))
+        yield audio[i : i + step]
+
+
+def microphone_chunks(chunk_sec: float = 0.1, device: Optional[int | str] = None) -> Iterator[np.ndarray]:
+    """Yield 16 kHz mono chunks from an input device until the generator is closed."""
+    import sounddevice as sd
+
+    chunks: queue.Queue = queue.Queue()
+
+    def callback(indata, frames, time_info, status):
+        chunks.put(indata[:, 0].copy())
+
+    with sd.InputStream(
+        samplerate=SAMPLE_RATE,
+        channels=1,
+        dtype="float32",
+        blocksize=int(chunk_sec * SAMPLE_RATE),
+        device=device,
+        callback=callback,
+    ):
+        while True:
+            yield chunks.get()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _summary_line(snapshot: Dict) -> str:
+    keys = ("audio_duration_sec", "speech_pace_wpm", "filler_count", "fluency_score", "overall_score", "lag_sec")
+    line = {k: round(snapshot[k], 2) if isinstance(snapshot.get(k), float) else snapshot.get(k) for k in keys}
+    line["pauses"] = snapshot["pause_stats"]["pause_count"]
+    line["transcript"] = snapshot["transcript"][-80:]
+    return json.dumps(line)
+
+
+def _cli():
+    parser = argparse.ArgumentParser(description="Live voice assessment from a microphone or an audio file")
+    parser.add_argument("audio", type=Path, nargs="?", help="Audio file to stream (default: microphone)")
+    parser.add_argument("--realtime", action="store_true", help="Pace file input like a live microphone")
+    parser.add_argument("--model", default="base", help="Whisper model (tiny, base, small …)")
+    parser.add_argument("--asr-backend", choices=sorted(BACKENDS), default=None, help="Speech recognition engine")
+    parser.add_argument("--update-sec", type=float, default=UPDATE_SEC, help="Seconds of audio between updates")
+    parser.add_argument("--no-prosody", action="store_true", help="Skip openSMILE prosody")
+    parser.add_argument("--json-out", type=Path, default=None, help="Optional path to write the final metrics")
+    args = parser.parse_args()
+
+    engine = StreamingVoiceAssessor(
+        whisper_model=args.model,
+        asr_backend=args.asr_backend,
+        prosody=None if args.no_prosody else extract_prosody,
+        on_update=lambda s: print(_summary_line(s), flush=True),
+        update_sec=args.update_sec,
+        background=args.audio is None or args.realtime,
+    )
+    source = wav_chunks(args.audio, realtime=args.realtime) if args.audio else microphone_chunks()
+    try:
+        for chunk in source:
+            engine.feed(chunk)
+    except KeyboardInterrupt:
+        pass
+    result = engine.finish()
+
+    print(json.dumps(result, indent=2))
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    _cli()
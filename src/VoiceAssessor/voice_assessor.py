@@ -22,7 +22,7 @@ following high‑level ratings:
 The code relies entirely on **open‑source libraries** so that you can run it locally for free
 in a hackathon setting:
 
-* `whisper`             – ASR + optional word‑level timestamps
+* `whisper`             – ASR + optional word‑level timestamps (or faster‑whisper / whisper.cpp, see `asr_backends.py`)
 * `opensmile`           – prosodic & voice‑quality features (pitch, jitter, shimmer, loudness)
 * `webrtcvad`           – robust voice‑activity detection for pause analysis
 * `speechbrain`         – lightweight pre‑trained emotion‑recognition model
@@ -33,7 +33,7 @@ in a hackathon setting:
 Install dependencies with (example):
 
 ```bash
-pip install openai-whisper opensmile webrtcvad speechbrain soundfile torchaudio nltk textstat numpy pandas scipy rapidfuzz
+pip install openai-whisper opensmile webrtcvad speechbrain soundfile torchaudio nltk textstat numpy pandas scipy
 ```
 
 For first‑time NLTK use you may also have to download tokenisers:
@@ -66,23 +66,43 @@ import argparse
 import json
 import math
 import os
+import sys
+import time
 from pathlib import Path
 from statistics import mean, stdev
-from typing import Dict, List
+from typing import Dict, List, Optional
 
-import librosa
 import numpy as np
-import opensmile
-import soundfile as sf
 import torch
-import webrtcvad
-from rapidfuzz import fuzz  # lightweight string fuzzy‑matching for filler detection
 
-# Whisper ASR
-import whisper
+# Whisper, openSMILE and SpeechBrain models are loaded once per process
+from model_registry import EMOTION_MODEL, SMILE_FEATURES, get_emotion_classifier, get_smile
 
-# SpeechBrain emotion recognition
-from speechbrain.pretrained import EncoderClassifier
+# openai-whisper, faster-whisper (int8) or whisper.cpp behind one interface
+from asr_backends import BACKENDS, get_backend
+
+# Shared helpers (analysis cache, profiler) live one level up in src/
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC not in sys.path:
+    sys.path.append(_SRC)
+
+# Heavy stage results are cached on disk, keyed by media content + model + parameters
+from analysis_cache import get_cache
+
+# Every stage shares one decoded 16 kHz mono float32 waveform
+from audio_io import SAMPLE_RATE, as_waveform, duration_sec
+
+# Vectorised webrtcvad pause detection
+import pause_detection
+
+# Independent analysers run concurrently
+from stage_runner import INLINE, Stage, run_stages
+
+# Stage timings feed the shared profiler (a no-op unless PRESENCEAI_PROFILE is set)
+from profiling import profiler
+
+# Filler phrases are matched with one token‑level automaton pass
+from filler_detector import FillerDetector
 
 # Text / lexical metrics
 import nltk
@@ -90,21 +110,115 @@ from nltk.tokenize import word_tokenize
 from textstat import lexicon_count
 
 FILLER_WORDS = {"um", "uh", "erm", "hmm", "like", "you know", "so", "actually", "basically"}
-
-def transcribe_audio(path: Path, model_name: str = "base") -> Dict:
-    """Run Whisper ASR and return transcription + word‑level timing info."""
-    model = whisper.load_model(model_name)
-    result = model.transcribe(str(path), word_timestamps=True, verbose=False)
+FILLER_DETECTOR = FillerDetector(FILLER_WORDS)
+
+VAD_FRAME_MS = 30
+VAD_AGGRESSIVENESS = 2
+EMOTION_WINDOW_SEC = 10.0
+EMOTION_HOP_SEC = 5.0
+
+# VAD‑gated ASR: speech is padded, merged across short gaps and packed into ≤ 28 s chunks
+VAD_GATE_PAD_SEC = 0.2
+VAD_GATE_MERGE_SEC = 0.5
+VAD_GATE_CHUNK_SEC = 28.0
+VAD_GATE_SEPARATOR_SEC = 0.3
+
+def transcribe_audio(
+    audio: np.ndarray,
+    model_name: str = "base",
+    initial_prompt: Optional[str] = None,
+    backend: Optional[str] = None,
+    vad_gate: bool = False,
+) -> Dict:
+    """Run Whisper ASR on a 16 kHz waveform and return transcription + word‑level timing info.
+
+    With `vad_gate` only the voiced parts are transcribed (see `transcribe_voiced`).
+    """
+    if vad_gate:
+        mask = pause_detection.voiced_mask(audio, SAMPLE_RATE, VAD_FRAME_MS, VAD_AGGRESSIVENESS)
+        return transcribe_voiced(audio, mask, model_name, backend, initial_prompt=initial_prompt)
+    result = get_backend(backend, model_name).transcribe(audio, initial_prompt=initial_prompt)
     return result  # dict with keys: text, segments
 
 
-def extract_prosody(path: Path) -> Dict[str, float]:
-    """Call openSMILE to compute core prosodic features (pitch, jitter, shimmer, loudness)."""
-    smile = opensmile.Smile(
-        feature_set=opensmile.FeatureSet.ComParE_2016,
-        feature_level=opensmile.FeatureLevel.Functionals,
+def pack_spans(spans: List[tuple], max_samples: int, separator: int) -> List[List[tuple]]:
+    """Group consecutive `(start, end)` spans into chunks of at most `max_samples`."""
+    groups: List[List[tuple]] = []
+    size = 0
+    for start, end in spans:
+        n = end - start
+        if groups and size + separator + n <= max_samples:
+            groups[-1].append((start, end))
+            size += separator + n
+        else:
+            groups.append([(start, end)])
+            size = n
+    return groups
+
+
+def _to_original(pieces: List[tuple]):
+    """Map chunk seconds back to recording seconds; `pieces` are (chunk_start, start, length)."""
+    chunk_starts = np.array([p[0] for p in pieces])
+
+    def convert(t: float) -> float:
+        x = t * SAMPLE_RATE
+        i = max(int(np.searchsorted(chunk_starts, x, side="right")) - 1, 0)
+        chunk_start, start, length = pieces[i]
+        return round((start + min(max(x - chunk_start, 0), length)) / SAMPLE_RATE, 3)
+
+    return convert
+
+
+def transcribe_voiced(
+    audio: np.ndarray,
+    mask: np.ndarray,
+    model_name: str = "base",
+    backend: Optional[str] = None,
+    initial_prompt: Optional[str] = None,
+) -> Dict:
+    """Transcribe only the speech in `audio`, given its VAD `mask`.
+
+    Voiced regions (padded, merged across short pauses) are packed into chunks that fill
+    Whisper's 30 s window, joined by a short silence, and every chunk is transcribed in one
+    call. Segment and word times are mapped back onto the original timeline, so the result
+    is a drop‑in replacement for `transcribe_audio`'s. Silence is never decoded, which saves
+    its ASR time and keeps Whisper from hallucinating text in it. `initial_prompt` is passed
+    to every chunk.
+    """
+    spans = pause_detection.speech_spans(
+        mask, VAD_FRAME_MS, SAMPLE_RATE, len(audio), VAD_GATE_PAD_SEC, VAD_GATE_MERGE_SEC
     )
-    features = smile.process_file(str(path))
+    asr = get_backend(backend, model_name)
+    separator = np.zeros(int(VAD_GATE_SEPARATOR_SEC * SAMPLE_RATE), dtype=np.float32)
+
+    texts: List[str] = []
+    segments: List[Dict] = []
+    language = None
+    for group in pack_spans(spans, int(VAD_GATE_CHUNK_SEC * SAMPLE_RATE), len(separator)):
+        parts, pieces, pos = [], [], 0
+        for start, end in group:
+            if parts:
+                parts.append(separator)
+                pos += len(separator)
+            pieces.append((pos, start, end - start))
+            parts.append(audio[start:end])
+            pos += end - start
+
+        result = asr.transcribe(np.concatenate(parts), initial_prompt=initial_prompt)
+        to_original = _to_original(pieces)
+        for seg in result["segments"]:
+            words = [{**w, "start": to_original(w["start"]), "end": to_original(w["end"])} for w in seg.get("words", ())]
+            segments.append({**seg, "start": to_original(seg["start"]), "end": to_original(seg["end"]), "words": words})
+        texts.append(result["text"])
+        language = language or result.get("language")
+
+    return {"text": "".join(texts), "segments": segments, "language": language}
+
+
+def extract_prosody(audio: np.ndarray, sr: int = SAMPLE_RATE) -> Dict[str, float]:
+    """Call openSMILE to compute core prosodic features (pitch, jitter, shimmer, loudness)."""
+    smile = get_smile()
+    features = smile.process_signal(audio, sr)
 
     # Select representative statistics
     def safe_mean(col):
@@ -119,67 +233,79 @@ def extract_prosody(path: Path) -> Dict[str, float]:
     }
 
 
-def detect_pauses(path: Path, frame_duration_ms: int = 30, vad_aggressiveness: int = 2) -> Dict[str, float]:
-    """Use webrtcvad to compute pause statistics (count, total, longest)."""
-    wf = sf.SoundFile(str(path))
-    audio, sr = sf.read(str(path))
-
-    vad = webrtcvad.Vad(vad_aggressiveness)
-    num_samples_per_frame = int(sr * frame_duration_ms / 1000)
-
-    # If stereo convert to mono
-    if audio.ndim == 2:
-        audio = audio.mean(axis=1)
-
-    # Convert to 16‑bit PCM as bytes (required by webrtcvad)
-    int16 = np.int16(audio / np.max(np.abs(audio)) * 32767)
-    bytes_audio = int16.tobytes()
-
-    n_frames = len(int16) // num_samples_per_frame
-    voiced = []
-    for i in range(n_frames):
-        start = i * num_samples_per_frame * 2  # 2 bytes per sample
-        end = start + num_samples_per_frame * 2
-        frame = bytes_audio[start:end]
-        voiced.append(vad.is_speech(frame, sample_rate=sr))
+def detect_pauses(
+    audio: np.ndarray, sr: int = SAMPLE_RATE, frame_duration_ms: int = 30, vad_aggressiveness: int = 2
+) -> Dict[str, float | List]:
+    """Use webrtcvad to compute pause statistics (count, total, longest) and the pause timeline."""
+    return pause_detection.detect_pauses(audio, sr, frame_duration_ms, vad_aggressiveness)
 
-    pauses = []
-    current = 0
-    for v in voiced:
-        if not v:
-            current += 1
-        elif current > 0:
-            pauses.append(current)
-            current = 0
-    if current > 0:
-        pauses.append(current)
 
-    pause_durations_sec = [p * frame_duration_ms / 1000 for p in pauses]
-
-    if not pause_durations_sec:
-        return {"pause_count": 0, "total_pause": 0.0, "longest_pause": 0.0}
-
-    return {
-        "pause_count": len(pause_durations_sec),
-        "total_pause": float(sum(pause_durations_sec)),
-        "longest_pause": float(max(pause_durations_sec)),
-    }
-
-
-def analyse_emotion(path: Path, device: str = "cpu") -> Dict[str, float]:
-    """Predict emotion probabilities using SpeechBrain's SEMD model."""
-    classifier = EncoderClassifier.from_hparams(
-        source="speechbrain/emotion-recognition-wav2vec2-IEMOCAP",
-        savedir="pretrained_models/sb_emotion",
-        run_opts={"device": device},
-    )
-    signal, sr = librosa.load(str(path), sr=16000)
+def _emotion_probs(classifier, batch: np.ndarray) -> tuple[List[str], np.ndarray]:
+    """Return (labels, probs[batch, n_labels]) for a `[batch, time]` float32 array."""
     # speechbrain expects tensor [batch, time]
     with torch.no_grad():
-        prediction = classifier.classify_batch(torch.tensor(signal).unsqueeze(0))
-    probs = torch.softmax(prediction[0], dim=-1)[0]
-    labels = classifier.hparams.label_encoder.decode_ndim(torch.arange(len(probs))).tolist()
-    return {label: float(prob) for label, prob in zip(labels, probs)}
+        prediction = classifier.classify_batch(torch.from_numpy(np.ascontiguousarray(batch)))
+    probs = torch.softmax(prediction[0], dim=-1)
+    labels = classifier.hparams.label_encoder.decode_ndim(torch.arange(probs.shape[-1])).tolist()
+    return labels, probs.reshape(len(batch), -1).numpy()
+
+
+def emotion_windows(audio: np.ndarray, window_sec: float, hop_sec: float, sr: int = SAMPLE_RATE) -> np.ndarray:
+    """Start samples of overlapping windows covering `audio`; the last one is end‑aligned."""
+    win, hop = int(window_sec * sr), int(hop_sec * sr)
+    if len(audio) <= win:
+        return np.array([0])
+    starts = np.arange(0, len(audio) - win + 1, hop)
+    if starts[-1] + win < len(audio):
+        starts = np.append(starts, len(audio) - win)
+    return starts
+
+
+def analyse_emotion(audio: np.ndarray, device: str = "cpu") -> Dict[str, float]:
+    """Predict emotion probabilities from a 16 kHz waveform using SpeechBrain's SEMD model."""
+    return analyse_emotion_windowed(audio, device=device)["profile"]
+
+
+def analyse_emotion_windowed(
+    audio: np.ndarray,
+    device: str = "cpu",
+    window_sec: float = 10.0,
+    hop_sec: float = 5.0,
+    batch_size: int = 8,
+) -> Dict[str, Dict | List]:
+    """Emotion profile plus a per‑window timeline, with bounded memory for long recordings.
+
+    The waveform is cut into fixed `window_sec` windows every `hop_sec` seconds (zero‑copy
+    views) and classified `batch_size` windows at a time, so peak memory and wav2vec2
+    attention cost depend on the window length, not the recording length. The profile is
+    the mean of the window distributions. Clips shorter than one window are classified
+    whole, exactly as before.
+    """
+    classifier = get_emotion_classifier(device)
+    sr = SAMPLE_RATE
+
+    starts = emotion_windows(audio, window_sec, hop_sec, sr)
+    win = min(len(audio), int(window_sec * sr))
+    views = np.lib.stride_tricks.sliding_window_view(audio, win)
+
+    labels: List[str] = []
+    window_probs = []
+    for i in range(0, len(starts), batch_size):
+        labels, probs = _emotion_probs(classifier, views[starts[i : i + batch_size]])
+        window_probs.append(probs)
+    window_probs = np.concatenate(window_probs)
+
+    profile = window_probs.mean(axis=0)
+    timeline = [
+        {
+            "start": round(float(start) / sr, 2),
+            "end": round(float(start + win) / sr, 2),
+            "label": labels[int(np.argmax(probs))],
+            "probs": {label: float(p) for label, p in zip(labels, probs)},
+        }
+        for start, probs in zip(starts, window_probs)
+    ]
+    return {"profile": {label: float(p) for label, p in zip(labels, profile)}, "timeline": timeline}
 
 
 def lexical_metrics(transcript: str) -> Dict[str, float]:
@@ -198,10 +324,9 @@ def lexical_metrics(transcript: str) -> Dict[str, float]:
     }
 
 
-def filler_stats(words: List[str]) -> Dict[str, float]:
-    filler = [w for w in words if any(fuzz.ratio(w, f) > 85 for f in FILLER_WORDS)]
-    filler_ratio = len(filler) / (len(words) + 1e-9)
-    return {"filler_count": len(filler), "filler_ratio": filler_ratio}
+def filler_stats(words: List[Dict]) -> Dict:
+    """Counts, ratio and timed occurrences of fillers in Whisper's word list."""
+    return FILLER_DETECTOR.analyse_words(words)
 
 
 def compute_scores(metrics: Dict[str, float | Dict]) -> Dict[str, float | Dict]:
@@ -242,53 +367,165 @@ def compute_scores(metrics: Dict[str, float | Dict]) -> Dict[str, float | Dict]:
     }
 
 
-def assess_voice(audio_path: str | Path, whisper_model: str = "base", device: str = "cpu") -> Dict:
-    """Main high‑level function: returns a nested dict of raw metrics + scores."""
-    path = Path(audio_path)
-    if not path.exists():
-        raise FileNotFoundError(path)
+def transcript_words(transcription: Dict) -> List[Dict]:
+    """Whisper's timed words (`word`, `start`, `end`) across all segments."""
+    return [w for seg in transcription["segments"] for w in seg.get("words", ())]
 
-    # --- ASR ---
-    transcription = transcribe_audio(path, model_name=whisper_model)
-    words = []
-    total_duration = transcription.get("duration", None)
-    if total_duration is None:
-        # derive duration via librosa
-        total_duration = librosa.get_duration(filename=str(path))
 
-    for seg in transcription["segments"]:
-        words.extend([w["text"].strip().lower() for w in seg["words"]])
+def transcript_lexical_metrics(transcription: Dict) -> Dict[str, float]:
+    return lexical_metrics(transcription["text"])
 
-    speech_pace_wpm = len(words) / (total_duration / 60 + 1e-9)
 
-    # --- Filler words ---
-    filler = filler_stats(words)
-
-    # --- Prosody ---
-    prosody = extract_prosody(path)
-
-    # --- Pauses ---
-    pause_stats = detect_pauses(path)
+def cached_stage_specs(
+    whisper_model: str, asr_backend: Optional[str] = None, vad_gate: bool = False
+) -> Dict[str, tuple]:
+    """Stages whose results go to the analysis cache: name -> (model, parameters)."""
+    asr_params = {"word_timestamps": True}
+    if vad_gate:
+        asr_params["vad_gate"] = {
+            "frame_ms": VAD_FRAME_MS,
+            "aggressiveness": VAD_AGGRESSIVENESS,
+            "pad_sec": VAD_GATE_PAD_SEC,
+            "merge_sec": VAD_GATE_MERGE_SEC,
+            "chunk_sec": VAD_GATE_CHUNK_SEC,
+            "separator_sec": VAD_GATE_SEPARATOR_SEC,
+        }
+    return {
+        "duration": (None, {"sr": SAMPLE_RATE}),
+        "transcription": (get_backend(asr_backend, whisper_model).model_id, asr_params),
+        "prosody": ("opensmile/" + "/".join(SMILE_FEATURES), {"sr": SAMPLE_RATE}),
+        "vad_mask": ("webrtcvad", {"frame_ms": VAD_FRAME_MS, "aggressiveness": VAD_AGGRESSIVENESS}),
+        "emotion": (EMOTION_MODEL, {"window_sec": EMOTION_WINDOW_SEC, "hop_sec": EMOTION_HOP_SEC}),
+    }
 
-    # --- Emotion ---
-    emotion = analyse_emotion(path, device=device)
 
-    # --- Lexical richness ---
-    lexical = lexical_metrics(transcription["text"])
+def _cached_result(value):
+    return value
+
+
+def assess_voice(
+    audio: str | Path | np.ndarray,
+    whisper_model: str = "base",
+    device: str = "cpu",
+    sr: Optional[int] = None,
+    stage_kinds: Optional[Dict[str, str]] = None,
+    use_cache: bool = True,
+    asr_backend: Optional[str] = None,
+    vad_gate: bool = False,
+) -> Dict:
+    """Main high‑level function: returns a nested dict of raw metrics + scores.
+
+    `audio` is a file path or an in‑memory waveform (pass its `sr` if it is not 16 kHz).
+    It is decoded and resampled once; every analyser below shares that buffer.
+
+    ASR, prosody, pauses and emotion are independent and run concurrently; only the
+    filler and lexical metrics wait for the transcript. `stage_kinds` overrides where a
+    stage runs (`"thread"`, `"process"` or `"inline"`), e.g. `{"vad_mask": "process"}`.
+    Per‑stage wall times are returned under `stage_timings`.
+
+    With `use_cache` the ASR, prosody, VAD and emotion results are looked up in the
+    analysis cache first; when all of them hit, the audio is not even decoded and only
+    the cheap text metrics and `compute_scores` run.
+
+    `asr_backend` picks the speech recogniser (see `asr_backends`), e.g. `"faster-whisper"`
+    for int8 CTranslate2 on CPU. With `vad_gate` the recogniser waits for the VAD mask and
+    only transcribes the voiced regions (`transcribe_voiced`).
+    """
+    # --- Cache lookup ---
+    cache = get_cache() if use_cache else None
+    specs = cached_stage_specs(whisper_model, asr_backend, vad_gate)
+    keys: Dict[str, str] = {}
+    hits: Dict[str, object] = {}
+    if cache is not None:
+        media = cache.media_hash(audio, sr)
+        keys = {name: cache.key(media, name, *spec) for name, spec in specs.items()}
+        for name, key in keys.items():
+            value = cache.get(key)
+            if value is not None:
+                hits[name] = value
+
+    # --- Decode once, unless every heavy stage is cached ---
+    decode_start = time.perf_counter()
+    waveform = as_waveform(audio, sr) if len(hits) < len(specs) else None
+    if waveform is not None:
+        profiler.record("voice.decode", time.perf_counter() - decode_start)
+    total_duration = hits["duration"] if "duration" in hits else duration_sec(waveform)
+
+    kinds = {"words": INLINE, "filler": INLINE, "lexical": INLINE, "pause_stats": INLINE, **(stage_kinds or {})}
+    stages = [
+        # --- Pauses ---
+        # Stays a thread stage: webrtcvad takes ~70 ms for 5 min of audio, so the GIL is held
+        # only briefly, and shipping the waveform to a worker process costs more than that.
+        Stage(
+            "vad_mask",
+            pause_detection.voiced_mask,
+            ("audio",),
+            kwargs={"sr": SAMPLE_RATE, "frame_duration_ms": VAD_FRAME_MS, "vad_aggressiveness": VAD_AGGRESSIVENESS},
+        ),
+        Stage("pause_stats", pause_detection.pause_stats_from_mask, ("vad_mask",), kwargs={"frame_duration_ms": VAD_FRAME_MS}),
+        # --- ASR ---
+        Stage(
+            "transcription",
+            transcribe_voiced if vad_gate else transcribe_audio,
+            ("audio", "vad_mask") if vad_gate else ("audio",),
+            kwargs={"model_name": whisper_model, "backend": asr_backend},
+        ),
+        # --- Prosody ---
+        Stage("prosody", extract_prosody, ("audio",)),
+        # --- Emotion ---
+        Stage(
+            "emotion",
+            analyse_emotion_windowed,
+            ("audio",),
+            kwargs={"device": device, "window_sec": EMOTION_WINDOW_SEC, "hop_sec": EMOTION_HOP_SEC},
+        ),
+        # --- Filler words ---
+        Stage("words", transcript_words, ("transcription",)),
+        Stage("filler", filler_stats, ("words",)),
+        # --- Lexical richness ---
+        Stage("lexical", transcript_lexical_metrics, ("transcription",)),
+    ]
+    for stage in stages:
+        stage.kind = kinds.get(stage.name, stage.kind)
+    stages = [
+        Stage(s.name, _cached_result, kind=INLINE, kwargs={"value": hits[s.name]}) if s.name in hits else s
+        for s in stages
+    ]
+
+    results, timings = run_stages(stages, {"audio": waveform} if waveform is not None else {})
+    for name, sec in timings.items():
+        profiler.record(f"voice.{name}", sec)
+    if cache is not None:
+        fresh = {**results, "duration": total_duration}
+        for name, key in keys.items():
+            if name not in hits:
+                cache.put(key, fresh[name])
+    transcription = results["transcription"]
+    filler = results["filler"]
+    speech_pace_wpm = len(results["words"]) / (total_duration / 60 + 1e-9)
 
     raw_metrics = {
         "audio_duration_sec": total_duration,
         "speech_pace_wpm": speech_pace_wpm,
-        "prosody": prosody,
-        "pause_stats": pause_stats,
+        "prosody": results["prosody"],
+        "pause_stats": results["pause_stats"],
         "filler_ratio": filler["filler_ratio"],
         "filler_count": filler["filler_count"],
-        "emotion_profile": emotion,
-        "lexical": lexical,
+        "filler_counts": filler["filler_counts"],
+        "filler_occurrences": filler["filler_occurrences"],
+        "emotion_profile": results["emotion"]["profile"],
+        "emotion_timeline": results["emotion"]["timeline"],
+        "lexical": results["lexical"],
     }
 
     scores = compute_scores(raw_metrics)
-    return {**raw_metrics, **scores, "transcript": transcription["text"].strip()}
+    return {
+        **raw_metrics,
+        **scores,
+        "transcript": transcription["text"].strip(),
+        "stage_timings": {name: round(sec, 3) for name, sec in timings.items()},
+        "cached_stages": sorted(hits),
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -301,9 +538,19 @@ def _cli():
     parser.add_argument("--json-out", type=Path, default=None, help="Optional path to write JSON metrics")
     parser.add_argument("--model", default="base", help="Which Whisper model to use (tiny, base, small, medium, large)")
     parser.add_argument("--device", default="cpu", help="Torch device for emotion model (cpu or cuda)")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the analysis cache")
+    parser.add_argument("--asr-backend", choices=sorted(BACKENDS), default=None, help="Speech recognition engine")
+    parser.add_argument("--vad-gate", action="store_true", help="Only transcribe the voiced regions")
 
     args = parser.parse_args()
-    result = assess_voice(args.audio, whisper_model=args.model, device=args.device)
+    result = assess_voice(
+        args.audio,
+        whisper_model=args.model,
+        device=args.device,
+        use_cache=not args.no_cache,
+        asr_backend=args.asr_backend,
+        vad_gate=args.vad_gate,
+    )
 
     print(json.dumps(result, indent=2))
     if args.json_out:
@@ -0,0 +1,132 @@
+# worker_pool.py
+"""
+Long‑lived worker pool for assessing many recordings.
+
+Each worker process loads the ASR backend's model, openSMILE and the SpeechBrain emotion model once when
+it starts (through `model_registry`) and then keeps them warm for every clip it is given,
+so batch jobs stop paying seconds of model load per file.
+
+```python
+from worker_pool import VoiceAssessorPool
+
+with VoiceAssessorPool(workers=2, whisper_model="base") as pool:
+    for path, metrics in pool.assess_many(["a.wav", "b.wav", "c.wav"]):
+        print(path, metrics["overall_score"])
+```
+
+CLI:
+
+```bash
+python worker_pool.py clips/*.wav --workers 2 --jsonl-out metrics.jsonl
+```
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from asr_backends import BACKENDS
+
+_WORKER_OPTIONS: Dict = {}
+
+
+def _init_worker(whisper_model: str, device: str, torch_threads: int, options: Dict) -> None:
+    """Runs once per worker process: split CPU threads and preload every model."""
+    import torch
+
+    from asr_backends import get_backend
+    from model_registry import get_emotion_classifier, get_smile
+
+    torch.set_num_threads(torch_threads)
+    _WORKER_OPTIONS.update(whisper_model=whisper_model, device=device, **options)
+
+    get_backend(options["asr_backend"], whisper_model).load()
+    get_smile()
+    get_emotion_classifier(device)
+
+
+def _assess(path: str) -> Dict:
+    from voice_assessor import assess_voice
+
+    return assess_voice(path, **_WORKER_OPTIONS)
+
+
+class VoiceAssessorPool:
+    """Process pool whose workers keep the voice models loaded between calls."""
+
+    def __init__(
+        self,
+        workers: int = 2,
+        whisper_model: str = "base",
+        device: str = "cpu",
+        asr_backend: Optional[str] = None,
+        vad_gate: bool = False,
+        use_cache: bool = True,
+    ):
+        """`asr_backend`, `vad_gate` and `use_cache` are passed to every `assess_voice` call."""
+        self.workers = max(1, workers)
+        torch_threads = max(1, (os.cpu_count() or 1) // self.workers)
+        options = {"asr_backend": asr_backend, "vad_gate": vad_gate, "use_cache": use_cache}
+        self._executor = ProcessPoolExecutor(
+            max_workers=self.workers,
+            initializer=_init_worker,
+            initargs=(whisper_model, device, torch_threads, options),
+        )
+
+    def submit(self, path: str | Path):
+        return self._executor.submit(_assess, str(path))
+
+    def assess_many(self, paths: Iterable[str | Path]) -> Iterator[Tuple[str, Dict]]:
+        """Yield (path, metrics) in input order."""
+        paths = [str(p) for p in paths]
+        for path, metrics in zip(paths, self._executor.map(_assess, paths)):
+            yield path, metrics
+
+    def close(self) -> None:
+        self._executor.shutdown(wait=True)
+
+    def __enter__(self) -> "VoiceAssessorPool":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ---------------------------------------------------------------------------
+# CLI
+# ---------------------------------------------------------------------------
+
+def _cli(argv: Optional[list] = None):
+    parser = argparse.ArgumentParser(description="Assess many audio files with warm model workers")
+    parser.add_argument("audio", nargs="+", type=Path, help="Audio files to assess")
+    parser.add_argument("--workers", type=int, default=2, help="Number of worker processes")
+    parser.add_argument("--model", default="base", help="Which Whisper model to use")
+    parser.add_argument("--device", default="cpu", help="Torch device for emotion model (cpu or cuda)")
+    parser.add_argument("--asr-backend", choices=sorted(BACKENDS), default=None, help="Speech recognition engine")
+    parser.add_argument("--vad-gate", action="store_true", help="Only transcribe the voiced regions")
+    parser.add_argument("--no-cache", action="store_true", help="Ignore and do not update the analysis cache")
+    parser.add_argument("--jsonl-out", type=Path, default=None, help="Optional JSON‑lines output path")
+
+    args = parser.parse_args(argv)
+    out = open(args.jsonl_out, "w", encoding="utf-8") if args.jsonl_out else None
+    try:
+        with VoiceAssessorPool(
+            args.workers, args.model, args.device, args.asr_backend, args.vad_gate, not args.no_cache
+        ) as pool:
+            for path, metrics in pool.assess_many(args.audio):
+                line = json.dumps({"path": path, **metrics})
+                print(line)
+                if out:
+                    out.write(line + "\n")
+    finally:
+        if out:
+            out.close()
+
+
+if __name__ == "__main__":
+    _cli()
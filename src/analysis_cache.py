@@ -0,0 +1,235 @@
+# analysis_cache.py
+"""
+Content‑addressed on‑disk cache for the expensive analysis stages.
+
+Every entry is keyed by a hash of the **media content** (not its path), the stage name, the
+model that produced it and the stage parameters, so re‑running any assessor on the same
+recording skips ASR, openSMILE, VAD, emotion and MediaPipe and goes straight to scoring:
+
+```python
+cache = get_cache()
+media = cache.media_hash("talk.mp4")
+transcript = cache.cached(media, "transcription", lambda: run_whisper(...), model="base")
+```
+
+Values are pickled (dicts, NumPy arrays …); stages that produce a directory, such as a
+landmark trace, use `directory()` / `commit_directory()`. An SQLite index tracks sizes and
+last access; once the cache grows past `max_bytes` (default `PRESENCEAI_CACHE_MB`, 2 GB)
+the least recently used entries are evicted. File hashes are remembered per (path, size,
+mtime) so unchanged files are not re‑read. Bump `CACHE_VERSION` when a stage's output
+format changes.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import pickle
+import shutil
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Any, Callable, Dict, Optional
+
+import numpy as np
+
+CACHE_VERSION = 1
+DEFAULT_ROOT = Path(os.getenv("PRESENCEAI_CACHE_DIR", Path.home() / ".cache" / "presenceai" / "analysis"))
+DEFAULT_MAX_MB = float(os.getenv("PRESENCEAI_CACHE_MB", "2048"))
+
+_HASH_CHUNK = 1 << 20
+_MISSING = object()
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    key TEXT PRIMARY KEY,
+    path TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entries_last_access ON entries (last_access);
+CREATE TABLE IF NOT EXISTS media (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    hash TEXT NOT NULL
+);
+"""
+
+
+def _dir_size(path: Path) -> int:
+    return sum(f.stat().st_size for f in path.rglob("*") if f.is_file())
+
+
+class AnalysisCache:
+    def __init__(self, root: str | Path = DEFAULT_ROOT, max_bytes: Optional[int] = None):
+        self.root = Path(root)
+        self.root.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = int(DEFAULT_MAX_MB * 1024 * 1024) if max_bytes is None else max_bytes
+        self._index = self.root / "index.db"
+        with closing(self._connect()) as conn:
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self._index, timeout=30, isolation_level=None)
+        conn.execute("PRAGMA journal_mode=WAL")
+        return conn
+
+    # ------------------------------------------------------------------
+    # Keys
+    # ------------------------------------------------------------------
+
+    def media_hash(self, media: str | Path | np.ndarray, sr: Optional[int] = None) -> str:
+        """SHA‑256 of a file's bytes, or of an in‑memory waveform plus its sample rate."""
+        if isinstance(media, np.ndarray):
+            h = hashlib.sha256(f"{media.dtype}{media.shape}{sr}".encode())
+            h.update(np.ascontiguousarray(media).data)
+            return h.hexdigest()
+
+        path = Path(media).resolve()
+        st = path.stat()
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT hash FROM media WHERE path = ? AND size = ? AND mtime_ns = ?",
+                (str(path), st.st_size, st.st_mtime_ns),
+            ).fetchone()
+            if row:
+                return row[0]
+
+            h = hashlib.sha256()
+            with open(path, "rb") as f:
+                for chunk in iter(lambda: f.read(_HASH_CHUNK), b""):
+                    h.update(chunk)
+            digest = h.hexdigest()
+            conn.execute(
+                "INSERT OR REPLACE INTO media (path, size, mtime_ns, hash) VALUES (?, ?, ?, ?)",
+                (str(path), st.st_size, st.st_mtime_ns, digest),
+            )
+        return digest
+
+    @staticmethod
+    def key(media_hash: str, stage: str, model: Optional[str] = None, params: Optional[Dict] = None) -> str:
+        blob = json.dumps(
+            {"v": CACHE_VERSION, "media": media_hash, "stage": stage, "model": model, "params": params or {}},
+            sort_keys=True,
+            default=str,
+        )
+        return hashlib.sha256(blob.encode()).hexdigest()
+
+    # ------------------------------------------------------------------
+    # Values
+    # ------------------------------------------------------------------
+
+    def _file(self, key: str) -> Path:
+        return self.root / key[:2] / f"{key}.pkl"
+
+    def get(self, key: str, default: Any = None) -> Any:
+        path = self._file(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return default
+        self._touch(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        path = self._file(key)
+        path.parent.mkdir(exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp, "wb") as f:
+            pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp, path)
+        self._record(key, path, path.stat().st_size)
+
+    def cached(
+        self,
+        media_hash: str,
+        stage: str,
+        compute: Callable[[], Any],
+        model: Optional[str] = None,
+        params: Optional[Dict] = None,
+    ) -> Any:
+        """Return the stored result for this stage, computing and storing it on a miss."""
+        key = self.key(media_hash, stage, model, params)
+        value = self.get(key, _MISSING)
+        if value is _MISSING:
+            value = compute()
+            self.put(key, value)
+        return value
+
+    # --- Directory‑valued stages (landmark traces) ---
+
+    def directory(self, key: str) -> Path:
+        """Where a directory entry lives; complete only once `commit_directory` was called."""
+        return self.root / "dirs" / key
+
+    def has_directory(self, key: str) -> bool:
+        with closing(self._connect()) as conn:
+            row = conn.execute("SELECT 1 FROM entries WHERE key = ?", (key,)).fetchone()
+        if row and self.directory(key).is_dir():
+            self._touch(key)
+            return True
+        return False
+
+    def commit_directory(self, key: str) -> None:
+        path = self.directory(key)
+        self._record(key, path, _dir_size(path))
+
+    # ------------------------------------------------------------------
+    # Index and LRU eviction
+    # ------------------------------------------------------------------
+
+    def _touch(self, key: str) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute("UPDATE entries SET last_access = ? WHERE key = ?", (time.time(), key))
+
+    def _record(self, key: str, path: Path, size: int) -> None:
+        with closing(self._connect()) as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO entries (key, path, size, last_access) VALUES (?, ?, ?, ?)",
+                (key, str(path), size, time.time()),
+            )
+            self._evict(conn)
+
+    def _evict(self, conn: sqlite3.Connection) -> None:
+        total = conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+        if total <= self.max_bytes:
+            return
+        for key, path, size in conn.execute(
+            "SELECT key, path, size FROM entries ORDER BY last_access"
+        ).fetchall():
+            if total <= self.max_bytes:
+                break
+            self._remove(conn, key, Path(path))
+            total -= size
+
+    @staticmethod
+    def _remove(conn: sqlite3.Connection, key: str, path: Path) -> None:
+        if path.is_dir():
+            shutil.rmtree(path, ignore_errors=True)
+        else:
+            path.unlink(missing_ok=True)
+        conn.execute("DELETE FROM entries WHERE key = ?", (key,))
+
+    def size_bytes(self) -> int:
+        with closing(self._connect()) as conn:
+            return conn.execute("SELECT COALESCE(SUM(size), 0) FROM entries").fetchone()[0]
+
+    def clear(self) -> None:
+        with closing(self._connect()) as conn:
+            for key, path in conn.execute("SELECT key, path FROM entries").fetchall():
+                self._remove(conn, key, Path(path))
+
+
+_cache: Optional[AnalysisCache] = None
+
+
+def get_cache() -> AnalysisCache:
+    """Process‑wide cache rooted at `PRESENCEAI_CACHE_DIR`."""
+    global _cache
+    if _cache is None:
+        _cache = AnalysisCache()
+    return _cache
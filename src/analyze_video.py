@@ -0,0 +1,222 @@
+"""-------------------------------------------------------
+PresenceAI: Headless batch analysis of recorded videos
+-------------------------------------------------------
+Uses:    OpenCV, MediaPipe
+-------------------------------------------------------
+
+Splits a recording into time segments, runs the face, pose and hand
+pipelines on each segment in a separate process and merges the per-segment
+counters into one session result.
+
+    python analyze_video.py interview.mp4 --workers 4 --json-out result.json
+"""
+
+import argparse
+import json
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import cv2 as cv
+
+from analysis_cache import get_cache
+from FacialRecognition.input import FrameSource
+from landmark_trace import LandmarkTrace, TraceRecorder, replay
+from multimodal import MultiModalAnalyzer, summarize_states
+
+
+def plan_segments(video_path, segment_seconds=30.0):
+    """Return (fps, [(start_frame, end_frame), ...]) covering the whole video.
+
+    Streams without a frame count (e.g. MediaRecorder ``.webm``) get a single
+    segment ``(0, None)`` that is read sequentially to the end.
+    """
+    cap = cv.VideoCapture(video_path)
+    if not cap.isOpened():
+        raise RuntimeError(f"Cannot open video: {video_path}")
+    fps = cap.get(cv.CAP_PROP_FPS) or 30.0
+    total = int(cap.get(cv.CAP_PROP_FRAME_COUNT))
+    cap.release()
+
+    if total <= 0:
+        return fps, [(0, None)]
+    step = max(1, int(round(segment_seconds * fps)))
+    return fps, [(start, min(start + step, total)) for start in range(0, total, step)]
+
+
+def analyze_segment(
+    video_path,
+    start_frame,
+    end_frame,
+    redetect_interval=30,
+    face_stride=1,
+    trace_path=None,
+):
+    """Run every pipeline over [start_frame, end_frame) and return raw counters.
+
+    ``end_frame=None`` reads to the end of the video.
+
+    Each segment starts with fresh model and tracking state, so motion that
+    spans a segment boundary is not counted; with segments of tens of seconds
+    this is a handful of frames per session.
+    """
+    cv.setNumThreads(1)  # the process pool already uses every core
+
+    with FrameSource(video_path) as frames:
+        recorder = TraceRecorder(trace_path, frames.fps) if trace_path else None
+        analyzer = MultiModalAnalyzer(
+            redetect_interval=redetect_interval,
+            face_stride=face_stride,
+            recorder=recorder,
+        )
+        frames.seek(start_frame)
+        for frame in frames:
+            if end_frame is not None and frame.index >= end_frame:
+                break
+            analyzer.process(frame)
+
+    analyzer.close()
+    if recorder is not None:
+        recorder.close()
+    return analyzer.state()
+
+
+def segment_trace_path(trace_dir, start_frame):
+    return os.path.join(trace_dir, f"segment_{start_frame:08d}.trace")
+
+
+def merge_segments(segment_results, fps):
+    """Combine per-segment counters into the session-level metrics."""
+    return {
+        **summarize_states(segment_results, fps),
+        "segments": len(segment_results),
+    }
+
+
+def analyze_video(
+    video_path,
+    segment_seconds=30.0,
+    workers=None,
+    redetect_interval=30,
+    face_stride=1,
+    trace_dir=None,
+    cache=None,
+):
+    """Analyze a video; with ``trace_dir`` each segment also saves a landmark trace.
+
+    With an ``AnalysisCache`` the traces are stored under the video's content
+    hash, and later runs on the same video replay them instead of running
+    MediaPipe again.
+    """
+    fps, segments = plan_segments(video_path, segment_seconds)
+    if not segments:
+        return merge_segments([], fps)
+
+    key = None
+    if cache is not None and trace_dir is None:
+        key = cache.key(
+            cache.media_hash(video_path),
+            "landmark_trace",
+            "mediapipe",
+            {
+                "segment_seconds": segment_seconds,
+                "redetect_interval": redetect_interval,
+                "face_stride": face_stride,
+            },
+        )
+        if cache.has_directory(key):
+            return replay_traces(cache.directory(key), fps)
+        trace_dir = str(cache.directory(key))
+
+    jobs = [
+        (
+            video_path,
+            s,
+            e,
+            redetect_interval,
+            face_stride,
+            segment_trace_path(trace_dir, s) if trace_dir else None,
+        )
+        for s, e in segments
+    ]
+    workers = min(workers or os.cpu_count() or 1, len(segments))
+    if workers == 1:
+        results = [analyze_segment(*job) for job in jobs]
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            futures = [pool.submit(analyze_segment, *job) for job in jobs]
+            results = [f.result() for f in futures]
+    if key is not None:
+        cache.commit_directory(key)
+    return merge_segments(results, fps)
+
+
+def replay_traces(trace_dir, fps):
+    """Re-score the per-segment traces in ``trace_dir`` without decoding video."""
+    paths = sorted(
+        os.path.join(trace_dir, name)
+        for name in os.listdir(trace_dir)
+        if name.endswith(".trace")
+    )
+    return merge_segments([replay(LandmarkTrace(path)) for path in paths], fps)
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        prog="analyze-video",
+        description="Analyze a recorded video headlessly across all CPU cores.",
+    )
+    parser.add_argument("video", help="Path to the recorded video")
+    parser.add_argument(
+        "--segment-seconds",
+        type=float,
+        default=30.0,
+        help="Length of the time segment handed to each worker",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    parser.add_argument(
+        "--redetect-interval",
+        type=int,
+        default=30,
+        help="Frames between full-frame face detections (0 = every frame)",
+    )
+    parser.add_argument(
+        "--stride",
+        type=int,
+        default=1,
+        help="Run FaceMesh every N frames and interpolate landmarks in between",
+    )
+    parser.add_argument(
+        "--trace-dir",
+        default=None,
+        help="Save a landmark trace per segment here, for landmark_trace.py",
+    )
+    parser.add_argument(
+        "--no-cache",
+        action="store_true",
+        help="Ignore and do not update the analysis cache",
+    )
+    parser.add_argument("--json-out", default=None, help="Optional path to write JSON")
+    args = parser.parse_args()
+
+    result = analyze_video(
+        args.video,
+        args.segment_seconds,
+        args.workers,
+        args.redetect_interval,
+        args.stride,
+        args.trace_dir,
+        None if args.no_cache else get_cache(),
+    )
+    print(json.dumps(result, indent=2))
+    if args.json_out:
+        with open(args.json_out, "w", encoding="utf-8") as f:
+            json.dump(result, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
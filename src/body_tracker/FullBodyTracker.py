@@ -2,100 +2,217 @@ import cv2
 import mediapipe as mp
 import numpy as np
 import datetime
+import os
+import sys
+import time
+
+# Stage timings go to the shared profiler in src/ (a no-op unless PRESENCEAI_PROFILE is set)
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC not in sys.path:
+    sys.path.append(_SRC)
+from profiling import timer
 
 # === Initialize MediaPipe Pose ===
 mp_drawing = mp.solutions.drawing_utils
 mp_pose = mp.solutions.pose
-pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
-
-cap = cv2.VideoCapture(0)
-
-ignore_indices = set(range(0, 11))  # ignore face & wrist landmarks
-
-# === Tracking Vars ===
-static_frame_count = 0
-total_frames = 0
-bounce_score = 0
-prev_positions = None
-sway_score = 0
-lean_score = 0
-arm_expressiveness = 0
-arm_cross_frames = 0
-
-print("Tracking started... Press ESC to stop.")
-
-while cap.isOpened():
-    ret, frame = cap.read()
-    if not ret:
-        break
-
-    image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = pose.process(image)
-    image = cv2.cvtColor(image, cv2.COLOR_RGB2BGR)
-
-    if results.pose_landmarks:
-        lm = results.pose_landmarks.landmark
-        frame_h, frame_w = image.shape[:2]
-
-        keypoints = []
-        for i, point in enumerate(lm):
-            if i in ignore_indices:
-                continue
-            keypoints.append((int(point.x * frame_w), int(point.y * frame_h)))
-
-        for x, y in keypoints:
-            cv2.circle(image, (x, y), 5, (0, 255, 0), -1)
-
-        keypoints_array = np.array(keypoints)
-        if prev_positions is not None:
-            movement = np.linalg.norm(keypoints_array - prev_positions)
-            if movement < 5.0:
-                static_frame_count += 1
-        prev_positions = keypoints_array
-
-        l_shoulder = lm[mp_pose.PoseLandmark.LEFT_SHOULDER.value]
-        r_shoulder = lm[mp_pose.PoseLandmark.RIGHT_SHOULDER.value]
-        mid_y = (l_shoulder.y + r_shoulder.y) / 2
-        bounce_score += abs(mid_y - 0.5)
-
-        mid_x = (l_shoulder.x + r_shoulder.x) / 2
-        sway_score += abs(mid_x - 0.5)
-
-        l_hip = lm[mp_pose.PoseLandmark.LEFT_HIP.value]
-        r_hip = lm[mp_pose.PoseLandmark.RIGHT_HIP.value]
-        torso_y = (l_hip.y + r_hip.y + l_shoulder.y + r_shoulder.y) / 4
-        lean_score += abs(torso_y - 0.5)
-
-        l_elbow = lm[mp_pose.PoseLandmark.LEFT_ELBOW.value]
-        r_elbow = lm[mp_pose.PoseLandmark.RIGHT_ELBOW.value]
-        arm_expressiveness += abs(l_elbow.y - r_elbow.y)
-
-        if (l_elbow.x > l_shoulder.x) and (r_elbow.x < r_shoulder.x):
-            arm_cross_frames += 1
-
-    total_frames += 1
-    cv2.imshow('PresenceAI - Full Body Tracking', image)
-
-    if cv2.waitKey(5) & 0xFF == 27:
-        break
-
-cap.release()
-cv2.destroyAllWindows()
-
-# === Final Metrics ===
-static_ratio = static_frame_count / total_frames if total_frames else 0
-bounce_avg = bounce_score / total_frames if total_frames else 0
-sway_avg = sway_score / total_frames if total_frames else 0
-lean_avg = lean_score / total_frames if total_frames else 0
-arm_express_avg = arm_expressiveness / total_frames if total_frames else 0
-arm_cross_ratio = arm_cross_frames / total_frames if total_frames else 0
-
-# === Print the results ===
-print("\n--- Full Body Tracking Summary ---")
-print(f"Total Duration (s): {round(total_frames / 30, 2)}")
-print(f"Stillness Ratio: {round(static_ratio * 100, 2)}%")
-print(f"Posture Bounce Score: {round(bounce_avg, 3)}")
-print(f"Body Sway Score: {round(sway_avg, 3)}")
-print(f"Lean Score: {round(lean_avg, 3)}")
-print(f"Arm Expressiveness: {round(arm_express_avg, 3)}")
-print(f"Arm Cross Ratio: {round(arm_cross_ratio * 100, 2)}%")
+
+POSE_IGNORE = 11  # ignore face landmarks 0-10
+STATIC_THRESHOLD = 5.0  # pixels of total keypoint movement between frames
+
+L_SHOULDER = mp_pose.PoseLandmark.LEFT_SHOULDER.value
+R_SHOULDER = mp_pose.PoseLandmark.RIGHT_SHOULDER.value
+L_ELBOW = mp_pose.PoseLandmark.LEFT_ELBOW.value
+R_ELBOW = mp_pose.PoseLandmark.RIGHT_ELBOW.value
+L_HIP = mp_pose.PoseLandmark.LEFT_HIP.value
+R_HIP = mp_pose.PoseLandmark.RIGHT_HIP.value
+
+
+def landmarks_to_array(pose_landmarks):
+    """MediaPipe pose landmarks -> (33, 4) float32 array of x, y, z, visibility."""
+    return np.array(
+        [(p.x, p.y, p.z, p.visibility) for p in pose_landmarks.landmark],
+        dtype=np.float32,
+    )
+
+
+class BodyMetrics:
+    """Stillness, bounce, sway, lean and arm statistics over pose landmarks.
+
+    ``update`` takes one (33, 4) array (or None when no pose was found) and
+    ``update_batch`` a (T, 33, 4) array with NaN rows for missing frames, so a
+    whole recording can be scored in one call. Both give identical results.
+    """
+
+    def __init__(self, frame_shape=(480, 640), static_threshold=STATIC_THRESHOLD):
+        self.frame_shape = frame_shape
+        self.static_threshold = static_threshold
+        self.total_frames = 0
+        self.static_frames = 0
+        self.bounce_sum = 0.0
+        self.sway_sum = 0.0
+        self.lean_sum = 0.0
+        self.arm_expressiveness_sum = 0.0
+        self.arm_cross_frames = 0
+        self.keypoints = None  # pixel keypoints of the last frame with a pose
+
+    def _pixels(self, landmarks, frame_shape):
+        h, w = (frame_shape or self.frame_shape)[:2]
+        xy = landmarks[..., POSE_IGNORE:, :2].astype(np.float64) * (w, h)
+        return xy.astype(np.int64)
+
+    def update(self, landmarks, frame_shape=None):
+        """Add one frame; returns this frame's (22, 2) pixel keypoints or None."""
+        if landmarks is None:
+            self.total_frames += 1
+            return None
+        return self.update_batch(landmarks[np.newaxis], frame_shape)[-1]
+
+    def update_batch(self, landmarks, frame_shape=None):
+        """Add T frames at once; returns the pixel keypoints of the frames with a pose."""
+        landmarks = np.asarray(landmarks)
+        self.total_frames += len(landmarks)
+        lm = landmarks[~np.isnan(landmarks[:, 0, 0])].astype(np.float64)
+        if not len(lm):
+            return np.empty((0, 33 - POSE_IGNORE, 2), dtype=np.int64)
+
+        # Stillness: movement between consecutive frames that had a pose
+        keypoints = self._pixels(lm, frame_shape)
+        track = keypoints if self.keypoints is None else np.concatenate(
+            [self.keypoints[np.newaxis], keypoints]
+        )
+        movement = np.linalg.norm(np.diff(track, axis=0), axis=(1, 2))
+        self.static_frames += int(np.count_nonzero(movement < self.static_threshold))
+        self.keypoints = keypoints[-1]
+
+        x, y = lm[:, :, 0], lm[:, :, 1]
+        mid_y = (y[:, L_SHOULDER] + y[:, R_SHOULDER]) / 2
+        mid_x = (x[:, L_SHOULDER] + x[:, R_SHOULDER]) / 2
+        torso_y = (y[:, L_HIP] + y[:, R_HIP] + y[:, L_SHOULDER] + y[:, R_SHOULDER]) / 4
+        self.bounce_sum += float(np.abs(mid_y - 0.5).sum())
+        self.sway_sum += float(np.abs(mid_x - 0.5).sum())
+        self.lean_sum += float(np.abs(torso_y - 0.5).sum())
+        self.arm_expressiveness_sum += float(np.abs(y[:, L_ELBOW] - y[:, R_ELBOW]).sum())
+        crossed = (x[:, L_ELBOW] > x[:, L_SHOULDER]) & (x[:, R_ELBOW] < x[:, R_SHOULDER])
+        self.arm_cross_frames += int(np.count_nonzero(crossed))
+        return keypoints
+
+    def state(self):
+        """Raw counters; states from several segments can be summed key by key."""
+        return {
+            "frames": self.total_frames,
+            "static_frames": self.static_frames,
+            "bounce_sum": self.bounce_sum,
+            "sway_sum": self.sway_sum,
+            "lean_sum": self.lean_sum,
+            "arm_expressiveness_sum": self.arm_expressiveness_sum,
+            "arm_cross_frames": self.arm_cross_frames,
+        }
+
+    def summary(self):
+        n = self.total_frames or 1
+        return {
+            "body_static_ratio": round(self.static_frames / n, 3),
+            "bounce_score": round(self.bounce_sum / n, 3),
+            "sway_score": round(self.sway_sum / n, 3),
+            "lean_score": round(self.lean_sum / n, 3),
+            "arm_expressiveness": round(self.arm_expressiveness_sum / n, 3),
+            "arm_cross_ratio": round(self.arm_cross_frames / n, 3),
+        }
+
+
+def _disk_offsets(radius):
+    stamp = np.zeros((2 * radius + 1, 2 * radius + 1), np.uint8)
+    cv2.circle(stamp, (radius, radius), radius, 1, -1)
+    dy, dx = np.nonzero(stamp)
+    return dy - radius, dx - radius
+
+
+_DOT_DY, _DOT_DX = _disk_offsets(5)
+
+
+def draw_keypoints(image, keypoints, color=(0, 255, 0)):
+    """Stamp a filled 5 px dot on every (x, y) keypoint with one indexed write."""
+    h, w = image.shape[:2]
+    ys = (keypoints[:, 1, np.newaxis] + _DOT_DY).ravel()
+    xs = (keypoints[:, 0, np.newaxis] + _DOT_DX).ravel()
+    inside = (ys >= 0) & (ys < h) & (xs >= 0) & (xs < w)
+    image[ys[inside], xs[inside]] = color
+    return image
+
+
+def main():
+    from session_store import get_writer
+
+    # === Stream metrics into the session document when a session is active ===
+    session_id = os.getenv("SESSION_ID")
+    writer = get_writer(name="body_tracker") if session_id else None
+
+    pose = mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+    cap = cv2.VideoCapture(0)
+    metrics = BodyMetrics()
+    start_time = time.time()
+    last_sample_time = start_time
+
+    print("Tracking started... Press ESC to stop.")
+
+    while cap.isOpened():
+        with timer("decode"):
+            ret, frame = cap.read()
+        if not ret:
+            break
+
+        with timer("color_convert"):
+            image = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        with timer("pose.model"):
+            results = pose.process(image)
+
+        if results.pose_landmarks:
+            with timer("pose.metrics"):
+                keypoints = metrics.update(
+                    landmarks_to_array(results.pose_landmarks), image.shape
+                )
+            with timer("draw"):
+                draw_keypoints(frame, keypoints)
+        else:
+            metrics.update(None)
+
+        now = time.time()
+        if writer and now - last_sample_time >= 1.0:
+            with timer("log"):
+                writer.append(session_id, "body_tracking", {
+                    "t": round(now - start_time, 3),
+                    **metrics.summary(),
+                })
+            last_sample_time = now
+
+        with timer("display"):
+            cv2.imshow('PresenceAI - Full Body Tracking', frame)
+            key = cv2.waitKey(5)
+
+        if key & 0xFF == 27:
+            break
+
+    elapsed = time.time() - start_time
+
+    cap.release()
+    cv2.destroyAllWindows()
+
+    # === Print the results ===
+    summary = metrics.summary()
+    print("\n--- Full Body Tracking Summary ---")
+    print(f"Total Duration (s): {round(elapsed, 2)}")
+    print(f"Frames: {metrics.total_frames} ({round(metrics.total_frames / (elapsed or 1), 1)} fps)")
+    print(f"Stillness Ratio: {round(summary['body_static_ratio'] * 100, 2)}%")
+    print(f"Posture Bounce Score: {summary['bounce_score']}")
+    print(f"Body Sway Score: {summary['sway_score']}")
+    print(f"Lean Score: {summary['lean_score']}")
+    print(f"Arm Expressiveness: {summary['arm_expressiveness']}")
+    print(f"Arm Cross Ratio: {round(summary['arm_cross_ratio'] * 100, 2)}%")
+
+    if writer:
+        writer.set(session_id, {"body_tracking": summary})
+        writer.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -1,91 +1,251 @@
 import cv2
 import mediapipe as mp
+import numpy as np
 import time
 import os
+import sys
 import datetime
-from pymongo import MongoClient
 
-# === Connect to MongoDB ===
-MONGO_URI = os.getenv("MONGO_URI")
-client = MongoClient(MONGO_URI)
-db = client["presenceAI"]
-sessions = db["sessions"]
+# Stage timings go to the shared profiler in src/ (a no-op unless PRESENCEAI_PROFILE is set)
+_SRC = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if _SRC not in sys.path:
+    sys.path.append(_SRC)
+from profiling import timer
 
-# === Set session ID (must match the one used by FullBodyTracker) ===
-SESSION_ID = os.getenv("SESSION_ID")  # Recommended: pass this from SessionManager
-USER_ID = "sawaab"
-
-# === Initialize MediaPipe Hand Tracking ===
+# === MediaPipe Hand Tracking ===
 mp_hands = mp.solutions.hands
-hands = mp_hands.Hands()
 mp_drawing = mp.solutions.drawing_utils
 
-cap = cv2.VideoCapture(0)
-
-prev_coords = None
-static_frames = 0
-total_frames = 0
-total_movement = 0
-high_activity_frames = 0
-start_time = time.time()
-
-print("Hand Tracking started... Press ESC to stop.")
-
-while cap.isOpened():
-    success, frame = cap.read()
-    if not success:
-        break
-
-    frame = cv2.flip(frame, 1)
-    rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-    results = hands.process(rgb)
-
-    hand_coords = []
-
-    if results.multi_hand_landmarks:
-        for hand_landmarks in results.multi_hand_landmarks:
-            mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
-            x = sum([lm.x for lm in hand_landmarks.landmark]) / 21
-            y = sum([lm.y for lm in hand_landmarks.landmark]) / 21
-            hand_coords.append((x, y))
-
-        if prev_coords:
-            movement = sum([
-                abs(x1 - x2) + abs(y1 - y2)
-                for (x1, y1), (x2, y2) in zip(hand_coords, prev_coords)
-            ])
-            total_movement += movement
-            if movement < 0.01:
-                static_frames += 1
-            if movement > 0.1:
-                high_activity_frames += 1
-        prev_coords = hand_coords
-
-    total_frames += 1
-    cv2.imshow("PresenceAI - Hand Tracking", frame)
-
-    if cv2.waitKey(1) & 0xFF == 27:  # ESC key
-        break
-
-cap.release()
-cv2.destroyAllWindows()
-
-# === Final Metrics ===
-duration = int(time.time() - start_time)
-static_ratio = static_frames / total_frames if total_frames > 0 else 0.0
-total_movement = round(total_movement, 3)
-high_activity_ratio = high_activity_frames / total_frames if total_frames > 0 else 0.0
-
-# === Update MongoDB document ===
-sessions.update_one(
-    {"session_id": SESSION_ID},
-    {"$set": {
-        "hand_tracking": {
-            "static_ratio": round(static_ratio, 3),
-            "total_movement": total_movement,
-            "high_activity_ratio": round(high_activity_ratio, 3)
+STATIC_THRESHOLD = 0.01  # summed centroid movement (normalised units) per frame
+ACTIVE_THRESHOLD = 0.1
+MAX_MATCH_DISTANCE = 0.25  # farther than this an unlabelled hand is a new hand
+
+
+def hands_to_array(multi_hand_landmarks):
+    """MediaPipe hand landmarks -> (H, 21, 3) float32 array of x, y, z."""
+    return np.array(
+        [[(p.x, p.y, p.z) for p in hand.landmark] for hand in multi_hand_landmarks],
+        dtype=np.float32,
+    ).reshape(-1, 21, 3)
+
+
+def handedness_labels(multi_handedness):
+    return [h.classification[0].label for h in multi_handedness or ()]
+
+
+class HandMetrics:
+    """Hand movement and activity with a stable identity per hand.
+
+    Hands are matched to the previous frame by handedness label first and
+    nearest centroid second, so a hand dropping out or MediaPipe reordering
+    its output no longer pairs the wrong hands. A frame's movement is the
+    summed L1 centroid displacement of the hands matched in it; frames where
+    no hand could be matched are not classified as static or active.
+
+    ``update`` takes one (H, 21, 3) array; ``update_batch`` a (T, H, 21, 3)
+    array with NaN for absent hands. ``series`` returns per-hand time series.
+    """
+
+    def __init__(
+        self,
+        static_threshold=STATIC_THRESHOLD,
+        active_threshold=ACTIVE_THRESHOLD,
+        max_match_distance=MAX_MATCH_DISTANCE,
+    ):
+        self.static_threshold = static_threshold
+        self.active_threshold = active_threshold
+        self.max_match_distance = max_match_distance
+        self.total_frames = 0
+        self.static_frames = 0
+        self.high_activity_frames = 0
+        self.total_movement = 0.0
+
+        self._last = {}  # hand id -> last centroid
+        self._series = {}  # hand id -> list of (t, x, y, movement)
+        self._new_ids = 0
+
+    def _new_id(self, label):
+        if label and label not in self._last:
+            return label
+        self._new_ids += 1
+        return f"{label or 'Hand'}-{self._new_ids}"
+
+    def match(self, centroids, labels=None):
+        """Assign a hand id to each (x, y) centroid; returns (ids, movements)."""
+        labels = list(labels) if labels is not None else [None] * len(centroids)
+        ids = [None] * len(centroids)
+        free = dict(self._last)
+
+        # Handedness first: a label seen once this frame keeps its track
+        for i, label in enumerate(labels):
+            if label in free and labels.count(label) == 1:
+                ids[i] = label
+                del free[label]
+
+        # Then nearest remaining track, closest pairs first
+        rest = [i for i in range(len(centroids)) if ids[i] is None]
+        if rest and free:
+            names = list(free)
+            dist = np.abs(
+                centroids[rest, np.newaxis] - np.array([free[n] for n in names])
+            ).sum(axis=2)
+            for flat in np.argsort(dist, axis=None):
+                r, c = divmod(int(flat), len(names))
+                i, name = rest[r], names[c]
+                if dist[r, c] > self.max_match_distance:
+                    break
+                if ids[i] is None and name in free:
+                    ids[i] = name
+                    del free[name]
+
+        movements = np.zeros(len(centroids))
+        for i, hand_id in enumerate(ids):
+            if hand_id is None:
+                ids[i] = hand_id = self._new_id(labels[i])
+                movements[i] = np.nan
+            else:
+                movements[i] = np.abs(centroids[i] - self._last[hand_id]).sum()
+            self._last[hand_id] = centroids[i]
+        return ids, movements
+
+    def update(self, landmarks, labels=None, t=None):
+        """Add one frame; returns its summed movement (None if nothing was matched)."""
+        if landmarks is None or not len(landmarks):
+            landmarks = np.empty((0, 21, 3), dtype=np.float32)
+        movement = self.update_batch(
+            landmarks[np.newaxis],
+            None if labels is None else [labels],
+            None if t is None else [t],
+        )[0]
+        return None if np.isnan(movement) else float(movement)
+
+    def update_batch(self, landmarks, labels=None, times=None):
+        """Add T frames; returns the (T,) per-frame movement, NaN where unmatched."""
+        landmarks = np.asarray(landmarks, dtype=np.float32)
+        first = self.total_frames
+        self.total_frames += len(landmarks)
+        if times is None:
+            times = np.arange(first, self.total_frames)
+
+        # Centroids for every hand of every frame in one pass
+        centroids = landmarks[..., :2].mean(axis=2, dtype=np.float64)
+        present = ~np.isnan(centroids[..., 0])
+
+        frame_movement = np.full(len(landmarks), np.nan)
+        for f in range(len(landmarks)):
+            hands = np.flatnonzero(present[f])
+            if not len(hands):
+                continue
+            frame_labels = None if labels is None else [labels[f][h] for h in hands]
+            ids, movements = self.match(centroids[f, hands], frame_labels)
+            for hand_id, (x, y), m in zip(ids, centroids[f, hands], movements):
+                self._series.setdefault(hand_id, []).append((times[f], x, y, m))
+            if not np.isnan(movements).all():
+                frame_movement[f] = np.nansum(movements)
+
+        matched = frame_movement[~np.isnan(frame_movement)]
+        self.total_movement += float(matched.sum())
+        self.static_frames += int(np.count_nonzero(matched < self.static_threshold))
+        self.high_activity_frames += int(
+            np.count_nonzero(matched > self.active_threshold)
+        )
+        return frame_movement
+
+    def series(self):
+        """{hand id: {"t", "x", "y", "movement"}} arrays; movement is NaN on first sight."""
+        out = {}
+        for hand_id, rows in self._series.items():
+            t, x, y, m = (np.array(col) for col in zip(*rows))
+            out[hand_id] = {"t": t, "x": x, "y": y, "movement": m}
+        return out
+
+    def state(self):
+        """Raw counters; states from several segments can be summed key by key."""
+        return {
+            "frames": self.total_frames,
+            "static_frames": self.static_frames,
+            "high_activity_frames": self.high_activity_frames,
+            "total_movement": self.total_movement,
+        }
+
+    def summary(self):
+        n = self.total_frames or 1
+        return {
+            "static_ratio": round(self.static_frames / n, 3),
+            "total_movement": round(self.total_movement, 3),
+            "high_activity_ratio": round(self.high_activity_frames / n, 3),
         }
-    }}
-)
 
-print(f" Hand tracking data added to MongoDB (session_id: {SESSION_ID})")
+
+def main():
+    from session_store import get_writer
+
+    # === Set session ID (must match the one used by FullBodyTracker) ===
+    session_id = os.getenv("SESSION_ID")  # Recommended: pass this from SessionManager
+
+    # === Shared, batched MongoDB writer, only when a session is active ===
+    writer = get_writer(name="hand_tracker") if session_id else None
+
+    hands = mp_hands.Hands()
+    cap = cv2.VideoCapture(0)
+    metrics = HandMetrics()
+    start_time = time.time()
+    last_sample_time = start_time
+
+    print("Hand Tracking started... Press ESC to stop.")
+
+    while cap.isOpened():
+        with timer("decode"):
+            success, frame = cap.read()
+        if not success:
+            break
+
+        with timer("color_convert"):
+            frame = cv2.flip(frame, 1)
+            rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        with timer("hands.model"):
+            results = hands.process(rgb)
+        now = time.time()
+
+        if results.multi_hand_landmarks:
+            with timer("draw"):
+                for hand_landmarks in results.multi_hand_landmarks:
+                    mp_drawing.draw_landmarks(frame, hand_landmarks, mp_hands.HAND_CONNECTIONS)
+            with timer("hands.metrics"):
+                metrics.update(
+                    hands_to_array(results.multi_hand_landmarks),
+                    handedness_labels(results.multi_handedness),
+                    t=now - start_time,
+                )
+        else:
+            metrics.update(None)
+
+        # === Stream a per-second sample ===
+        if writer and now - last_sample_time >= 1.0:
+            with timer("log"):
+                writer.append(session_id, "hand_tracking", {
+                    "t": round(now - start_time, 3),
+                    "hands": len(results.multi_hand_landmarks or ()),
+                    **metrics.summary(),
+                })
+            last_sample_time = now
+
+        with timer("display"):
+            cv2.imshow("PresenceAI - Hand Tracking", frame)
+            key = cv2.waitKey(1)
+
+        if key & 0xFF == 27:  # ESC key
+            break
+
+    cap.release()
+    cv2.destroyAllWindows()
+
+    # === Update MongoDB document ===
+    if writer:
+        writer.set(session_id, {"hand_tracking": metrics.summary()})
+        writer.close()
+        print(f" Hand tracking data added to MongoDB (session_id: {session_id})")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,36 +1,128 @@
 
 import json
 import os
+import re
+import sqlite3
+from contextlib import closing
 from datetime import datetime
 
-LOG_PATH = "session_log.json"
+# Sessions live in an embedded SQLite store indexed by session_id. Updates are
+# single json_set statements, so trackers writing different keys of the same
+# session at the same time no longer overwrite each other.
+DB_PATH = "session_log.db"
+LOG_PATH = "session_log.json"  # legacy flat file, imported once if present
 
-def load_log():
+# Keys are spliced into JSON paths, so only plain identifiers are accepted
+_KEY = re.compile(r"[A-Za-z0-9_]+")
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS sessions (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    session_id TEXT,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sessions_session_id ON sessions (session_id);
+"""
+
+
+def _connect():
+    fresh = not os.path.exists(DB_PATH)
+    conn = sqlite3.connect(DB_PATH, timeout=30, isolation_level=None)
+    conn.execute("PRAGMA journal_mode=WAL")
+    conn.executescript(_SCHEMA)
+    if fresh:
+        _import_legacy_log(conn)
+    return conn
+
+
+def _import_legacy_log(conn):
     if not os.path.exists(LOG_PATH):
-        return []
-    with open(LOG_PATH, "r") as f:
-        return json.load(f)
+        return
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        if conn.execute("SELECT 1 FROM sessions LIMIT 1").fetchone() is None:
+            with open(LOG_PATH, "r") as f:
+                _insert_many(conn, json.load(f))
+        conn.execute("COMMIT")
+    except BaseException:
+        conn.execute("ROLLBACK")
+        raise
+
+
+def _insert_many(conn, entries):
+    conn.executemany(
+        "INSERT INTO sessions (session_id, data) VALUES (?, ?)",
+        [(entry.get("session_id"), json.dumps(entry)) for entry in entries],
+    )
+
+
+def load_log():
+    with closing(_connect()) as conn:
+        rows = conn.execute("SELECT data FROM sessions ORDER BY id").fetchall()
+    return [json.loads(data) for (data,) in rows]
+
 
 def save_log(data):
-    with open(LOG_PATH, "w") as f:
-        json.dump(data, f, indent=2)
+    with closing(_connect()) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            conn.execute("DELETE FROM sessions")
+            _insert_many(conn, data)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+
+def get_session(session_id):
+    with closing(_connect()) as conn:
+        row = conn.execute(
+            "SELECT data FROM sessions WHERE session_id = ? ORDER BY id LIMIT 1",
+            (session_id,),
+        ).fetchone()
+    return json.loads(row[0]) if row else None
+
 
 def insert_session(entry):
-    log = load_log()
-    log.append(entry)
-    save_log(log)
+    with closing(_connect()) as conn:
+        _insert_many(conn, [entry])
 
-def update_session(session_id, new_data):
-    log = load_log()
-    for entry in log:
-        if entry.get("session_id") == session_id:
-            entry.update(new_data)
-            break
-    else:
-        print(f" session_id {session_id} not found, creating new.")
-        new_entry = {"session_id": session_id}
-        new_entry.update(new_data)
-        log.append(new_entry)
-    save_log(log)
 
+def update_session(session_id, new_data):
+    if not new_data:
+        return
+    # session_id is also the indexed column, so it cannot change through json_set
+    if new_data.get("session_id", session_id) != session_id:
+        raise ValueError(
+            f"update_session cannot change session_id {session_id!r} to {new_data['session_id']!r}"
+        )
+    new_data = {key: value for key, value in new_data.items() if key != "session_id"}
+    if not new_data:
+        return
+    bad = [key for key in new_data if not isinstance(key, str) or not _KEY.fullmatch(key)]
+    if bad:
+        raise ValueError(f"update_session keys must match [A-Za-z0-9_]+, got {bad!r}")
+    # Top-level keys are replaced, like dict.update on the stored entry
+    paths = ", ".join("?, json(?)" for _ in new_data)
+    params = []
+    for key, value in new_data.items():
+        params += ['$.{}'.format(key), json.dumps(value)]
 
+    with closing(_connect()) as conn:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            updated = conn.execute(
+                f"UPDATE sessions SET data = json_set(data, {paths}) "
+                "WHERE id = (SELECT id FROM sessions WHERE session_id = ? "
+                "ORDER BY id LIMIT 1)",
+                params + [session_id],
+            ).rowcount
+            if not updated:
+                print(f" session_id {session_id} not found, creating new.")
+                new_entry = {"session_id": session_id}
+                new_entry.update(new_data)
+                _insert_many(conn, [new_entry])
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
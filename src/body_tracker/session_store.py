@@ -0,0 +1,192 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+
+from bson import json_util
+from pymongo import MongoClient, UpdateOne
+from pymongo.errors import BulkWriteError, PyMongoError
+
+# Every tracker in a process shares one pooled MongoClient and one SessionWriter.
+# Writes are buffered and sent as a single bulk_write per flush; each batch is
+# appended to a local write-ahead log first and only dropped from it once Mongo
+# has acknowledged it, so a lost connection delays metrics instead of losing them.
+MONGO_URI = os.getenv("MONGO_URI")
+DB_NAME = "presenceAI"
+COLLECTION = "sessions"
+WAL_DIR = os.getenv("PRESENCEAI_WAL_DIR", ".presenceai_wal")
+
+_client = None
+_writer = None
+_lock = threading.Lock()
+
+
+def get_client(uri=None):
+    global _client
+    with _lock:
+        if _client is None:
+            _client = MongoClient(
+                uri or MONGO_URI,
+                maxPoolSize=20,
+                serverSelectionTimeoutMS=5000,
+                connect=False,
+            )
+        return _client
+
+
+def set_client(client):
+    """Use ``client`` (e.g. ``mongomock.MongoClient()``) instead of a real connection."""
+    global _client
+    with _lock:
+        _client = client
+
+
+def get_sessions(client=None):
+    return (client or get_client())[DB_NAME][COLLECTION]
+
+
+class SessionWriter:
+    """Buffers session updates and streams them to Mongo in batches.
+
+    ``set`` replaces top-level (or dotted) fields of a session document and
+    ``append`` adds one sample to the ``timeseries.<series>`` array. Records
+    for the same session are folded into one upserting ``UpdateOne`` per flush.
+    """
+
+    def __init__(
+        self,
+        collection=None,
+        name="default",
+        wal_dir=WAL_DIR,
+        flush_rows=500,
+        flush_seconds=2.0,
+    ):
+        self._collection = collection
+        self.flush_rows = flush_rows
+        self.flush_seconds = flush_seconds
+        self.wal_path = os.path.join(wal_dir, f"{name}.jsonl") if wal_dir else None
+
+        self._pending = []
+        self._unsent = self._read_wal()
+        self._lock = threading.Lock()
+        self._flush_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = False
+        self._flusher = threading.Thread(target=self._flush_loop, daemon=True)
+        self._flusher.start()
+
+    @property
+    def collection(self):
+        if self._collection is None:
+            self._collection = get_sessions()
+        return self._collection
+
+    def set(self, session_id, fields):
+        self._add({"session_id": session_id, "set": fields})
+
+    def append(self, session_id, series, sample):
+        self._add({"session_id": session_id, "series": series, "sample": sample})
+
+    def _add(self, record):
+        with self._lock:
+            self._pending.append(record)
+            full = len(self._pending) >= self.flush_rows
+        if full:
+            self._wake.set()
+
+    def _flush_loop(self):
+        while not self._closed:
+            self._wake.wait(self.flush_seconds)
+            self._wake.clear()
+            self.flush()
+
+    def flush(self):
+        """Send everything buffered so far; returns False if Mongo was unreachable."""
+        with self._flush_lock:
+            with self._lock:
+                records, self._pending = self._pending, []
+            self._write_wal(records)
+            records = self._unsent + records
+            if not records:
+                return True
+
+            try:
+                self.collection.bulk_write(self._operations(records), ordered=False)
+            except BulkWriteError as e:
+                # Rejected by the server; retrying the same batch would fail again
+                print(f" Dropped {len(e.details.get('writeErrors', []))} session writes: {e}")
+            except PyMongoError as e:
+                print(f" Session writes kept in {self.wal_path} until Mongo is back: {e}")
+                self._unsent = records
+                return False
+
+            self._unsent = []
+            self._clear_wal()
+            return True
+
+    @staticmethod
+    def _operations(records):
+        updates = OrderedDict()
+        for record in records:
+            update = updates.setdefault(record["session_id"], ({}, {}))
+            if "set" in record:
+                update[0].update(record["set"])
+            else:
+                update[1].setdefault(f"timeseries.{record['series']}", []).append(record["sample"])
+
+        operations = []
+        for session_id, (fields, series) in updates.items():
+            update = {}
+            if fields:
+                update["$set"] = fields
+            if series:
+                update["$push"] = {key: {"$each": samples} for key, samples in series.items()}
+            operations.append(UpdateOne({"session_id": session_id}, update, upsert=True))
+        return operations
+
+    # === Write-ahead log ===
+    def _read_wal(self):
+        if not self.wal_path or not os.path.exists(self.wal_path):
+            return []
+        with open(self.wal_path, "r") as f:
+            return [json_util.loads(line) for line in f if line.strip()]
+
+    def _write_wal(self, records):
+        if not self.wal_path or not records:
+            return
+        os.makedirs(os.path.dirname(self.wal_path) or ".", exist_ok=True)
+        with open(self.wal_path, "a") as f:
+            f.writelines(json_util.dumps(record) + "\n" for record in records)
+            f.flush()
+            os.fsync(f.fileno())
+
+    def _clear_wal(self):
+        if self.wal_path and os.path.exists(self.wal_path):
+            os.remove(self.wal_path)
+
+    def close(self, timeout=10.0):
+        """Stop the flusher and keep retrying the remaining writes for up to ``timeout`` s."""
+        if self._closed:
+            return
+        self._closed = True
+        self._wake.set()
+        self._flusher.join()
+
+        deadline = time.monotonic() + timeout
+        while not self.flush() and time.monotonic() < deadline:
+            time.sleep(1.0)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def get_writer(**kwargs):
+    """Process-wide writer shared by every tracker."""
+    global _writer
+    with _lock:
+        if _writer is None:
+            _writer = SessionWriter(**kwargs)
+        return _writer
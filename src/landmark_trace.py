@@ -0,0 +1,243 @@
+"""-------------------------------------------------------
+PresenceAI: Landmark trace recording and replay
+-------------------------------------------------------
+Uses:    NumPy
+-------------------------------------------------------
+
+A trace is a directory of raw little-endian arrays plus ``meta.json``:
+
+    timestamps.bin   (T,)            float64  seconds
+    pose.bin         (T, 33, 4)      dtype    normalised x, y, z, visibility
+    hands.bin        (T, 2, 21, 3)   dtype    normalised x, y, z
+    hand_labels.bin  (T, 2)          int8     0 Left, 1 Right, -1 unknown
+    face_index.bin   (F,)            int64    row in timestamps of each face
+    face.bin         (F, N, 2)       dtype    pixel-space FaceMesh points
+
+``dtype`` is float32 (replays bit-exact) or float16 (half the size). Missing
+poses and hands are NaN rows. Rows are appended while the run goes, and the
+reader memory-maps the files and derives T and F from their sizes, so a trace
+cut short by a crash is still readable.
+
+Replaying feeds the stored landmarks to FrameAnalyzer, BodyMetrics and
+HandMetrics with new thresholds, without decoding video or running models:
+
+    python landmark_trace.py session.trace --ear-threshold 0.18
+"""
+
+import argparse
+import json
+import os
+import time
+
+import numpy as np
+
+from FacialRecognition.inference import (
+    FrameAnalyzer,
+    empty_face_state,
+    face_state,
+    update_face_state,
+)
+from body_tracker.FullBodyTracker import BodyMetrics
+from body_tracker.HandTracker import HandMetrics
+
+TRACE_VERSION = 1
+MAX_HANDS = 2
+HAND_LABELS = ("Left", "Right")
+
+_STREAMS = {
+    # name: (row shape, dtype; None = the trace's landmark dtype)
+    "timestamps": ((), np.float64),
+    "pose": ((33, 4), None),
+    "hands": ((MAX_HANDS, 21, 3), None),
+    "hand_labels": ((MAX_HANDS,), np.int8),
+    "face_index": ((), np.int64),
+    "face": (None, None),  # (N, 2); N fixed by the first face
+}
+
+
+class TraceRecorder:
+    """Append landmarks to a trace directory while a run is in progress.
+
+    Call ``add_frame`` once per frame (in order) and ``add_face`` for every
+    frame that got face points; faces may arrive late, e.g. from a strided
+    FaceTracker, as long as they come in frame order.
+    """
+
+    def __init__(self, path, fps=None, frame_shape=None, dtype=np.float32):
+        self.path = path
+        self.fps = fps
+        self.frame_shape = frame_shape
+        self.dtype = np.dtype(dtype)
+        self.frames = 0
+        self.faces = 0
+        self.face_points = None
+        self._rows = {}  # frame index -> trace row
+
+        os.makedirs(path, exist_ok=True)
+        self._files = {
+            name: open(os.path.join(path, f"{name}.bin"), "wb") for name in _STREAMS
+        }
+        self._nan_pose = np.full((33, 4), np.nan, dtype=self.dtype)
+
+    def _write(self, name, array, dtype=None):
+        self._files[name].write(np.asarray(array, dtype=dtype or self.dtype).tobytes())
+
+    def add_frame(
+        self,
+        index,
+        timestamp,
+        pose=None,
+        hands=None,
+        hand_labels=None,
+        frame_shape=None,
+    ):
+        """Record one frame; ``pose`` is (33, 4) and ``hands`` (H, 21, 3), or None."""
+        if self.frame_shape is None and frame_shape is not None:
+            self.frame_shape = tuple(frame_shape[:2])
+        self._rows[index] = self.frames
+        self.frames += 1
+        self._write("timestamps", timestamp, np.float64)
+        self._write("pose", self._nan_pose if pose is None else pose)
+
+        padded = np.full((MAX_HANDS, 21, 3), np.nan, dtype=self.dtype)
+        codes = np.full(MAX_HANDS, -1, dtype=np.int8)
+        if hands is not None:
+            hands = hands[:MAX_HANDS]
+            padded[: len(hands)] = hands
+            for i, label in enumerate((hand_labels or [])[:MAX_HANDS]):
+                codes[i] = HAND_LABELS.index(label) if label in HAND_LABELS else -1
+        self._write("hands", padded)
+        self._write("hand_labels", codes, np.int8)
+
+    def add_face(self, index, points):
+        """Record the (N, 2) face points of an already added frame."""
+        if self.face_points is None:
+            self.face_points = len(points)
+        self._write("face_index", self._rows.pop(index), np.int64)
+        self._write("face", points)
+        self.faces += 1
+        # Rows of older frames can no longer get a face
+        for old in [i for i in self._rows if i < index]:
+            del self._rows[old]
+
+    def close(self):
+        for f in self._files.values():
+            f.close()
+        meta = {
+            "version": TRACE_VERSION,
+            "fps": self.fps,
+            "frame_shape": list(self.frame_shape) if self.frame_shape else None,
+            "dtype": self.dtype.name,
+            "frames": self.frames,
+            "faces": self.faces,
+            "face_points": self.face_points,
+        }
+        with open(os.path.join(self.path, "meta.json"), "w") as f:
+            json.dump(meta, f, indent=2)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class LandmarkTrace:
+    """Read-only, memory-mapped view of a trace directory."""
+
+    def __init__(self, path):
+        self.path = path
+        meta_path = os.path.join(path, "meta.json")
+        meta = {}
+        if os.path.exists(meta_path):
+            with open(meta_path) as f:
+                meta = json.load(f)
+        self.fps = meta.get("fps") or 30.0
+        self.frame_shape = tuple(meta.get("frame_shape") or (480, 640))
+        self.dtype = np.dtype(meta.get("dtype", "float32"))
+        face_points = meta.get("face_points") or 478
+
+        for name, (shape, dtype) in _STREAMS.items():
+            shape = (face_points, 2) if name == "face" else shape
+            setattr(self, name, self._map(name, shape, np.dtype(dtype or self.dtype)))
+
+        # A crash can leave the streams one row apart; trust the shortest
+        self.frames = min(len(self.timestamps), len(self.pose), len(self.hands))
+        self.faces = min(len(self.face_index), len(self.face))
+
+    def _map(self, name, shape, dtype):
+        file = os.path.join(self.path, f"{name}.bin")
+        row_bytes = dtype.itemsize * int(np.prod(shape))
+        rows = os.path.getsize(file) // row_bytes if os.path.exists(file) else 0
+        if rows == 0:
+            return np.empty((0,) + shape, dtype=dtype)
+        return np.memmap(file, dtype=dtype, mode="r", shape=(rows,) + shape)
+
+
+def replay(trace, face=None, body=None, hands=None):
+    """Re-score a trace; returns a MultiModalAnalyzer-style state.
+
+    ``face``, ``body`` and ``hands`` are keyword arguments for FrameAnalyzer,
+    BodyMetrics and HandMetrics (e.g. ``face={"ear_threshold": 0.18}``).
+    """
+    if isinstance(trace, str):
+        trace = LandmarkTrace(trace)
+    n, f = trace.frames, trace.faces
+
+    analyzer = FrameAnalyzer(**(face or {}))
+    state = empty_face_state()
+    face_points = np.asarray(trace.face[:f], dtype=np.float32)
+    for points in face_points:
+        update_face_state(state, analyzer, points)
+
+    body_metrics = BodyMetrics(**{"frame_shape": trace.frame_shape, **(body or {})})
+    body_metrics.update_batch(trace.pose[:n])
+
+    hand_metrics = HandMetrics(**(hands or {}))
+    codes = np.asarray(trace.hand_labels[:n])
+    labels = [[HAND_LABELS[c] if c >= 0 else None for c in row] for row in codes]
+    hand_metrics.update_batch(trace.hands[:n], labels, trace.timestamps[:n])
+
+    return {
+        "face": face_state(state, analyzer),
+        "body": body_metrics.state(),
+        "hands": hand_metrics.state(),
+    }
+
+
+def main():
+    from multimodal import summarize_states
+
+    parser = argparse.ArgumentParser(description="Re-score recorded landmark traces")
+    parser.add_argument("traces", nargs="+", help="Trace directories (one per segment)")
+    parser.add_argument("--ear-threshold", type=float, default=0.2)
+    parser.add_argument("--head-tilt-threshold", type=float, default=15)
+    parser.add_argument("--body-static-threshold", type=float, default=5.0)
+    parser.add_argument("--hand-static-threshold", type=float, default=0.01)
+    parser.add_argument("--hand-active-threshold", type=float, default=0.1)
+    args = parser.parse_args()
+
+    start = time.perf_counter()
+    traces = [LandmarkTrace(path) for path in args.traces]
+    states = [
+        replay(
+            trace,
+            face={
+                "ear_threshold": args.ear_threshold,
+                "head_tilt_threshold_deg": args.head_tilt_threshold,
+            },
+            body={"static_threshold": args.body_static_threshold},
+            hands={
+                "static_threshold": args.hand_static_threshold,
+                "active_threshold": args.hand_active_threshold,
+            },
+        )
+        for trace in traces
+    ]
+    summary = summarize_states(states, traces[0].fps)
+    summary["replay_ms"] = round((time.perf_counter() - start) * 1000, 1)
+    print(json.dumps(summary, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -10,48 +10,175 @@ __updated__ = Sat Jun 21 2025
 """
 
 from FacialRecognition.preprocessing import resize_frame
-from FacialRecognition.input import get_video_capture
+from FacialRecognition.input import get_video_capture, FrameSource
 from FacialRecognition.feature_extraction import Detector
 from FacialRecognition.feature_extraction import extract_features
 from FacialRecognition.output import draw_face_landmarks
 from FacialRecognition.output import write_results_to_frame
 from FacialRecognition.inference import FrameAnalyzer
-from FacialRecognition.Logger import CSVLogger
+from FacialRecognition.Logger import make_logger, SessionLogger
+from FacialRecognition.pipeline import StagedPipeline, DROP, BLOCK
+from FacialRecognition.tracking import FaceTracker
+from landmark_trace import TraceRecorder
+from profiling import enable, profiler, timer
+import argparse
+import os
 import cv2 as cv
 
 
-def main(cap):
-    detector = Detector()
+def main(
+    cap,
+    policy=DROP,
+    redetect_interval=30,
+    log_file="emotions_log.csv",
+    log_interval=1.0,
+    session_id=None,
+    trace_path=None,
+    profile_path=None,
+    stride=1,
+):
+    if profile_path:
+        enable()
+    tracker = FaceTracker(
+        Detector(), redetect_interval=redetect_interval, stride=stride
+    )
     analyzer = FrameAnalyzer()
-    logger = CSVLogger()
+    loggers = [make_logger(log_file, interval=log_interval)]
+    if session_id:
+        from body_tracker.session_store import get_writer
 
-    while cap.isOpened():
-        success, frame = cap.read()
-        if not success:
-            print("Frame capture failed.")
-            continue
+        writer = get_writer(name="facial")
+        loggers.append(SessionLogger(writer, session_id, interval=log_interval))
+    recorder = (
+        TraceRecorder(trace_path, cap.get(cv.CAP_PROP_FPS)) if trace_path else None
+    )
 
-        face = detector.detect_face(frame)
+    shown = [None, None]  # box and landmarks of the latest keyframe, for drawing
 
-        if face is not None:
-            results = detector.process_face(face)
+    def add_face(tracked):
+        if tracked.points is None:
+            return
+        with timer("face.features"):
+            analyzer.analyze_points(tracked.points)
+        if recorder is not None:
+            recorder.add_face(tracked.frame.index, tracked.points)
 
-            if results.multi_face_landmarks:
-                for face_landmarks in results.multi_face_landmarks:
-                    draw_face_landmarks(face, face_landmarks)
-                    analyzer.analyze_frame(face_landmarks, face.shape)
-                    frame = resize_frame(face, 1000, 1000)
-                    frame = write_results_to_frame(cv.flip(frame, 1), analyzer.results)
-                    logger.log_results(analyzer.results)
-        cv.imshow("FaceMesh Feed", frame)
+    def infer(captured):
+        # Runs on the inference thread; only this thread touches the analyzer
+        if recorder is not None:
+            recorder.add_frame(
+                captured.index, captured.timestamp, frame_shape=captured.rgb.shape
+            )
+        # With stride > 1 this releases the frames up to the latest keyframe
+        for tracked in tracker.process(captured):
+            add_face(tracked)
+            if tracked.frame is captured:
+                shown[:] = tracked.box, tracked.landmarks
+        face_box, face_landmarks = shown
+        if face_box is None:
+            return None
+        return captured.bgr[face_box], face_landmarks, analyzer.results
 
-        if cv.waitKey(1) & 0xFF == ord("q"):
-            break
+    def render(item):
+        frame = item.frame.bgr
+        if item.result is not None:
+            face, face_landmarks, metrics = item.result
+            with timer("draw"):
+                draw_face_landmarks(face, face_landmarks)
+                frame = resize_frame(face, 1000, 1000)
+                overlay = {
+                    **metrics,
+                    "Latency (ms)": round(pipeline.last_latency * 1000),
+                }
+                frame = write_results_to_frame(cv.flip(frame, 1), overlay)
+            with timer("log"):
+                for logger in loggers:
+                    logger.log_results(metrics)
+        with timer("display"):
+            cv.imshow("FaceMesh Feed", frame)
+            key = cv.waitKey(1)
+
+        return not (key & 0xFF == ord("q"))
+
+    pipeline = StagedPipeline(FrameSource(cap=cap), infer, policy=policy)
+    pipeline.run(render)  # returns once the capture and inference threads exited
+    for tracked in tracker.flush():
+        add_face(tracked)
+    print("Latency:", pipeline.latency_stats())
+    if profile_path:
+        profiler.export(profile_path)
+        print(f"Stage profile written to {profile_path}")
+    for logger in loggers:
+        logger.close()
+    if session_id:
+        writer.close()
+    if recorder is not None:
+        recorder.close()
 
     cap.release()
     cv.destroyAllWindows()
 
 
 if __name__ == "__main__":
-    cap = get_video_capture(0)
-    main(cap)
+    parser = argparse.ArgumentParser(description="Live facial expression feedback")
+    parser.add_argument("--source", default="0", help="Webcam index or video path")
+    parser.add_argument(
+        "--policy",
+        choices=[DROP, BLOCK],
+        default=None,
+        help="Queue policy: drop stale frames (live) or block (offline)",
+    )
+    parser.add_argument(
+        "--redetect-interval",
+        type=int,
+        default=30,
+        help="Frames between full-frame face detections (0 = every frame)",
+    )
+    parser.add_argument(
+        "--log-file",
+        default="emotions_log.csv",
+        help="Metrics log; a .npz extension writes the columnar format",
+    )
+    parser.add_argument(
+        "--log-interval",
+        type=float,
+        default=1.0,
+        help="Seconds between logged rows (0 = every frame)",
+    )
+    parser.add_argument(
+        "--session-id",
+        default=os.getenv("SESSION_ID"),
+        help="Also stream metrics into this MongoDB session (default: $SESSION_ID)",
+    )
+    parser.add_argument(
+        "--record-trace",
+        default=None,
+        help="Save the face landmarks to this trace directory for landmark_trace.py",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Time every stage and write p50/p95/p99 here (.json, or .prom for Prometheus)",
+    )
+    parser.add_argument(
+        "--stride",
+        type=int,
+        default=1,
+        help="Run FaceMesh every N frames and interpolate landmarks in between",
+    )
+    args = parser.parse_args()
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    policy = args.policy or (DROP if isinstance(source, int) else BLOCK)
+    cap = get_video_capture(source)
+    main(
+        cap,
+        policy,
+        args.redetect_interval,
+        args.log_file,
+        args.log_interval,
+        args.session_id,
+        args.record_trace,
+        args.profile,
+        args.stride,
+    )
@@ -0,0 +1,306 @@
+"""-------------------------------------------------------
+PresenceAI: Face, pose and hand analysis on one shared frame
+-------------------------------------------------------
+Uses:    OpenCV, MediaPipe
+-------------------------------------------------------
+
+Every frame is decoded and converted to RGB once by FrameSource; the same
+read-only RGB buffer is then handed to FaceDetection, FaceMesh, Pose and
+Hands, so all three modalities can run off a single webcam.
+
+    python multimodal.py            # live webcam, press q to stop
+"""
+
+import argparse
+import json
+from collections import Counter
+from typing import NamedTuple, Optional
+
+import cv2 as cv
+import mediapipe as mp
+
+from FacialRecognition.inference import (
+    FrameAnalyzer,
+    empty_face_state,
+    face_state,
+    update_face_state,
+)
+from FacialRecognition.input import FrameSource
+from FacialRecognition.output import draw_face_landmarks, write_results_to_frame
+from FacialRecognition.preprocessing import flip_image
+from FacialRecognition.tracking import FaceTracker
+from body_tracker.FullBodyTracker import BodyMetrics, landmarks_to_array
+from body_tracker.HandTracker import HandMetrics, hands_to_array, handedness_labels
+from landmark_trace import TraceRecorder
+from profiling import enable, profiler, timer
+
+mp_drawing = mp.solutions.drawing_utils
+mp_pose = mp.solutions.pose
+mp_hands = mp.solutions.hands
+
+
+class FrameResults(NamedTuple):
+    face_box: Optional[tuple]
+    face_landmarks: Optional[object]
+    pose_landmarks: Optional[object]
+    hand_landmarks: Optional[list]
+
+
+class MultiModalAnalyzer:
+    """Face, pose and hand metrics over a stream of Frames.
+
+    Pass a ``landmark_trace.TraceRecorder`` as ``recorder`` to save every
+    landmark for re-scoring later without running the models again.
+    """
+
+    def __init__(
+        self,
+        face=True,
+        pose=True,
+        hands=True,
+        redetect_interval=30,
+        face_stride=1,
+        recorder=None,
+    ):
+        self.face_tracker = (
+            FaceTracker(redetect_interval=redetect_interval, stride=face_stride)
+            if face
+            else None
+        )
+        self.analyzer = FrameAnalyzer() if face else None
+        self.pose = (
+            mp_pose.Pose(min_detection_confidence=0.5, min_tracking_confidence=0.5)
+            if pose
+            else None
+        )
+        self.hands = mp_hands.Hands() if hands else None
+
+        self.face_state = empty_face_state()
+        self.body = BodyMetrics()
+        self.hand_metrics = HandMetrics()
+        self.recorder = recorder
+
+    def process(self, frame):
+        """Run every enabled model on ``frame.rgb`` and update the counters."""
+        face_box = face_landmarks = pose_landmarks = hand_landmarks = None
+        pose = hands = labels = None
+
+        if self.pose is not None:
+            with timer("pose.model"):
+                pose_landmarks = self.pose.process(frame.rgb).pose_landmarks
+            with timer("pose.metrics"):
+                pose = landmarks_to_array(pose_landmarks) if pose_landmarks else None
+                self.body.update(pose, frame.rgb.shape)
+
+        if self.hands is not None:
+            with timer("hands.model"):
+                detected = self.hands.process(frame.rgb)
+            with timer("hands.metrics"):
+                hand_landmarks = detected.multi_hand_landmarks
+                if hand_landmarks:
+                    hands = hands_to_array(hand_landmarks)
+                    labels = handedness_labels(detected.multi_handedness)
+                self.hand_metrics.update(hands, labels, t=frame.timestamp)
+
+        if self.recorder is not None:
+            with timer("trace.record"):
+                self.recorder.add_frame(
+                    frame.index, frame.timestamp, pose, hands, labels, frame.rgb.shape
+                )
+
+        # Last, so the recorder already has this frame when its face arrives
+        if self.face_tracker is not None:
+            for tracked in self.face_tracker.process(frame):
+                self._add_face(tracked)
+                if tracked.frame is frame:
+                    face_box, face_landmarks = tracked.box, tracked.landmarks
+
+        return FrameResults(face_box, face_landmarks, pose_landmarks, hand_landmarks)
+
+    @staticmethod
+    def draw(image, results):
+        """Draw every landmark set in ``results`` onto the BGR ``image``."""
+        if results.face_landmarks is not None:
+            # The crop is a view, so drawing on it draws on the full frame
+            draw_face_landmarks(image[results.face_box], results.face_landmarks)
+        if results.pose_landmarks is not None:
+            mp_drawing.draw_landmarks(
+                image, results.pose_landmarks, mp_pose.POSE_CONNECTIONS
+            )
+        for hand in results.hand_landmarks or ():
+            mp_drawing.draw_landmarks(image, hand, mp_hands.HAND_CONNECTIONS)
+        return image
+
+    def _add_face(self, tracked):
+        if tracked.points is None:
+            return
+        with timer("face.features"):
+            update_face_state(self.face_state, self.analyzer, tracked.points)
+        if self.recorder is not None:
+            self.recorder.add_face(tracked.frame.index, tracked.points)
+
+    def state(self):
+        return {
+            "face": (
+                face_state(self.face_state, self.analyzer)
+                if self.analyzer is not None
+                else self.face_state
+            ),
+            "body": self.body.state(),
+            "hands": self.hand_metrics.state(),
+        }
+
+    def close(self):
+        if self.face_tracker is not None:
+            for tracked in self.face_tracker.flush():
+                self._add_face(tracked)
+            self.face_tracker.detector.close()
+        for model in (self.pose, self.hands):
+            if model is not None:
+                model.close()
+
+
+def _merge_states(states):
+    merged = {}
+    for state in states:
+        for key, value in state.items():
+            if key in merged:
+                merged[key] = merged[key] + value
+            else:
+                merged[key] = value.copy() if isinstance(value, Counter) else value
+    return merged
+
+
+def _ratio(count, total):
+    return count / total if total else 0.0
+
+
+def summarize_states(states, fps):
+    """Combine one or more analyzer states into the session-level metrics."""
+    face = _merge_states(s["face"] for s in states)
+    body = _merge_states(s["body"] for s in states)
+    hands = _merge_states(s["hands"] for s in states)
+
+    total_frames = body.get("frames", 0)
+    duration = total_frames / fps if fps else 0.0
+    minutes = duration / 60.0
+    face_frames = face.get("frames", 0)
+    gaze_mode = face.get("gaze", Counter()).most_common(1)
+    body_frames = body.get("frames", 0)
+    hand_frames = hands.get("frames", 0)
+
+    return {
+        "fps": fps,
+        "total_frames": total_frames,
+        "duration_sec": round(duration, 2),
+        "facial_tracking": {
+            "face_frames": face_frames,
+            "blink_count": face.get("blink_count", 0),
+            "head_tilt_count": face.get("head_tilt_count", 0),
+            "blink_frequency_per_min": round(
+                _ratio(face.get("blink_count", 0), minutes), 2
+            ),
+            "head_tilt_frequency_per_min": round(
+                _ratio(face.get("head_tilt_count", 0), minutes), 2
+            ),
+            "avg_eye_openness": round(_ratio(face.get("ear_sum", 0.0), face_frames), 3),
+            "avg_mouth_openness": round(
+                _ratio(face.get("mouth_sum", 0.0), face_frames), 3
+            ),
+            "avg_head_tilt": round(
+                _ratio(face.get("abs_tilt_sum", 0.0), face_frames), 3
+            ),
+            "smile_ratio": round(_ratio(face.get("smile_frames", 0), face_frames), 3),
+            "eye_gaze": gaze_mode[0][0] if gaze_mode else "Unknown",
+        },
+        "body_tracking": {
+            "body_static_ratio": round(
+                _ratio(body.get("static_frames", 0), body_frames), 3
+            ),
+            "bounce_score": round(_ratio(body.get("bounce_sum", 0.0), body_frames), 3),
+            "sway_score": round(_ratio(body.get("sway_sum", 0.0), body_frames), 3),
+            "lean_score": round(_ratio(body.get("lean_sum", 0.0), body_frames), 3),
+            "arm_expressiveness": round(
+                _ratio(body.get("arm_expressiveness_sum", 0.0), body_frames), 3
+            ),
+            "arm_cross_ratio": round(
+                _ratio(body.get("arm_cross_frames", 0), body_frames), 3
+            ),
+        },
+        "hand_tracking": {
+            "static_ratio": round(
+                _ratio(hands.get("static_frames", 0), hand_frames), 3
+            ),
+            "total_movement": round(hands.get("total_movement", 0.0), 3),
+            "high_activity_ratio": round(
+                _ratio(hands.get("high_activity_frames", 0), hand_frames), 3
+            ),
+        },
+    }
+
+
+def main(
+    source=0, redetect_interval=30, face_stride=1, trace_path=None, profile_path=None
+):
+    if profile_path:
+        enable()
+    with FrameSource(source) as frames:
+        recorder = TraceRecorder(trace_path, frames.fps) if trace_path else None
+        analyzer = MultiModalAnalyzer(
+            redetect_interval=redetect_interval,
+            face_stride=face_stride,
+            recorder=recorder,
+        )
+
+        for frame in frames:
+            results = analyzer.process(frame)
+
+            with timer("draw"):
+                image = flip_image(analyzer.draw(frame.bgr, results))
+                if analyzer.analyzer is not None and results.face_landmarks is not None:
+                    image = write_results_to_frame(image, analyzer.analyzer.results)
+            with timer("display"):
+                cv.imshow("PresenceAI - Multimodal", image)
+                key = cv.waitKey(1)
+
+            if key & 0xFF == ord("q"):
+                break
+
+    analyzer.close()
+    if recorder is not None:
+        recorder.close()
+    cv.destroyAllWindows()
+    print(json.dumps(summarize_states([analyzer.state()], frames.fps), indent=2))
+    if profile_path:
+        profiler.export(profile_path)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Live face, pose and hand tracking")
+    parser.add_argument("--source", default="0", help="Webcam index or video path")
+    parser.add_argument(
+        "--redetect-interval",
+        type=int,
+        default=30,
+        help="Frames between full-frame face detections (0 = every frame)",
+    )
+    parser.add_argument(
+        "--stride",
+        type=int,
+        default=1,
+        help="Run FaceMesh every N frames and interpolate landmarks in between",
+    )
+    parser.add_argument(
+        "--record-trace",
+        default=None,
+        help="Save every landmark to this trace directory for landmark_trace.py",
+    )
+    parser.add_argument(
+        "--profile",
+        default=None,
+        help="Time every stage and write p50/p95/p99 here (.json, or .prom for Prometheus)",
+    )
+    args = parser.parse_args()
+
+    source = int(args.source) if args.source.isdigit() else args.source
+    main(source, args.redetect_interval, args.stride, args.record_trace, args.profile)
@@ -0,0 +1,196 @@
+"""-------------------------------------------------------
+PresenceAI: Stage profiling and timing histograms
+-------------------------------------------------------
+Uses:    NumPy
+-------------------------------------------------------
+
+Wall-time histograms per named pipeline stage (decode, colour conversion,
+each MediaPipe model, feature extraction, drawing, logging, voice stages):
+
+    from profiling import timer, timed
+
+    with timer("face.mesh"):
+        results = face_mesh.process(rgb)
+
+    @timed("voice.prosody")
+    def extract_prosody(audio): ...
+
+Profiling is off unless ``PRESENCEAI_PROFILE`` is set or ``enable()`` is
+called. While off, ``timer`` returns one shared no-op context manager and
+``timed`` functions make one attribute check, so instrumented code pays
+nanoseconds per call. ``PRESENCEAI_PROFILE=1`` prints the summary to stderr
+at exit; any other value is a path the profile is written to at exit
+(``.prom`` / ``.txt``: Prometheus text format, otherwise JSON).
+
+Every stage keeps exact count / total / max and its most recent
+``capacity`` samples, from which p50 / p95 / p99 are computed.
+"""
+
+import atexit
+import functools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import nullcontext
+
+import numpy as np
+
+PERCENTILES = (50, 95, 99)
+_NULL_TIMER = nullcontext()
+
+
+class StageHistogram:
+    """Exact totals plus a ring of the latest ``capacity`` samples (seconds)."""
+
+    def __init__(self, capacity=8192):
+        self.samples = np.zeros(capacity)
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, seconds):
+        self.samples[self.count % len(self.samples)] = seconds
+        self.count += 1
+        self.total += seconds
+        self.max = max(self.max, seconds)
+
+    def recent(self):
+        return self.samples[: min(self.count, len(self.samples))]
+
+    def summary(self):
+        p = np.percentile(self.recent(), PERCENTILES) if self.count else [0.0] * 3
+        return {
+            "count": self.count,
+            "total_sec": round(self.total, 6),
+            "mean_ms": round(self.total / (self.count or 1) * 1000, 3),
+            **{f"p{q}_ms": round(v * 1000, 3) for q, v in zip(PERCENTILES, p)},
+            "max_ms": round(self.max * 1000, 3),
+        }
+
+
+class _Timer:
+    __slots__ = ("profiler", "name", "start")
+
+    def __init__(self, profiler, name):
+        self.profiler = profiler
+        self.name = name
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.profiler.record(self.name, time.perf_counter() - self.start)
+
+
+class Profiler:
+    def __init__(self, enabled=False, capacity=8192):
+        self.enabled = enabled
+        self.capacity = capacity
+        self.stages = {}
+        self._lock = threading.Lock()
+
+    def timer(self, name):
+        """Context manager timing its block as stage ``name``."""
+        return _Timer(self, name) if self.enabled else _NULL_TIMER
+
+    def timed(self, name=None):
+        """Decorator timing every call; ``name`` defaults to the function's."""
+
+        def wrap(fn):
+            stage = name or fn.__qualname__
+
+            @functools.wraps(fn)
+            def wrapper(*args, **kwargs):
+                if not self.enabled:
+                    return fn(*args, **kwargs)
+                start = time.perf_counter()
+                try:
+                    return fn(*args, **kwargs)
+                finally:
+                    self.record(stage, time.perf_counter() - start)
+
+            return wrapper
+
+        return wrap
+
+    def record(self, name, seconds):
+        """Add a duration measured elsewhere (e.g. by a worker pool)."""
+        if not self.enabled:
+            return
+        with self._lock:
+            hist = self.stages.get(name)
+            if hist is None:
+                hist = self.stages[name] = StageHistogram(self.capacity)
+            hist.add(seconds)
+
+    def summary(self):
+        with self._lock:
+            return {name: hist.summary() for name, hist in sorted(self.stages.items())}
+
+    def to_json(self):
+        return json.dumps(self.summary(), indent=2)
+
+    def to_prometheus(self, metric="presenceai_stage_seconds"):
+        """Prometheus text exposition: one summary series per stage."""
+        lines = [
+            f"# HELP {metric} Wall time per pipeline stage.",
+            f"# TYPE {metric} summary",
+        ]
+        with self._lock:
+            for name, hist in sorted(self.stages.items()):
+                label = name.replace("\\", "\\\\").replace('"', '\\"')
+                values = np.percentile(hist.recent(), PERCENTILES)
+                for q, v in zip(PERCENTILES, values):
+                    lines.append(
+                        f'{metric}{{stage="{label}",quantile="{q / 100}"}} {v:.9f}'
+                    )
+                lines.append(f'{metric}_sum{{stage="{label}"}} {hist.total:.9f}')
+                lines.append(f'{metric}_count{{stage="{label}"}} {hist.count}')
+        return "\n".join(lines) + "\n"
+
+    def export(self, path):
+        """Write the profile to ``path``; ``.prom`` / ``.txt`` give Prometheus text."""
+        text = (
+            self.to_prometheus()
+            if os.path.splitext(path)[1] in (".prom", ".txt")
+            else self.to_json()
+        )
+        with open(path, "w") as f:
+            f.write(text)
+
+    def reset(self):
+        with self._lock:
+            self.stages.clear()
+
+
+profiler = Profiler()
+
+
+def timer(name):
+    return profiler.timer(name)
+
+
+def timed(name=None):
+    return profiler.timed(name)
+
+
+def enable(enabled=True):
+    profiler.enabled = enabled
+
+
+def _report_at_exit(target):
+    if not profiler.stages:
+        return
+    if target in ("1", "true", "yes"):
+        print(profiler.to_json(), file=sys.stderr)
+    else:
+        profiler.export(target)
+
+
+_target = os.getenv("PRESENCEAI_PROFILE", "")
+if _target:
+    enable()
+    atexit.register(_report_at_exit, _target)